@@ -0,0 +1,106 @@
+import math
+import random
+import statistics
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Spatial.haversine import haversine
+import App.logic as l
+
+ARCHIVO = "1000_cranes_mongolia_small.csv"
+
+
+def cargar_catalogo():
+    catalog = l.new_logic()
+    l.load_data(catalog, ARCHIVO, usar_snapshot=False)
+    return catalog
+
+
+def copia_grafo(grafo):
+    return {campo: list(grafo[campo]) for campo in ("keys", "offsets", "targets", "weights")}
+
+
+@handle_not_implemented
+def test_parallel_build_same_graphs():
+    catalog = cargar_catalogo()
+    serie = {nombre: copia_grafo(catalog[nombre]) for nombre in ("grafo_1", "grafo_2")}
+
+    for procesos in (2, 3):
+        l.construir_grafos(catalog, procesos)
+        for nombre, esperado in serie.items():
+            grafo = copia_grafo(catalog[nombre])
+            for campo in ("keys", "offsets", "targets"):
+                assert grafo[campo] == esperado[campo]
+            # solo cambia el orden de las sumas de los viajes de cada arco
+            for peso, peso_serie in zip(grafo["weights"], esperado["weights"]):
+                assert math.isclose(peso, peso_serie, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def viajes_por_arco(catalog):
+    # cada viaje recorrido a mano: eventos consecutivos (en tiempo) de una
+    # grulla que caen en nodos distintos
+    eventos = catalog["eventos"]
+    nodos = catalog["nodos"]["elements"]
+    ultimo = {}
+    viajes = {}
+    for i in range(eventos["size"]):
+        grulla = eventos["grulla"][i]
+        prev = ultimo.get(grulla)
+        ultimo[grulla] = i
+        if prev is None or eventos["nodo"][prev] == eventos["nodo"][i]:
+            continue
+        u, v = nodos[eventos["nodo"][prev]], nodos[eventos["nodo"][i]]
+        distancia = haversine(eventos["lat"][i], eventos["lon"][i],
+                              eventos["lat"][prev], eventos["lon"][prev])
+        valores = viajes.setdefault((u["id"], v["id"]), ([], []))
+        valores[0].append(distancia)
+        valores[1].append(v["prom_agua"])
+    return viajes
+
+
+@handle_not_implemented
+def test_edge_statistics_match_brute_force():
+    catalog = cargar_catalogo()
+    viajes = viajes_por_arco(catalog)
+
+    for procesos in (1, 2):
+        l.construir_grafos(catalog, procesos, estadisticas=True)
+        resultado = catalog["estadisticas_arcos"]
+        assert set(resultado) == set(viajes)
+        for arco, (distancias, aguas) in viajes.items():
+            fila = resultado[arco]
+            assert fila["viajes"] == len(distancias)
+            for campo, valores in (("distancia", distancias), ("agua", aguas)):
+                resumen = fila[campo]
+                assert resumen["min"] == pytest.approx(min(valores))
+                assert resumen["max"] == pytest.approx(max(valores))
+                assert resumen["promedio"] == pytest.approx(statistics.fmean(valores))
+                assert resumen["varianza"] == pytest.approx(statistics.pvariance(valores),
+                                                            rel=1e-9, abs=1e-9)
+
+    l.construir_grafos(catalog)
+    assert catalog["estadisticas_arcos"] is None
+
+
+@handle_not_implemented
+def test_merged_summaries_match_brute_force():
+    # pocos arcos del archivo pequeño tienen varios viajes: se prueba también
+    # la combinación de resúmenes (Chan) con series partidas en varios trozos
+    rng = random.Random(7)
+    valores = [rng.uniform(-50, 500) for _ in range(300)]
+    for cortes in ([150], [1, 2, 299], [10, 100, 101, 250]):
+        total = l.nuevo_resumen()
+        inicio = 0
+        for fin in cortes + [len(valores)]:
+            parte = l.nuevo_resumen()
+            for x in valores[inicio:fin]:
+                l.agregar_valor(parte, x)
+            l.fusionar_resumen(total, parte)
+            inicio = fin
+        l.fusionar_resumen(total, l.nuevo_resumen())
+
+        assert total["n"] == len(valores)
+        assert total["min"] == min(valores) and total["max"] == max(valores)
+        assert total["media"] == pytest.approx(statistics.fmean(valores))
+        assert l.varianza(total) == pytest.approx(statistics.pvariance(valores))
+    assert l.varianza(l.nuevo_resumen()) == 0.0
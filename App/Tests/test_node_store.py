@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.List import array_list as lt
+import App.logic as l
+from App import node_store as ns
+
+ARCHIVO = "1000_cranes_mongolia_small.csv"
+
+
+_catalogo = []
+
+
+def cargar_catalogo():
+    if not _catalogo:
+        catalog = l.new_logic()
+        l.load_data(catalog, ARCHIVO, usar_snapshot=False)
+        _catalogo.append(catalog)
+    return _catalogo[0]
+
+
+@handle_not_implemented
+def test_round_trip_matches_catalog():
+    nodos = cargar_catalogo()["nodos"]
+    carpeta = tempfile.TemporaryDirectory()
+    ruta = os.path.join(carpeta.name, "nodos.bin")
+    ns.save(ns.from_nodes(nodos), ruta, (123, 456))
+
+    store = ns.open_mapped(ruta)
+    try:
+        assert ns.size(store) == lt.size(nodos)
+        assert store["source"] == (123, 456)
+        for i in range(lt.size(nodos)):
+            esperado = lt.get_element(nodos, i)
+            nodo = ns.get_node(store, i)
+            for campo in ("id", "lat", "lon", "timestamp", "epoch", "prom_agua", "count"):
+                assert nodo[campo] == esperado[campo]
+            assert nodo["grullas"]["elements"] == esperado["grullas"]["elements"]
+            assert nodo["total_agua"] == pytest.approx(esperado["total_agua"])
+            assert ns.index_of(store, esperado["id"]) == i
+    finally:
+        ns.close(store)
+        carpeta.cleanup()
+
+
+@handle_not_implemented
+def test_index_of_missing_id():
+    store = ns.from_nodes(cargar_catalogo()["nodos"])
+    assert ns.index_of(store, "no-existe") == -1
+
+
+@handle_not_implemented
+def test_close_releases_views():
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "nodos.bin")
+        ns.save(ns.from_nodes(cargar_catalogo()["nodos"]), ruta)
+        store = ns.open_mapped(ruta)
+        lat = store["lat"]
+        ns.close(store)
+
+        assert store["mapped"] is None
+        with pytest.raises(ValueError):
+            lat[0]
+        # cerrar dos veces no falla
+        ns.close(store)
+
+
+@handle_not_implemented
+def test_bad_magic_and_source():
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "otro.bin")
+        with open(ruta, "wb") as f:
+            f.write(b"\x00" * ns.ENCABEZADO.size)
+        with pytest.raises(ValueError):
+            ns.open_mapped(ruta)
+        assert ns.read_source(ruta) is None
+        assert ns.read_source(os.path.join(carpeta, "no_existe.bin")) is None
+
+
+@handle_not_implemented
+def test_store_follows_csv_signature():
+    catalog = cargar_catalogo()
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "datos.csv")
+        with open(ruta, "w") as f:
+            f.write("a,b\n1,2\n")
+        assert l.guardar_almacen_nodos(catalog, ruta)
+        assert ns.read_source(l.ruta_almacen_nodos(ruta)) == l.firma_archivo(ruta)
+
+        # un CSV reemplazado por otro con mtime más viejo ya no coincide
+        with open(ruta, "w") as f:
+            f.write("a,b\n1,2\n3,4\n")
+        os.utime(ruta, ns=(1, 1))
+        assert ns.read_source(l.ruta_almacen_nodos(ruta)) != l.firma_archivo(ruta)
+        assert l.guardar_almacen_nodos(catalog, ruta)
+        assert ns.read_source(l.ruta_almacen_nodos(ruta)) == l.firma_archivo(ruta)
@@ -0,0 +1,117 @@
+import os
+import pickle
+import shutil
+import tempfile
+
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Graph import astar
+import App.logic as l
+
+ARCHIVO = "Data/1000_cranes_mongolia_small.csv"
+
+
+def copiar_csv(carpeta):
+    ruta = os.path.join(carpeta, "datos.csv")
+    shutil.copyfile(ARCHIVO, ruta)
+    return ruta
+
+
+def mismos_grafos(a, b):
+    for nombre in ("grafo_1", "grafo_2"):
+        for campo in ("keys", "offsets", "targets", "weights"):
+            assert list(a[nombre][campo]) == list(b[nombre][campo])
+    assert list(a["conectividad"]["parent"]) == list(b["conectividad"]["parent"])
+
+
+@handle_not_implemented
+def test_round_trip_same_graphs():
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = copiar_csv(carpeta)
+        construido = l.new_logic()
+        resumen = l.cargar_archivo(construido, ruta)
+        assert os.path.exists(l.ruta_snapshot(ruta))
+        assert l.cargar_snapshot(ruta) is not None
+
+        restaurado = l.new_logic()
+        assert l.cargar_archivo(restaurado, ruta) == resumen
+        mismos_grafos(construido, restaurado)
+
+        # los mapas se reconstruyen con las mismas llaves
+        nodos = restaurado["nodos"]
+        for i in range(lt.size(nodos)):
+            nodo = lt.get_element(nodos, i)
+            assert l.obtener_nodo(restaurado["indice_nodos"], nodo["id"]) is nodo
+            assert restaurado["grafo_1"]["infos"][i] is nodo
+        eventos = restaurado["eventos"]
+        for i in range(eventos["size"]):
+            evento = eventos["id"][i]
+            assert (mp.get(restaurado["map_evento_nodo"], evento)
+                    == mp.get(construido["map_evento_nodo"], evento))
+
+        # las tablas de A* salen del snapshot, no se recalculan
+        tablas = restaurado["grafo_1"][astar.CACHE_KEY]
+        esperadas = construido["grafo_1"][astar.CACHE_KEY]
+        assert tablas["vertices"] == esperadas["vertices"]
+        for campo in ("dist_from", "dist_to"):
+            assert [list(d) for d in tablas[campo]] == [list(d) for d in esperadas[campo]]
+        assert "reverse" not in restaurado["grafo_1"]
+
+        origen = lt.get_element(nodos, 0)["id"]
+        assert (l.obtener_mst(restaurado["grafo_2"], origen)["weight"]
+                == l.obtener_mst(construido["grafo_2"], origen)["weight"])
+
+
+@handle_not_implemented
+def test_csv_change_rebuilds():
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = copiar_csv(carpeta)
+        construido = l.new_logic()
+        l.cargar_archivo(construido, ruta)
+
+        # otra fecha de modificación
+        os.utime(ruta, ns=(1, 1))
+        assert l.cargar_snapshot(ruta) is None
+        catalog = l.new_logic()
+        l.cargar_archivo(catalog, ruta)
+        mismos_grafos(construido, catalog)
+        assert l.cargar_snapshot(ruta) is not None
+
+        # otro tamaño (una línea en blanco no agrega eventos)
+        with open(ruta, "a") as f:
+            f.write("\n")
+        assert l.cargar_snapshot(ruta) is None
+        catalog = l.new_logic()
+        l.cargar_archivo(catalog, ruta)
+        mismos_grafos(construido, catalog)
+        assert l.cargar_snapshot(ruta) is not None
+
+
+@handle_not_implemented
+def test_bad_snapshot_rebuilds():
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = copiar_csv(carpeta)
+        construido = l.new_logic()
+        l.cargar_archivo(construido, ruta)
+        snapshot = l.ruta_snapshot(ruta)
+        with open(snapshot, "rb") as f:
+            contenido = f.read()
+        tamano, mtime = l.firma_archivo(ruta)
+
+        otra_version = {"version": l.SNAPSHOT_VERSION - 1, "tamano": tamano, "mtime": mtime}
+        danados = [
+            pickle.dumps(otra_version) + pickle.dumps({}),
+            contenido[:len(contenido) // 2],
+            b"basura",
+            b"",
+        ]
+        for danado in danados:
+            with open(snapshot, "wb") as f:
+                f.write(danado)
+            assert l.cargar_snapshot(ruta) is None
+
+            catalog = l.new_logic()
+            l.cargar_archivo(catalog, ruta)
+            mismos_grafos(construido, catalog)
+            assert l.cargar_snapshot(ruta) is not None
@@ -1,19 +1,53 @@
 import time
 import csv
 import math
-from math import radians, sin, cos, sqrt, atan2
-from datetime import datetime
+import os
+import pickle
+from datetime import datetime, timedelta, timezone
 import sys
-sys.setrecursionlimit(20000)
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
 from DataStructures.List import array_list as lt
 from DataStructures.Map import map_linear_probing as mp
 from DataStructures.Graph import digraph as gp
+from DataStructures.Graph import csr_graph as csr
 from DataStructures.Graph import dfs as DFS
-from DataStructures.Graph import vertex as vtx
 from DataStructures.Stack import stack as st
 from DataStructures.Graph import dijsktra as dk
-from DataStructures.Stack import stack as stack
+from DataStructures.Graph import bidirectional as bd
+from DataStructures.Graph import astar
+from DataStructures.Graph import longest_path as lp
+from DataStructures.Graph import components as cc
+from DataStructures.Graph import mst
+from DataStructures.UnionFind import union_find as uf
+from DataStructures.Map import lru_cache as lru
+from DataStructures.Spatial import grid_index as gi
+from DataStructures.Spatial import kd_tree as kd
+from DataStructures.Spatial import haversine as hv
+from DataStructures.Spatial.haversine import haversine
+from App import node_store as ns
+
+# Un evento pertenece a un nodo si está a menos de RADIO_NODO_KM del nodo
+# y a menos de VENTANA_NODO_HORAS de su creación.
+RADIO_NODO_KM = 3
+VENTANA_NODO_HORAS = 3
+# Ancho de las celdas de la rejilla para consultas por radio (nodes_within).
+CELDA_CONSULTA_KM = 10
+# Número de nodos de referencia (landmarks) de la heurística A* de req_5
+# sobre grafo_1 (ver preparar_astar).
+REFERENCIAS_ASTAR = 4
+# Número de árboles de caminos más cortos (uno por grafo y origen) que req_5
+# guarda para reutilizar en consultas repetidas, y de orígenes consultados
+# una sola vez que se recuerdan (ver busqueda_req_5).
+CAPACIDAD_CACHE_CAMINOS = 64
+# req_4 muestra las primeras y últimas FILAS_CORREDOR filas del corredor.
+FILAS_CORREDOR = 5
+EPOCH = datetime(1970, 1, 1)
+
+# Versión del formato del snapshot binario del catálogo. Se debe aumentar
+# cada vez que cambie la estructura de lo que se guarda.
+SNAPSHOT_VERSION = 3
 # =============================================================================
 # ----------------------------- ESTRUCTURA PRINCIPAL --------------------------
 # =============================================================================
@@ -22,17 +56,37 @@ def new_logic():
     Crea el catálogo principal.
 
     El catálogo contiene:
-      - Una lista con todos los eventos cargados desde el archivo.
+      - Los eventos cargados desde el archivo en arreglos columnares.
       - Una lista de nodos migratorios construidos a partir de los eventos.
       - Un mapa que relaciona cada event-id con el nodo al que pertenece.
+      - Un mapa que relaciona cada nodo-id con su nodo (índice de nodos).
+      - Un almacén columnar con los mismos nodos (ver App/node_store.py).
+      - Un árbol k-d con la ubicación de los nodos (nodo más cercano).
+      - Una rejilla con la ubicación de los nodos (nodos dentro de un radio).
+      - Estadísticas opcionales de los arcos (ver construir_grafos).
+      - Las distancias desde y hacia los nodos de referencia de la
+        heurística A*, guardadas en grafo_1 (ver preparar_astar).
+      - Un cache LRU de árboles de caminos más cortos por (grafo, origen)
+        que usa req_5, y otro con los (grafo, origen) consultados una vez
+        (ver busqueda_req_5); se vacían cada vez que se construyen los grafos.
+      - Conjuntos disjuntos (union-find) con los nodos conectados por algún
+        arco de los grafos, sin importar el sentido (ver construir_conectividad).
       - Dos grafos :
             grafo_1: pesos por distancia entre nodos consecutivos.
             grafo_2: pesos por diferencia promedio de agua entre nodos.
     """
     catalog = {
-        "eventos": lt.new_list(),
+        "eventos": nuevas_columnas(),
         "nodos": lt.new_list(),     
         "map_evento_nodo": mp.new_map(50000, 0.5),
+        "indice_nodos": mp.new_map(10000, 0.5),
+        "almacen_nodos": ns.new_node_store(),
+        "arbol_nodos": kd.new_kd_tree([], []),
+        "rejilla_nodos": gi.new_grid_index(CELDA_CONSULTA_KM, 0),
+        "estadisticas_arcos": None,
+        "cache_caminos": lru.new_lru_cache(CAPACIDAD_CACHE_CAMINOS),
+        "origenes_vistos": lru.new_lru_cache(CAPACIDAD_CACHE_CAMINOS),
+        "conectividad": uf.new_union_find(0),
         "grafo_1": gp.new_graph(10000),
         "grafo_2": gp.new_graph(10000) 
     }
@@ -41,46 +95,396 @@ def new_logic():
 # =============================================================================
 # ------------------------------ CARGA DE DATOS -------------------------------
 # =============================================================================
-def load_data(catalog, filename):
+def load_data(catalog, filename, usar_snapshot=True, procesos=1):
     """
-    Carga los datos del reto
+    Carga los datos del reto.
+
+    La carga es un pipeline de generadores:
+        leer_filas → normalizar_filas → columnas_eventos (arreglos compactos)
+        → ordenar_columnas → crear_nodos → transiciones → construir_grafos
+
+    Las filas del CSV no se guardan: de cada evento solo se conservan los
+    campos que usan los requerimientos, en arreglos columnares ordenados
+    por tiempo.
+
+    Si usar_snapshot es True y existe un snapshot válido junto al CSV, el
+    catálogo se lee de ese archivo en lugar de reconstruirse. Después de una
+    reconstrucción se guarda un snapshot nuevo.
+
+    En ambos casos se guarda también el almacén columnar de nodos junto al
+    CSV, para que otros procesos lo abran con abrir_almacen_nodos.
+
+    procesos es el número de procesos con que se construyen los grafos
+    (ver construir_grafos); no se usa si el catálogo sale del snapshot.
     """
-    ruta = "Data/" + filename
-    with open(ruta, encoding="utf-8-sig") as f:
-        lector = csv.DictReader(f)
-        
-        for evento in lector:
-            lt.add_last(catalog["eventos"], evento)
-            
-    catalog["eventos"] = lt.merge_sort(catalog["eventos"], cmp_timestamp)
+    return cargar_archivo(catalog, "Data/" + filename, usar_snapshot, procesos)
+
+
+def cargar_archivo(catalog, ruta, usar_snapshot=True, procesos=1):
+    """
+    Igual que load_data, pero con la ruta completa del CSV. El snapshot y
+    el almacén de nodos se escriben junto a esa ruta.
+    """
+    if usar_snapshot:
+        guardado = cargar_snapshot(ruta)
+        if guardado is not None:
+            restaurar_catalogo(catalog, guardado)
+            guardar_almacen_nodos(catalog, ruta)
+            return resumen_carga(catalog)
+
+    eventos = columnas_eventos(normalizar_filas(leer_filas(ruta)))
+    catalog["eventos"] = ordenar_columnas(eventos)
+
     # crear nodos migratorios
     nodos, map_evento_nodo = crear_nodos(catalog["eventos"])
     
     catalog["nodos"] = nodos
     catalog["map_evento_nodo"] = map_evento_nodo
+    catalog["indice_nodos"] = indexar_nodos(nodos)
+    catalog["almacen_nodos"] = ns.from_nodes(nodos)
+    catalog["arbol_nodos"] = indexar_ubicaciones(nodos)
+    catalog["rejilla_nodos"] = indexar_rejilla(nodos)
     
     # crear grafos
-    construir_grafos(catalog)
+    construir_grafos(catalog, procesos)
+
+    if usar_snapshot:
+        guardar_snapshot(catalog, ruta)
+        guardar_almacen_nodos(catalog, ruta)
+
+    return resumen_carga(catalog)
+
 
+def resumen_carga(catalog):
+    """
+    Retorna el resumen de la carga: número de eventos y de nodos.
+    """
     return {
-        "num_eventos": lt.size(catalog["eventos"]),
+        "num_eventos": catalog["eventos"]["size"],
         "num_nodos": lt.size(catalog["nodos"])
     }
+
+
+def ruta_snapshot(ruta_csv):
+    """
+    Retorna la ruta del snapshot binario asociado a un archivo CSV.
+    """
+    return ruta_csv + ".snapshot"
+
+
+def firma_archivo(ruta_csv):
+    """
+    Retorna (tamaño en bytes, mtime en ns) del archivo CSV.
+    Si el tamaño o la fecha de modificación cambian, el snapshot ya no sirve.
+    """
+    info = os.stat(ruta_csv)
+    return info.st_size, info.st_mtime_ns
+
+
+def exportar_catalogo(catalog):
+    """
+    Retorna una copia portable del catálogo para el snapshot.
+
+    Los mapas (map_linear_probing) ubican cada llave con hash(), que para
+    str cambia en cada ejecución de Python, así que no se pueden guardar tal
+    cual: el mapa evento → nodo y el índice de nodos se reconstruyen al
+    restaurar (la columna "nodo" de los eventos es el mapa evento → nodo).
+    Todo lo demás ya es plano y se guarda como está: los eventos, los nodos,
+    el almacén columnar, el árbol k-d, la rejilla, el union-find, los
+    arreglos CSR de cada grafo (sin sus caches, ver exportar_grafo) y las
+    tablas de la heurística A* de grafo_1 (ver preparar_astar).
+    """
+    return {
+        "eventos": catalog["eventos"],
+        "nodos": catalog["nodos"],
+        "almacen_nodos": catalog["almacen_nodos"],
+        "arbol_nodos": catalog["arbol_nodos"],
+        "rejilla_nodos": catalog["rejilla_nodos"],
+        "conectividad": catalog["conectividad"],
+        "grafo_1": exportar_grafo(catalog["grafo_1"]),
+        "grafo_2": exportar_grafo(catalog["grafo_2"])
+    }
+
+
+def exportar_grafo(grafo):
+    """
+    Retorna el grafo CSR solo con sus arreglos (llaves, offsets, targets,
+    weights, ...), sin los caches que se le agregan al usarlo (grafo
+    invertido, espacio de trabajo de Dijkstra, componentes, ...). Solo se
+    conservan las tablas de landmarks de A*, que son arreglos planos y
+    cuestan varios Dijkstra completos.
+    """
+    campos = ("type", "keys", "infos", "index", "offsets", "targets",
+              "weights", "num_edges")
+    copia = {campo: grafo[campo] for campo in campos}
+    if astar.CACHE_KEY in grafo:
+        copia[astar.CACHE_KEY] = grafo[astar.CACHE_KEY]
+    return copia
+
+
+def restaurar_catalogo(catalog, guardado):
+    """
+    Reconstruye el catálogo a partir de la copia portable del snapshot:
+    solo se vuelven a construir el mapa evento → nodo y el índice de nodos.
+    Las tablas de A* vienen en grafo_1, así que preparar_astar no recalcula
+    nada.
+    """
+    eventos = guardado["eventos"]
+    nodos = guardado["nodos"]
+
+    mapa = mp.new_map(50000, 0.5)
+    posiciones = eventos["nodo"]
+    for i in range(eventos["size"]):
+        mp.put(mapa, eventos["id"][i], lt.get_element(nodos, posiciones[i])["id"])
+
+    catalog["eventos"] = eventos
+    catalog["nodos"] = nodos
+    catalog["map_evento_nodo"] = mapa
+    catalog["indice_nodos"] = indexar_nodos(nodos)
+    for campo in ("almacen_nodos", "arbol_nodos", "rejilla_nodos",
+                  "conectividad", "grafo_1", "grafo_2"):
+        catalog[campo] = guardado[campo]
+    lru.clear(catalog["cache_caminos"])
+    lru.clear(catalog["origenes_vistos"])
+    preparar_astar(catalog)
+
+    return catalog
+
+
+def guardar_snapshot(catalog, ruta_csv):
+    """
+    Guarda el catálogo construido (ver exportar_catalogo) en un snapshot
+    binario junto al CSV.
+
+    El archivo tiene dos registros pickle: un encabezado con la versión del
+    formato y la firma del CSV, y luego el catálogo. Se escribe en un archivo
+    temporal que después reemplaza al anterior, así nunca queda un snapshot
+    a medio escribir. Si no se puede escribir, la carga sigue sin snapshot.
+    """
+    destino = ruta_snapshot(ruta_csv)
+    temporal = destino + ".tmp"
+    tamano, mtime = firma_archivo(ruta_csv)
+    encabezado = {"version": SNAPSHOT_VERSION, "tamano": tamano, "mtime": mtime}
+    contenido = exportar_catalogo(catalog)
+
+    try:
+        with open(temporal, "wb") as f:
+            pickle.dump(encabezado, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(contenido, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporal, destino)
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return False
+    return True
+
+
+def cargar_snapshot(ruta_csv):
+    """
+    Lee el snapshot asociado al CSV y retorna la copia portable del catálogo
+    (ver exportar_catalogo).
+
+    Retorna None si no existe, si es de otra versión del formato, si el CSV
+    cambió de tamaño o de fecha de modificación, o si está dañado.
+    El snapshot es un archivo local generado por esta misma aplicación.
+    """
+    origen = ruta_snapshot(ruta_csv)
+    if not os.path.exists(origen):
+        return None
+
+    tamano, mtime = firma_archivo(ruta_csv)
+    try:
+        with open(origen, "rb") as f:
+            encabezado = pickle.load(f)
+            if (not isinstance(encabezado, dict)
+                    or encabezado.get("version") != SNAPSHOT_VERSION
+                    or encabezado.get("tamano") != tamano
+                    or encabezado.get("mtime") != mtime):
+                return None
+            return pickle.load(f)
+    except (OSError, EOFError, ValueError, pickle.UnpicklingError, AttributeError,
+            ImportError):
+        return None
+
+
+def ruta_almacen_nodos(ruta_csv):
+    """
+    Retorna la ruta del almacén columnar de nodos asociado a un archivo CSV.
+    """
+    return ruta_csv + ".nodos"
+
+
+def guardar_almacen_nodos(catalog, ruta_csv):
+    """
+    Escribe el almacén columnar de nodos junto al CSV si no existe uno con
+    la misma firma (firma_archivo) que el CSV. Igual que el snapshot, se
+    escribe en un temporal que luego reemplaza al anterior; si no se puede
+    escribir, retorna False.
+    """
+    destino = ruta_almacen_nodos(ruta_csv)
+    firma = firma_archivo(ruta_csv)
+    if ns.read_source(destino) == firma:
+        return True
+
+    temporal = destino + ".tmp"
+    try:
+        ns.save(catalog["almacen_nodos"], temporal, firma)
+        os.replace(temporal, destino)
+    except OSError:
+        if os.path.exists(temporal):
+            os.remove(temporal)
+        return False
+    return True
+
+
+def abrir_almacen_nodos(filename):
+    """
+    Abre en modo lectura (memoria mapeada) el almacén de nodos guardado por
+    load_data para el archivo dado. Varios procesos pueden abrirlo a la vez
+    y comparten la misma copia en memoria.
+
+    Retorna None si el almacén no existe o no corresponde a la versión
+    actual del CSV (misma firma que en el snapshot: tamaño y mtime).
+    """
+    ruta = "Data/" + filename
+    origen = ruta_almacen_nodos(ruta)
+    if ns.read_source(origen) != firma_archivo(ruta):
+        return None
+    return ns.open_mapped(origen)
+
+
+def leer_filas(ruta):
+    """
+    Generador con las filas (diccionarios) del archivo CSV, una a la vez.
+    """
+    with open(ruta, encoding="utf-8-sig") as f:
+        for fila in csv.DictReader(f):
+            yield fila
+
+
+def normalizar_filas(filas):
+    """
+    Generador que convierte cada fila del CSV en un evento normalizado.
+    """
+    for fila in filas:
+        yield normalizar_evento(fila)
+
+
+def nuevas_columnas():
+    """
+    Crea el almacenamiento columnar de eventos.
+
+    Cada campo se guarda en un arreglo compacto y el evento i corresponde a
+    la posición i de todos los arreglos:
+      - id: event-id (lista de str).
+      - grulla: código entero de la grulla (array 'i').
+      - timestamp, lat, lon, agua: campos numéricos (array 'd').
+      - nodo: posición del nodo al que pertenece el evento (array 'i').
+      - grullas: tag-local-identifier de cada código de grulla.
+      - size: número de eventos.
+    """
+    return {
+        "id": [],
+        "grulla": array("i"),
+        "timestamp": array("d"),
+        "lat": array("d"),
+        "lon": array("d"),
+        "agua": array("d"),
+        "nodo": array("i"),
+        "grullas": [],
+        "size": 0
+    }
+
+
+def columnas_eventos(eventos):
+    """
+    Consume un iterable de eventos normalizados y los guarda en arreglos
+    columnares. Las grullas se guardan como códigos enteros.
+    """
+    columnas = nuevas_columnas()
+    codigos = {}
+
+    for evento in eventos:
+        grulla = evento["grulla"]
+        codigo = codigos.get(grulla)
+        if codigo is None:
+            codigo = len(columnas["grullas"])
+            codigos[grulla] = codigo
+            columnas["grullas"].append(grulla)
+
+        columnas["id"].append(evento["id"])
+        columnas["grulla"].append(codigo)
+        columnas["timestamp"].append(evento["timestamp"])
+        columnas["lat"].append(evento["lat"])
+        columnas["lon"].append(evento["lon"])
+        columnas["agua"].append(evento["agua"])
+        columnas["size"] += 1
+
+    return columnas
+
+
+def ordenar_columnas(columnas):
+    """
+    Retorna nuevas columnas con los eventos ordenados por timestamp.
+
+    El orden es estable: los eventos con el mismo timestamp conservan el
+    orden del archivo. Se ordena una permutación usando el timestamp como
+    llave, sin funciones de comparación.
+    """
+    orden = sorted(range(columnas["size"]), key=columnas["timestamp"].__getitem__)
+
+    ordenadas = nuevas_columnas()
+    ordenadas["grullas"] = columnas["grullas"]
+    ordenadas["size"] = columnas["size"]
+    for campo in ("id", "grulla", "timestamp", "lat", "lon", "agua"):
+        origen = columnas[campo]
+        destino = ordenadas[campo]
+        destino.extend(origen[i] for i in orden)
+
+    return ordenadas
+
+
+def iterar_eventos(columnas):
+    """
+    Generador con cada evento de las columnas como un diccionario temporal
+    (mismos campos que normalizar_evento), en orden de posición.
+    """
+    grullas = columnas["grullas"]
+    for i in range(columnas["size"]):
+        yield {
+            "id": columnas["id"][i],
+            "grulla": grullas[columnas["grulla"][i]],
+            "timestamp": columnas["timestamp"][i],
+            "lat": columnas["lat"][i],
+            "lon": columnas["lon"][i],
+            "agua": columnas["agua"][i]
+        }
     
 # =============================================================================
 # ---------------------------- FUNCIONES AUXILIARES ---------------------------
 # =============================================================================
 
-def haversine(lat1, lon1, lat2, lon2):
-    """    
-    Calcula la distancia entre dos puntos usando la fórmula Haversine.
+def normalizar_evento(fila):
     """
-    R = 6371
-    dlat = radians(lat2 - lat1)
-    dlon = radians(lon2 - lon1)
-    a = sin(dlat/2)**2 + cos(radians(lat1))*cos(radians(lat2))*sin(dlon/2)**2
-    c = 2 * atan2(sqrt(a), sqrt(1-a))
-    return R * c
+    Convierte una fila del CSV en un evento con campos tipados.
+
+    El evento normalizado contiene:
+      - id: event-id del evento.
+      - grulla: tag-local-identifier de la grulla.
+      - timestamp: segundos desde 1970-01-01 (float, con fracción).
+      - lat, lon: coordenadas como float.
+      - agua: distancia al agua en km (comments / 1000).
+
+    Así cada campo se convierte una sola vez al cargar el archivo.
+    """
+    return {
+        "id": fila["event-id"],
+        "grulla": fila["tag-local-identifier"],
+        "timestamp": segundos_epoch(datetime.fromisoformat(fila["timestamp"])),
+        "lat": float(fila["location-lat"]),
+        "lon": float(fila["location-long"]),
+        "agua": float(fila["comments"]) / 1000
+    }
 
 
 def crear_nodo(evento):
@@ -91,25 +495,25 @@ def crear_nodo(evento):
     y tiempo (<3 horas). 
     Además, calcula:
       - Lista de grullas presentes en el nodo.
-      - Lista de eventos asociados.
+      - Número de eventos asociados.
       - Promedio de distancia al agua (comments).
     """
+    epoch = math.floor(evento["timestamp"])
     nodo = {
-        "id": evento["event-id"],
-        "lat": float(evento["location-lat"]),
-        "lon": float(evento["location-long"]),
-        "timestamp": datetime.fromisoformat(evento["timestamp"]).replace(microsecond=0),
+        "id": evento["id"],
+        "lat": evento["lat"],
+        "lon": evento["lon"],
+        "timestamp": EPOCH + timedelta(seconds=epoch),
+        "epoch": epoch,
         "grullas": lt.new_list(),
-        "eventos": lt.new_list(),
         "prom_agua": 0.0,
         "total_agua": 0.0,
         "count": 0
     }
 
-    lt.add_last(nodo["grullas"], evento["tag-local-identifier"])
-    lt.add_last(nodo["eventos"], evento)
+    lt.add_last(nodo["grullas"], evento["grulla"])
 
-    d = float(evento["comments"]) / 1000
+    d = evento["agua"]
     nodo["total_agua"] = d
     nodo["count"] = 1
     nodo["prom_agua"] = d
@@ -123,16 +527,14 @@ def agregar_evento_a_nodo(nodo, evento):
 
     El nodo se actualiza así:
       - Se añade la grulla si no estaba registrada.
-      - Se agrega el evento a la lista interna del nodo.
+      - Se aumenta el número de eventos del nodo.
       - Se recalcula el promedio de distancia al agua.
     """
     
-    if lt.is_present(nodo["grullas"], evento["tag-local-identifier"]) == -1:
-        lt.add_last(nodo["grullas"], evento["tag-local-identifier"])
-
-    lt.add_last(nodo["eventos"], evento)
+    if lt.is_present(nodo["grullas"], evento["grulla"]) == -1:
+        lt.add_last(nodo["grullas"], evento["grulla"])
 
-    d = float(evento["comments"]) / 1000
+    d = evento["agua"]
     nodo["total_agua"] += d
     nodo["count"] += 1
     nodo["prom_agua"] = nodo["total_agua"] / nodo["count"]
@@ -151,18 +553,29 @@ def evento_encaja(nodo, evento):
     """
     dist = haversine(
         nodo["lat"], nodo["lon"],
-        float(evento["location-lat"]), float(evento["location-long"])
+        evento["lat"], evento["lon"]
     )
-    if dist > 3:
+    if dist > RADIO_NODO_KM:
         return False
 
-    t1 = nodo["timestamp"]
-    t2 = datetime.fromisoformat(evento["timestamp"]).replace(microsecond=0)
-    horas = abs((t2 - t1).total_seconds()) / 3600
+    # ambos tiempos se comparan truncados al segundo
+    t1 = nodo["epoch"]
+    t2 = math.floor(evento["timestamp"])
+    horas = abs(t2 - t1) / 3600
 
-    return horas <= 3
+    return horas <= VENTANA_NODO_HORAS
 
-def crear_nodos(lista_eventos):
+
+def segundos_epoch(fecha):
+    """
+    Retorna los segundos transcurridos desde 1970-01-01 hasta ``fecha``.
+    """
+    if fecha.tzinfo is not None:
+        fecha = fecha.astimezone(timezone.utc).replace(tzinfo=None)
+    return (fecha - EPOCH).total_seconds()
+
+
+def crear_nodos(eventos):
     """
     Construye la lista completa de nodos migratorios.
 
@@ -170,10 +583,17 @@ def crear_nodos(lista_eventos):
       - Se revisa si encaja en un nodo ya existente.
       - Si encaja, se agrega al nodo correspondiente.
       - Si no encaja, se crea un nodo nuevo.
-      - Se registra la relación event-id → nodo-id en un mapa.
+      - Se registra la relación event-id → nodo-id en un mapa y la
+        posición del nodo en la columna "nodo" de los eventos.
+
+    Los nodos se indexan en una rejilla espacio-temporal (celdas de
+    RADIO_NODO_KM y ventanas de VENTANA_NODO_HORAS), así cada evento solo se
+    compara con los nodos de las celdas vecinas. Los candidatos se revisan en
+    orden de creación, por lo que el evento queda en el mismo nodo que con
+    el recorrido completo de la lista.
 
     Args:
-        lista_eventos (array_list): lista de eventos cargados del CSV.
+        eventos (dict): columnas de eventos ordenadas por timestamp.
 
     Returns:
         tuple: 
@@ -182,293 +602,406 @@ def crear_nodos(lista_eventos):
     """
     nodos = lt.new_list()
     mapa = mp.new_map(50000, 0.5)
+    posiciones = eventos["nodo"]
+    del posiciones[:]
+
+    max_lat = 0.0
+    for lat in eventos["lat"]:
+        if abs(lat) > max_lat:
+            max_lat = abs(lat)
 
-    n = lt.size(lista_eventos)
+    rejilla = gi.new_grid_index(RADIO_NODO_KM, max_lat, VENTANA_NODO_HORAS * 3600)
 
-    for i in range(n):
-        evento = lt.get_element(lista_eventos, i)
+    for evento in iterar_eventos(eventos):
         asignado = False
 
-        for j in range(lt.size(nodos)):
+        for j in gi.candidates(rejilla, evento["lat"], evento["lon"],
+                               math.floor(evento["timestamp"])):
             nodo = lt.get_element(nodos, j)
 
             if evento_encaja(nodo, evento):
                 agregar_evento_a_nodo(nodo, evento)
-                mp.put(mapa, evento["event-id"], nodo["id"])
+                mp.put(mapa, evento["id"], nodo["id"])
+                posiciones.append(j)
                 asignado = True
                 break
 
         if not asignado:
             nuevo = crear_nodo(evento)
+            gi.insert(rejilla, nuevo["lat"], nuevo["lon"], nuevo["epoch"],
+                      lt.size(nodos))
+            posiciones.append(lt.size(nodos))
             lt.add_last(nodos, nuevo)
-            mp.put(mapa, evento["event-id"], nuevo["id"])
+            mp.put(mapa, evento["id"], nuevo["id"])
 
     return nodos, mapa
 
 
-def construir_grafos(catalog):
+def transiciones(eventos):
+    """
+    Generador con los viajes entre nodos de cada grulla.
+
+    Recorre los eventos en orden de tiempo y recuerda el último evento de
+    cada grulla. Cada vez que una grulla pasa a un nodo distinto del de su
+    evento anterior, produce la pareja (evento anterior, evento actual)
+    como posiciones en las columnas.
+    """
+    ultimo = {}
+    grullas = eventos["grulla"]
+    posiciones = eventos["nodo"]
+
+    for i in range(eventos["size"]):
+        grulla = grullas[i]
+        prev = ultimo.get(grulla)
+        if prev is not None and posiciones[prev] != posiciones[i]:
+            yield prev, i
+        ultimo[grulla] = i
+
+
+def construir_grafos(catalog, procesos=1, estadisticas=False):
     """
     Construye los dos grafos del reto usando los nodos migratorios.
+    Los arcos se acumulan consumiendo el generador de transiciones.
 
     grafo_1:
-        Peso del arco : distancia Haversine entre nodos.
+        Peso del arco : distancia Haversine promedio de los viajes.
 
     grafo_2:
-        Peso del arco : diferencia absoluta en el promedio
-        de distancia al agua entre nodos.
+        Peso del arco : promedio de la distancia al agua del nodo destino
+        en los viajes.
+
+    Con procesos > 1 las trayectorias de las grullas se reparten entre
+    varios procesos (ver arcos_en_paralelo). Con estadisticas=True se guarda
+    además en catalog["estadisticas_arcos"] el mínimo, máximo y varianza de
+    cada arco (ver estadisticas_de_arcos).
     Args:
         catalog (dict): catálogo con nodos y grafos creados.
+        procesos (int): número de procesos para acumular los arcos.
+        estadisticas (bool): calcular mínimo, máximo y varianza por arco.
     """
-    nodos = catalog["nodos"]
-    eventos = catalog["eventos"]
-    mapa_evento_nodo = catalog["map_evento_nodo"]
+    nodos = catalog["nodos"]["elements"]
 
-    g1 = catalog["grafo_1"]
-    g2 = catalog["grafo_2"]
+    if procesos > 1:
+        viajes = arcos_en_paralelo(catalog, procesos, estadisticas)
+    else:
+        viajes = arcos_en_serie(catalog, estadisticas)
 
-    # Insertar todos los nodos como vértices
-    for i in range(lt.size(nodos)):
-        nodo = lt.get_element(nodos, i)
-        gp.insert_vertex(g1, nodo["id"], nodo)
-        gp.insert_vertex(g2, nodo["id"], nodo)
+    arcos_1 = []
+    arcos_2 = []
+    for (u, v), acumulador in viajes.items():
+        origen, destino = nodos[u]["id"], nodos[v]["id"]
+        arcos_1.append((origen, destino, acumulador["suma_distancia"] / acumulador["conteo"]))
+        arcos_2.append((origen, destino, acumulador["suma_agua"] / acumulador["conteo"]))
 
-    # Agrupar eventos por grulla
-    grupos = mp.new_map(100, 0.5)
+    catalog["estadisticas_arcos"] = estadisticas_de_arcos(viajes, nodos) if estadisticas else None
 
-    for i in range(lt.size(eventos)):
-        ev = lt.get_element(eventos, i)
-        crane = ev["tag-local-identifier"]
+    # Los grafos no cambian después de la carga: se guardan congelados en
+    # formato CSR, con todos los nodos como vértices.
+    ids = [nodo["id"] for nodo in nodos]
+    catalog["grafo_1"] = csr.new_csr_graph(ids, nodos, arcos_1)
+    catalog["grafo_2"] = csr.new_csr_graph(ids, nodos, arcos_2)
+    lru.clear(catalog["cache_caminos"])
+    lru.clear(catalog["origenes_vistos"])
+    catalog["conectividad"] = construir_conectividad(catalog)
+    preparar_astar(catalog)
 
-        lista = mp.get(grupos, crane)
-        if lista is None:
-            nueva = lt.new_list()
-            lt.add_last(nueva, ev)
-            mp.put(grupos, crane, nueva)
-        else:
-            lt.add_last(lista, ev)
 
-    # Estructuras para almacenar distancias de viajes A->B
-    distancias = mp.new_map(1000, 0.5)
-    aguas = mp.new_map(1000, 0.5)
+def preparar_astar(catalog):
+    """
+    Calcula las tablas de la heurística A* de grafo_1: las distancias desde
+    y hacia REFERENCIAS_ASTAR nodos de referencia (astar.landmarks), que
+    quedan guardadas en el grafo. Se hace al construir los grafos para que
+    la primera consulta de req_5 no pague este costo; el snapshot guarda
+    las tablas (ver exportar_grafo) y al restaurarlo no se recalculan.
+    """
+    astar.landmarks(catalog["grafo_1"], REFERENCIAS_ASTAR)
 
-    # Procesar cada grulla
-    claves = mp.key_set(grupos)
 
-    for i in range(lt.size(claves)):
+def construir_conectividad(catalog):
+    """
+    Construye los conjuntos disjuntos (union-find) de los nodos uniendo los
+    extremos de cada arco de grafo_1 y grafo_2. Los elementos son los
+    índices de los nodos, que son los mismos en ambos grafos.
 
-        crane_id = lt.get_element(claves, i)
-        lista = mp.get(grupos, crane_id)
+    Si dos nodos quedan en conjuntos distintos no hay ningún camino entre
+    ellos en ningún grafo (ni siquiera ignorando el sentido de los arcos),
+    así los requerimientos pueden responder "no hay camino" sin buscar.
+    """
+    conectividad = uf.new_union_find(csr.order(catalog["grafo_1"]))
+    for nombre in ("grafo_1", "grafo_2"):
+        grafo = catalog[nombre]
+        offsets = grafo["offsets"]
+        targets = grafo["targets"]
+        for u in range(csr.order(grafo)):
+            for k in range(offsets[u], offsets[u + 1]):
+                uf.union(conectividad, u, targets[k])
+    return conectividad
+
+
+def hay_conexion(catalog, origen, destino):
+    """
+    Retorna False si no puede existir un camino de origen a destino (los
+    nodos están en conjuntos distintos de catalog["conectividad"]). True no
+    garantiza un camino dirigido: solo que vale la pena buscarlo.
+    """
+    grafo = catalog["grafo_1"]
+    i = csr.index_of(grafo, origen)
+    j = csr.index_of(grafo, destino)
+    if i == -1 or j == -1:
+        return False
+    return uf.connected(catalog["conectividad"], i, j)
 
-        # ordenar eventos por timestamp
-        lista_ordenada = lt.merge_sort(lista, cmp_timestamp)
 
-        nodo_prev = None
-        evento_prev = None
-        
-        for j in range(lt.size(lista_ordenada)):
-            evento = lt.get_element(lista_ordenada, j)
-            nodo_actual = mp.get(mapa_evento_nodo, evento["event-id"])
+def arcos_en_serie(catalog, estadisticas=False):
+    """
+    Acumula los viajes de todas las grullas en este proceso y retorna el
+    diccionario de acumuladores por arco (ver acumular_viajes).
+    """
+    eventos = catalog["eventos"]
+    columnas = dict(eventos)
+    columnas["indice"] = range(eventos["size"])
+    agua_nodos = [nodo["prom_agua"] for nodo in catalog["nodos"]["elements"]]
+    return acumular_viajes((columnas, agua_nodos, estadisticas))
 
-            # primer evento
-            if nodo_prev is None:
-                nodo_prev = nodo_actual
-                evento_prev = evento
-                continue
 
-            if nodo_prev != nodo_actual:
+def arcos_en_paralelo(catalog, procesos, estadisticas=False):
+    """
+    Acumula los viajes repartiendo las grullas entre varios procesos
+    (ProcessPoolExecutor) y retorna el diccionario de acumuladores por arco.
+
+    Las trayectorias de grullas distintas son independientes: cada proceso
+    recibe las columnas de un grupo de grullas y retorna sus acumuladores
+    parciales. Las partes se combinan siempre en el mismo orden y los arcos
+    quedan en el orden de su primer viaje, así el resultado no depende de
+    qué proceso termine primero.
+    """
+    eventos = catalog["eventos"]
+    agua_nodos = array("d", [nodo["prom_agua"] for nodo in catalog["nodos"]["elements"]])
 
-                clave = f"{nodo_prev}->{nodo_actual}"
-                Nact = buscar_nodo_por_id(nodos, nodo_actual)
-                
-                # distancia haversine entre los eventos
-                lat,lon = float(evento["location-lat"]), float(evento["location-long"])
-                lat_prev,lon_prev = float(evento_prev["location-lat"]), float(evento_prev["location-long"])
-                
-                d = haversine(lat, lon,
-                              lat_prev, lon_prev)
-
-                # registrar distancia migratoria
-                lista_d = mp.get(distancias, clave)
-                if lista_d is None:
-                    nueva = lt.new_list()
-                    lt.add_last(nueva, d)
-                    mp.put(distancias, clave, nueva)
-                else:
-                    lt.add_last(lista_d, d)
-
-                # registrar distancia promedio al agua
-                lista_a = mp.get(aguas, clave)
-                if lista_a is None:
-                    nueva = lt.new_list()
-                    lt.add_last(nueva, Nact["prom_agua"])
-                    mp.put(aguas, clave, nueva)
-                else:
-                    lt.add_last(lista_a, Nact["prom_agua"])
+    trozos = []
+    for grupo in repartir_grullas(eventos, procesos):
+        trozos.append((columnas_de_grupo(eventos, grupo), agua_nodos, estadisticas))
 
-            nodo_prev = nodo_actual
-            evento_prev = evento
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        partes = list(pool.map(acumular_viajes, trozos))
 
-    # Crear arcos con promedio
-    claves_arcos = mp.key_set(distancias)
+    viajes = {}
+    for parte in partes:
+        for clave, acumulador in parte.items():
+            actual = viajes.get(clave)
+            if actual is None:
+                viajes[clave] = acumulador
+            else:
+                fusionar_acumuladores(actual, acumulador)
 
-    for i in range(lt.size(claves_arcos)):
+    return dict(sorted(viajes.items(), key=lambda x: x[1]["primero"]))
 
-        clave = lt.get_element(claves_arcos, i)
-        origen, destino = clave.split("->")
 
-        lista_d = mp.get(distancias, clave)
-        lista_a = mp.get(aguas, clave)
+def repartir_grullas(eventos, procesos):
+    """
+    Reparte los códigos de grulla en `procesos` grupos con un número de
+    eventos parecido: las grullas con más eventos se asignan primero, cada
+    una al grupo con menos eventos (el de menor índice si hay empate).
+    """
+    conteo = {}
+    for grulla in eventos["grulla"]:
+        conteo[grulla] = conteo.get(grulla, 0) + 1
 
-        # promedio distancia
-        total_d = 0
-        for k in range(lt.size(lista_d)):
-            total_d += lt.get_element(lista_d, k)
-        w_dist = total_d / lt.size(lista_d)
+    grupos = [set() for _ in range(procesos)]
+    carga = [0] * procesos
+    for grulla in sorted(conteo, key=lambda g: (-conteo[g], g)):
+        k = carga.index(min(carga))
+        grupos[k].add(grulla)
+        carga[k] += conteo[grulla]
+    return [grupo for grupo in grupos if grupo]
 
-        # promedio agua
-        total_a = 0
-        for k in range(lt.size(lista_a)):
-            total_a += lt.get_element(lista_a, k)
-        w_agua = total_a / lt.size(lista_a)
 
-        gp.add_edge(g1, origen, destino, w_dist)
-        gp.add_edge(g2, origen, destino, w_agua)
+def columnas_de_grupo(eventos, grupo):
+    """
+    Retorna las columnas (en orden de tiempo) de los eventos de las grullas
+    del grupo, con la posición global de cada evento en "indice".
+    """
+    indices = [i for i in range(eventos["size"]) if eventos["grulla"][i] in grupo]
+    return {
+        "indice": array("i", indices),
+        "grulla": array("i", (eventos["grulla"][i] for i in indices)),
+        "lat": array("d", (eventos["lat"][i] for i in indices)),
+        "lon": array("d", (eventos["lon"][i] for i in indices)),
+        "nodo": array("i", (eventos["nodo"][i] for i in indices)),
+        "size": len(indices)
+    }
 
 
+def acumular_viajes(trozo):
+    """
+    Recorre los viajes de las columnas recibidas (todas las grullas en
+    arcos_en_serie o un grupo en cada proceso de arcos_en_paralelo) y
+    retorna un diccionario (nodo origen, nodo destino) → acumulador, con los
+    nodos como posiciones y los arcos en el orden de su primer viaje.
 
+    Cada viaje se suma al acumulador de su arco en cuanto aparece: no se
+    guardan los valores de cada viaje, solo las sumas (memoria O(arcos)).
 
-def cmp_timestamp(e1, e2):
+    Args:
+        trozo: tupla (columnas, agua promedio de cada nodo, estadisticas).
     """
-    Compara dos eventos por su timestamp.
-    Retorna True si e1 ocurre antes que e2.
+    columnas, agua_nodos, estadisticas = trozo
+    lat, lon = columnas["lat"], columnas["lon"]
+    posiciones = columnas["nodo"]
+    indice = columnas["indice"]
+
+    pares = list(transiciones(columnas))
+
+    # distancia haversine entre los eventos de todos los viajes a la vez
+    distancias = hv.pairwise([lat[actual] for _, actual in pares],
+                             [lon[actual] for _, actual in pares],
+                             [lat[prev] for prev, _ in pares],
+                             [lon[prev] for prev, _ in pares])
+
+    viajes = {}
+    for k, (prev, actual) in enumerate(pares):
+        clave = (posiciones[prev], posiciones[actual])
+        acumulador = viajes.get(clave)
+        if acumulador is None:
+            acumulador = nuevo_acumulador(indice[actual], estadisticas)
+            viajes[clave] = acumulador
+        agregar_viaje(acumulador, float(distancias[k]), agua_nodos[clave[1]])
+    return viajes
+
+
+def nuevo_acumulador(primero, estadisticas=False):
     """
-    t1 = datetime.fromisoformat(e1["timestamp"])
-    t2 = datetime.fromisoformat(e2["timestamp"])
-    return t1 <= t2
+    Crea el acumulador de un arco: número de viajes y suma de distancias y
+    de agua. primero es la posición del primer evento del arco.
 
-def buscar_nodo_por_id(nodos, nodo_id):
+    Con estadisticas=True guarda además mínimo, máximo y varianza de cada
+    valor (ver nuevo_resumen).
     """
-    Retorna el nodo cuyo id coincide con nodo_id.
-    Busca linealmente en array_list nodos.
+    acumulador = {
+        "primero": primero,
+        "conteo": 0,
+        "suma_distancia": 0.0,
+        "suma_agua": 0.0
+    }
+    if estadisticas:
+        acumulador["distancia"] = nuevo_resumen()
+        acumulador["agua"] = nuevo_resumen()
+    return acumulador
+
+
+def agregar_viaje(acumulador, distancia, agua):
     """
-    for i in range(lt.size(nodos)):
-        nodo = lt.get_element(nodos, i)
-        if nodo["id"] == nodo_id:
-            return nodo
-    return None
+    Suma un viaje (distancia del viaje y agua promedio del nodo destino)
+    al acumulador de su arco.
+    """
+    acumulador["conteo"] += 1
+    acumulador["suma_distancia"] += distancia
+    acumulador["suma_agua"] += agua
+    if "distancia" in acumulador:
+        agregar_valor(acumulador["distancia"], distancia)
+        agregar_valor(acumulador["agua"], agua)
 
-def topological_sort(graph):
+
+def fusionar_acumuladores(acumulador, otro):
     """
-    Orden topológico usando Kahn (versión simplificada).
-    Si hay ciclo, retorna None.
+    Suma en acumulador los viajes de otro acumulador del mismo arco.
     """
-    vertices = gp.vertices(graph)
-    N = lt.size(vertices)
+    acumulador["primero"] = min(acumulador["primero"], otro["primero"])
+    acumulador["conteo"] += otro["conteo"]
+    acumulador["suma_distancia"] += otro["suma_distancia"]
+    acumulador["suma_agua"] += otro["suma_agua"]
+    if "distancia" in acumulador:
+        fusionar_resumen(acumulador["distancia"], otro["distancia"])
+        fusionar_resumen(acumulador["agua"], otro["agua"])
 
-    indeg = mp.new_map(N, 0.5)
 
-    # inicializar grados en 0
-    for i in range(N):
-        v = lt.get_element(vertices, i)
-        mp.put(indeg, v, 0)
+def nuevo_resumen():
+    """
+    Resumen en una pasada de una serie de valores: conteo, mínimo, máximo,
+    media y m2 (suma de cuadrados de las diferencias con la media), que se
+    actualizan con el método de Welford.
+    """
+    return {"n": 0, "min": math.inf, "max": -math.inf, "media": 0.0, "m2": 0.0}
 
-    # calcular indegree
-    for i in range(N):
-        u = lt.get_element(vertices, i)
-        adjs = gp.adjacents(graph, u)
-        
-        for j in range(lt.size(adjs)):
-            w = lt.get_element(adjs, j)
-            mp.put(indeg, w, mp.get(indeg, w) + 1)
-
-
-    # cola de nodos con indegree 0
-    cero = lt.new_list()
-    for i in range(N):
-        v = lt.get_element(vertices, i)
-        if mp.get(indeg, v) == 0:
-            lt.add_last(cero, v)
-
-    orden = lt.new_list()
-    idx = 0
-
-    # proceso de Kahn
-    while idx < lt.size(cero):
-        u = lt.get_element(cero, idx)
-        lt.add_last(orden, u)
-
-        adjs = gp.adjacents(graph, u)
-        for j in range(lt.size(adjs)):
-            v = lt.get_element(adjs, j)
-            mp.put(indeg, v, mp.get(indeg, v) - 1)
-            if mp.get(indeg, v) == 0:
-                lt.add_last(cero, v)
-        idx += 1
-
-    # si no tiene todos los vértices, hay ciclo
-    if lt.size(orden) != N:
-        return None
 
-    return orden
+def agregar_valor(resumen, x):
+    """
+    Agrega el valor x al resumen (Welford).
+    """
+    resumen["n"] += 1
+    if x < resumen["min"]:
+        resumen["min"] = x
+    if x > resumen["max"]:
+        resumen["max"] = x
+    delta = x - resumen["media"]
+    resumen["media"] += delta / resumen["n"]
+    resumen["m2"] += delta * (x - resumen["media"])
 
 
-def longest_path_in_dag(graph):
+def fusionar_resumen(resumen, otro):
     """
-    Ruta más larga en términos de número de nodos.
+    Combina en resumen los valores de otro resumen (fórmula de Chan et al.
+    para media y m2 de dos series).
     """
-    topo = topological_sort(graph)
-    if topo is None:
-        return None
+    if otro["n"] == 0:
+        return
+    n = resumen["n"] + otro["n"]
+    delta = otro["media"] - resumen["media"]
+    resumen["m2"] += otro["m2"] + delta * delta * resumen["n"] * otro["n"] / n
+    resumen["media"] += delta * otro["n"] / n
+    resumen["n"] = n
+    resumen["min"] = min(resumen["min"], otro["min"])
+    resumen["max"] = max(resumen["max"], otro["max"])
+
+
+def varianza(resumen):
+    """
+    Retorna la varianza poblacional de los valores del resumen.
+    """
+    if resumen["n"] == 0:
+        return 0.0
+    return resumen["m2"] / resumen["n"]
 
-    n = lt.size(topo)
-    
-    dist = mp.new_map(n, 0.5)
-    prev = mp.new_map(n, 0.5)
-    
-    # inicializar dist = 1
-    for i in range(n):
-        v = lt.get_element(topo, i)
-        mp.put(dist, v, 1)
-        mp.put(prev, v, None)
-    
-    # relajar usando el orden topológico
-    for i in range(n):
-        u = lt.get_element(topo, i)
-        du = mp.get(dist, u)
-        
-        adjs = gp.adjacents(graph, u)
-        
-        for j in range(lt.size(adjs)):
-            v = lt.get_element(adjs, j)
-            if du + 1 > mp.get(dist, v):
-                mp.put(dist, v, du + 1)
-                mp.put(prev, v, u)
-                   
-    maxv = None
-    maxd = 0
-    verts = gp.vertices(graph)
-    for i in range(lt.size(verts)):
-        v = lt.get_element(verts, i)
-        d = mp.get(dist, v)
-        if d > maxd:
-            maxd = d
-            maxv = v
-
-    if maxv is None:
-        return None
-    
-    rev = lt.new_list()
-    cur = maxv
-    while cur is not None:
-        lt.add_last(rev, cur)
-        cur = mp.get(prev, cur)
 
-    # invertir
-    path = lt.new_list()
-    for i in range(lt.size(rev)-1, -1, -1):
-        lt.add_last(path, lt.get_element(rev, i))
+def estadisticas_de_arcos(viajes, nodos):
+    """
+    Retorna un diccionario (id origen, id destino) → estadísticas del arco
+    (viajes y, para distancia y agua: promedio, mínimo, máximo y varianza)
+    a partir de acumuladores creados con estadisticas=True.
+    """
+    resultado = {}
+    for (u, v), acumulador in viajes.items():
+        fila = {"viajes": acumulador["conteo"]}
+        for campo in ("distancia", "agua"):
+            resumen = acumulador[campo]
+            fila[campo] = {
+                "promedio": acumulador["suma_" + campo] / acumulador["conteo"],
+                "min": resumen["min"],
+                "max": resumen["max"],
+                "varianza": varianza(resumen)
+            }
+        resultado[(nodos[u]["id"], nodos[v]["id"])] = fila
+    return resultado
 
-    return path
+
+def indexar_nodos(nodos):
+    """
+    Construye un mapa nodo-id → nodo a partir de la lista de nodos.
+    Se construye una sola vez en load_data y reemplaza las búsquedas
+    lineales por la lista de nodos.
+    """
+    indice = mp.new_map(lt.size(nodos), 0.5)
+    for i in range(lt.size(nodos)):
+        nodo = lt.get_element(nodos, i)
+        mp.put(indice, nodo["id"], nodo)
+    return indice
+
+def obtener_nodo(indice_nodos, nodo_id):
+    """
+    Retorna el nodo cuyo id coincide con nodo_id usando el índice de nodos.
+    Si no existe, retorna None.
+    """
+    return mp.get(indice_nodos, nodo_id)
 
 def cmp_subred(a, b):
     sa = a["total_nodos"]
@@ -483,168 +1016,57 @@ def cmp_subred(a, b):
     # Si empatan, ordenar por id_subred ascendente
     return a["id_subred"] < b["id_subred"]
 
-def inicializar_prim(vertices):
+def obtener_mst(grafo, origen):
     """
-    Crea e inicializa las estructuras usadas por Prim:
-    - marked: nodos visitados
-    - edge_from: mejor arista hacia cada nodo
-    - dist_to: distancia mínima conocida
+    Ejecuta Prim desde origen sobre los índices enteros del grafo, con una
+    cola de prioridad indexada y arreglos planos (ver
+    DataStructures/Graph/mst.py). Sigue el sentido de los arcos.
     """
-    n = lt.size(vertices)
-    marked = mp.new_map(n, 0.5)
-    edge_from = mp.new_map(n, 0.5)
-    dist_to = mp.new_map(n, 0.5)
+    return mst.prim_mst(grafo, origen)
 
-    for i in range(n):
-        v = lt.get_element(vertices, i)
-        mp.put(marked, v, False)
-        mp.put(edge_from, v, None)
-        mp.put(dist_to, v, float("inf"))
 
-    return marked, edge_from, dist_to
-
-
-def ejecutar_prim(grafo, origen, marked, edge_from, dist_to):
-    """
-    Ejecuta el algoritmo de Prim usando un priority queue.
-    Retorna las mismas estructuras modificadas.
+def construir_corredor(arbol, indice_nodos, nodo_origen):
     """
-    from DataStructures.Map import priority_queue as pq
-    heap = pq.new_heap(is_min_pq=True)
-
-    # Prioridad 0 para el origen
-    mp.put(dist_to, origen, 0)
-    pq.insert(heap, 0, origen)
-
-    while not pq.is_empty(heap):
-
-        u = pq.remove(heap)
+    Arma el corredor de req_4 a partir del árbol de Prim en una sola pasada:
 
-        # Si no está marcado, marcar y relajar adyacentes
-        if not mp.get(marked, u):
-            mp.put(marked, u, True)
-
-            vertex = gp.get_vertex(grafo, u)
-            if vertex is None:
-                continue
-
-            adjs = gp.adjacents(grafo, u)
-            for j in range(lt.size(adjs)):
-                v = lt.get_element(adjs, j)
-
-                if not mp.get(marked, v):
-
-                    edge = vtx.get_edge(vertex, v)
-                    if edge is None:
-                        continue
-
-                    peso = edge["weight"]
-
-                    if peso < mp.get(dist_to, v):
-                        mp.put(dist_to, v, peso)
-                        mp.put(edge_from, v, {"from": u, "to": v, "weight": peso})
-
-                        if pq.contains(heap, v):
-                            pq.improve_priority(heap, peso, v)
-                        else:
-                            pq.insert(heap, peso, v)
-
-    return marked, edge_from, dist_to
-
-def obtener_mst(grafo, origen, nodos):
-    vertices = gp.vertices(grafo)
-
-    marked, edge_from, dist_to = inicializar_prim(vertices)
-    marked, edge_from, dist_to = ejecutar_prim(grafo, origen, marked, edge_from, dist_to)
-
-    return marked, edge_from
-
-def construir_lista_mst(marked, edge_from, nodos, origen):
-    nodos_mst = lt.new_list()
-    distancia_total = 0.0
-
-    nodo_origen = buscar_nodo_por_id(nodos, origen)
-    lat_o = nodo_origen["lat"]
-    lon_o = nodo_origen["lon"]
-
-    claves = mp.key_set(marked)
-
-    for i in range(lt.size(claves)):
-        node_id = lt.get_element(claves, i)
-
-        if mp.get(marked, node_id):
-            nodo = buscar_nodo_por_id(nodos, node_id)
+    - Cada nodo del árbol se busca una sola vez en el índice de nodos.
+    - Las distancias Haversine al origen se calculan juntas
+      (hv.one_to_many) y los nodos se ordenan por distancia con sorted
+      (entre distancias iguales queda el orden del grafo).
+    - Las grullas únicas se cuentan con un set.
+    - Solo se arman las filas de detalle que se muestran: las primeras y
+      últimas FILAS_CORREDOR (todas si son a lo sumo 2 * FILAS_CORREDOR).
 
+    Retorna (total de puntos, total de individuos, detalles a mostrar).
+    """
+    marked = arbol["marked"]
+    keys = arbol["keys"]
+    nodos_corredor = []
+    for i in range(len(marked)):
+        if marked[i]:
+            nodo = obtener_nodo(indice_nodos, keys[i])
             if nodo is not None:
-                dist = haversine(lat_o, lon_o, nodo["lat"], nodo["lon"])
-                lt.add_last(nodos_mst, {"id": node_id, "distancia": dist})
-
-            if node_id != origen:
-                edge = mp.get(edge_from, node_id)
-                if edge is not None:
-                    distancia_total += edge["weight"]
-
-    return nodos_mst, distancia_total
-
-def ordenar_nodos_por_distancia(nodos_mst):
-    def cmp(n1, n2):
-        return n1["distancia"] <= n2["distancia"]
-
-    return lt.quick_sort(nodos_mst, cmp)
-
-
-def preparar_detalles(nodos_ordenados, nodos):
-    detalles = lt.new_list()
-
-    for i in range(lt.size(nodos_ordenados)):
-        nodo_con_dist = lt.get_element(nodos_ordenados, i)
-        nodo_id = nodo_con_dist["id"]
-        nodo = buscar_nodo_por_id(nodos, nodo_id)
-
-        if nodo is None:
-            lt.add_last(detalles, {
-                "id": "Unknown",
-                "lat": "Unknown",
-                "lon": "Unknown",
-                "num_grullas": "Unknown",
-                "first3": lt.new_list(),
-                "last3": lt.new_list()
-            })
-        else:
-            tags = nodo["grullas"]
-            gsize = lt.size(tags)
-
-            first3 = lt.new_list()
-            for j in range(min(3, gsize)):
-                lt.add_last(first3, lt.get_element(tags, j))
-
-            last3 = lt.new_list()
-            for j in range(max(0, gsize - 3), gsize):
-                lt.add_last(last3, lt.get_element(tags, j))
-
-            lt.add_last(detalles, {
-                "id": nodo["id"],
-                "lat": nodo["lat"],
-                "lon": nodo["lon"],
-                "num_grullas": gsize,
-                "first3": first3,
-                "last3": last3
-            })
-
-    return detalles
-
-def seleccionar_mostrar(detalles):
-    total = lt.size(detalles)
-    mostrar = lt.new_list()
-
-    if total <= 10:
-        for i in range(total):
-            lt.add_last(mostrar, lt.get_element(detalles, i))
+                nodos_corredor.append(nodo)
+
+    distancias = hv.one_to_many(nodo_origen["lat"], nodo_origen["lon"],
+                                [nodo["lat"] for nodo in nodos_corredor],
+                                [nodo["lon"] for nodo in nodos_corredor])
+    orden = sorted(range(len(nodos_corredor)), key=distancias.__getitem__)
+
+    individuos = set()
+    for nodo in nodos_corredor:
+        individuos.update(nodo["grullas"]["elements"])
+
+    total = len(orden)
+    detalles_mostrar = lt.new_list()
+    if total <= 2 * FILAS_CORREDOR:
+        for k in orden:
+            lt.add_last(detalles_mostrar, detalle_corredor(nodos_corredor[k]))
     else:
-        for i in range(5):
-            lt.add_last(mostrar, lt.get_element(detalles, i))
+        for k in orden[:FILAS_CORREDOR]:
+            lt.add_last(detalles_mostrar, detalle_corredor(nodos_corredor[k]))
 
-        lt.add_last(mostrar, {
+        lt.add_last(detalles_mostrar, {
             "id": "...",
             "lat": "...",
             "lon": "...",
@@ -653,54 +1075,38 @@ def seleccionar_mostrar(detalles):
             "last3": "..."
         })
 
-        for i in range(total - 5, total):
-            lt.add_last(mostrar, lt.get_element(detalles, i))
+        for k in orden[total - FILAS_CORREDOR:]:
+            lt.add_last(detalles_mostrar, detalle_corredor(nodos_corredor[k]))
 
-    return mostrar
+    return total, len(individuos), detalles_mostrar
 
-def contar_individuos(nodos_mst, nodos):
-    """
-    Cuenta el número total de individuos (grullas únicas) en los nodos del MST.
-    
-    Args:
-        nodos_mst: lista de nodos del MST (con estructura {"id": ..., "distancia": ...})
-        nodos: lista completa de nodos migratorios del catálogo
-    
-    Returns:
-        int: número total de individuos únicos
-    """
-    individuos = mp.new_map(5000, 0.5)
-    
-    for i in range(lt.size(nodos_mst)):
-        nodo_mst = lt.get_element(nodos_mst, i)
-        nodo_id = nodo_mst["id"]
-        
-        # Buscar el nodo completo
-        nodo = buscar_nodo_por_id(nodos, nodo_id)
-        
-        if nodo is not None:
-            # Registrar todas las grullas del nodo
-            grullas = nodo["grullas"]
-            for j in range(lt.size(grullas)):
-                grulla_id = lt.get_element(grullas, j)
-                mp.put(individuos, grulla_id, True)
-    
-    # Retornar el tamaño del mapa (grullas únicas)
-    return lt.size(mp.key_set(individuos))
 
-def obtener_nodos_dfs(grafo, origen):
+def detalle_corredor(nodo):
     """
-    Usa DFS para encontrar todos los nodos conectados desde un origen.
-    Retorna una lista con los IDs de los nodos.
+    Fila de detalle de un nodo del corredor: ubicación, número de grullas y
+    las primeras y últimas 3 grullas.
     """
-    # DFS dado por la estructura
-    resultado_dfs = DFS.dfs(grafo, origen)
-    mapa_visitados = resultado_dfs["marked"]
-    
-    # Extraemos las llaves (IDs de nodos) del mapa
-    lista_ids = mp.key_set(mapa_visitados)
-    return lista_ids
-def calcular_estadisticas_subred(id_subred, lista_ids, catalogo_nodos):
+    tags = nodo["grullas"]
+    gsize = lt.size(tags)
+
+    first3 = lt.new_list()
+    for j in range(min(3, gsize)):
+        lt.add_last(first3, lt.get_element(tags, j))
+
+    last3 = lt.new_list()
+    for j in range(max(0, gsize - 3), gsize):
+        lt.add_last(last3, lt.get_element(tags, j))
+
+    return {
+        "id": nodo["id"],
+        "lat": nodo["lat"],
+        "lon": nodo["lon"],
+        "num_grullas": gsize,
+        "first3": first3,
+        "last3": last3
+    }
+
+def calcular_estadisticas_subred(id_subred, lista_ids, indice_nodos):
     """
     Procesa una lista de IDs de nodos para calcular:
     - Rangos de Lat/Lon
@@ -712,13 +1118,15 @@ def calcular_estadisticas_subred(id_subred, lista_ids, catalogo_nodos):
     min_lat, max_lat = 1000.0, -1000.0
     min_lon, max_lon = 1000.0, -1000.0
     
-    mapa_grullas = mp.new_map(5000, 0.5)
+    # el mapa crece si hace falta: se dimensiona por la subred para que las
+    # subredes pequeñas no reserven una tabla grande
+    mapa_grullas = mp.new_map(total_nodos_ids + 1, 0.5)
     detalles_nodos = lt.new_list() 
     
     # Recorremos todos los nodos de la subred
     for i in range(total_nodos_ids):
         nid = lt.get_element(lista_ids, i)
-        nodo = buscar_nodo_por_id(catalogo_nodos, nid)
+        nodo = obtener_nodo(indice_nodos, nid)
         
         if nodo is not None:
             # Actualizar coordenadas extremas
@@ -792,38 +1200,107 @@ def calcular_estadisticas_subred(id_subred, lista_ids, catalogo_nodos):
         "ultimas_grullas": ultimas_3_grullas
     }
 
-def buscar_nodo_mas_cercano(nodos, lat_user, lon_user):
+def indexar_ubicaciones(nodos):
+    """
+    Crea el árbol k-d con la ubicación de cada nodo; la posición de cada
+    punto en el árbol es la posición del nodo en la lista.
+    """
+    lats = [nodo["lat"] for nodo in nodos["elements"]]
+    lons = [nodo["lon"] for nodo in nodos["elements"]]
+    return kd.new_kd_tree(lats, lons)
+
+
+def indexar_rejilla(nodos):
+    """
+    Crea la rejilla (sin ventanas de tiempo) con la posición de cada nodo,
+    para las consultas por radio de nodes_within.
+    """
+    max_lat = 0.0
+    for nodo in nodos["elements"]:
+        max_lat = max(max_lat, abs(nodo["lat"]))
+
+    rejilla = gi.new_grid_index(CELDA_CONSULTA_KM, max_lat)
+    for i, nodo in enumerate(nodos["elements"]):
+        gi.insert(rejilla, nodo["lat"], nodo["lon"], None, i)
+    return rejilla
+
+
+def posiciones_en_radio(catalog, lat, lon, radius_km):
+    """
+    Retorna las posiciones (en orden creciente) de los nodos a una distancia
+    Haversine menor o igual a radius_km de (lat, lon).
+    """
+    nodos = catalog["nodos"]["elements"]
+    candidatos = gi.candidates_within(catalog["rejilla_nodos"], lat, lon, radius_km)
+    distancias = hv.one_to_many(lat, lon,
+                                [nodos[i]["lat"] for i in candidatos],
+                                [nodos[i]["lon"] for i in candidatos])
+
+    posiciones = []
+    for k, i in enumerate(candidatos):
+        if distancias[k] <= radius_km:
+            posiciones.append(i)
+    return posiciones
+
+
+def nodes_within(catalog, lat, lon, radius_km):
+    """
+    Retorna una lista con los ids de los nodos a una distancia Haversine
+    menor o igual a radius_km de (lat, lon), en el orden de la lista de
+    nodos.
+
+    Solo se calcula la distancia exacta para los nodos de las celdas de la
+    rejilla que alcanzan el círculo, no para todos los nodos.
+    """
+    nodos = catalog["nodos"]
+    ids = lt.new_list()
+    for i in posiciones_en_radio(catalog, lat, lon, radius_km):
+        lt.add_last(ids, lt.get_element(nodos, i)["id"])
+    return ids
+
+
+def buscar_nodo_mas_cercano(nodos, lat_user, lon_user, arbol=None):
     """
     Retorna el ID del nodo cuya ubicación (lat/lon)
     es la más cercana al punto GPS dado por el usuario.
 
+    Con el árbol k-d del catálogo (arbol) la búsqueda no recorre todos los
+    nodos y da el mismo resultado que el recorrido lineal: si hay empate gana
+    el primer nodo de la lista.
+
     Args:
         nodos (array_list): nodos migratorios.
         lat_user, lon_user (float): coordenadas del usuario.
+        arbol (kd_tree): árbol k-d de ubicaciones de los nodos (opcional).
 
     Returns:
         str: id del nodo más cercano.
     """
+    if arbol is not None and kd.size(arbol) == lt.size(nodos):
+        pos = kd.nearest(arbol, lat_user, lon_user, haversine)
+        if pos == -1:
+            return None
+        return lt.get_element(nodos, pos)["id"]
+
     mejor_id = None
     mejor_dist = 999999999
 
-    N = lt.size(nodos)
+    lats = [nodo["lat"] for nodo in nodos["elements"]]
+    lons = [nodo["lon"] for nodo in nodos["elements"]]
+    distancias = hv.one_to_many(lat_user, lon_user, lats, lons)
 
-    for i in range(N):
-        nodo = lt.get_element(nodos, i)
-        lat = nodo["lat"]
-        lon = nodo["lon"]
-
-        d = haversine(lat, lon, lat_user, lon_user)
-        if d < mejor_dist:
-            mejor_dist = d
-            mejor_id = nodo["id"]
+    for i in range(lt.size(nodos)):
+        if distancias[i] < mejor_dist:
+            mejor_dist = distancias[i]
+            mejor_id = lt.get_element(nodos, i)["id"]
 
     return mejor_id
 
 def bfs_camino(grafo, origen, destino):
     """
-    BFS estándar para obtener el camino desde origen hasta destino.
+    BFS bidireccional para obtener el camino con menos arcos desde origen
+    hasta destino: avanza desde el origen por los arcos del grafo y desde el
+    destino por el grafo invertido, así explora una región mucho menor.
 
     Args:
         grafo: grafo dirigido.
@@ -834,54 +1311,14 @@ def bfs_camino(grafo, origen, destino):
         lista (array_list) con los ids del camino en orden.
         Si no existe camino, retorna None.
     """
-    # cola FIFO
-    cola = lt.new_list()
-    # mapa de visitados
-    visitados = mp.new_map(20000, 0.5)
-    # mapa para guardar padre de cada nodo
-    padre = mp.new_map(20000, 0.5)
-
-    lt.add_last(cola, origen)
-    mp.put(visitados, origen, True)
-    mp.put(padre, origen, None)
-
-    pos = 0
-    while pos < lt.size(cola):
-        actual = lt.get_element(cola, pos)
-
-        if actual == destino:
-            break
-
-        adjs = gp.adjacents(grafo, actual)
-        size_adj = lt.size(adjs)
-
-        for i in range(size_adj):
-            nxt = lt.get_element(adjs, i)
-
-            if not mp.contains(visitados, nxt):
-                mp.put(visitados, nxt, True)
-                mp.put(padre, nxt, actual)
-                lt.add_last(cola, nxt)
-
-        pos += 1
-
-    # Si destino no fue visitado, no existe camino
-    if not mp.contains(visitados, destino):
+    busqueda = bd.bidirectional_bfs(grafo, origen, destino)
+    if not bd.has_path_to(destino, busqueda):
         return None
 
-    # Reconstruir camino desde destino → origen
-    rev = lt.new_list()
-    cur = destino
-
-    while cur is not None:
-        lt.add_last(rev, cur)
-        cur = mp.get(padre, cur)
-
-    # Invertir la lista
     path = lt.new_list()
-    for i in range(lt.size(rev)-1, -1, -1):
-        lt.add_last(path, lt.get_element(rev, i))
-
+    pila = bd.path_to(destino, busqueda)
+    while not st.is_empty(pila):
+        lt.add_last(path, st.pop(pila))
     return path
 
 def get_edge_weight(my_graph, u, v):
@@ -889,26 +1326,25 @@ def get_edge_weight(my_graph, u, v):
     Retorna el peso de la arista u -> v usando la estructura real del grafo.
     Si no existe, retorna None.
     """
-    vertex_u = gp.get_vertex(my_graph, u)
-    if vertex_u is None:
-        return None
-
-    adj = vertex_u["adjacents"]      # Mapa de adyacencias
-    edge = mp.get(adj, v)           # Recuperamos el arco exacto
+    edge = gp.get_edge(my_graph, u, v)
 
     if edge is None:
         return None
 
     return edge["weight"]
 
-def ultimo_nodo_en_radio(camino, nodos, nodo_origen, radio_km):
+def ultimo_nodo_en_radio(camino, catalog, nodo_origen, radio_km):
     """
     Dado un camino (lista de nodos) halla el último nodo
     cuya distancia respecto del nodo de origen esté dentro del radio.
 
+    Los nodos dentro del radio se obtienen una sola vez con nodes_within y
+    el camino se recorre desde el final hasta el primer nodo que esté en
+    ese conjunto.
+
     Args:
         camino: lista con los ids del camino.
-        nodos: lista completa de nodos migratorios.
+        catalog: catálogo (índice de nodos y rejilla de ubicaciones).
         nodo_origen: id del nodo de origen.
         radio_km: distancia de interés.
 
@@ -916,37 +1352,18 @@ def ultimo_nodo_en_radio(camino, nodos, nodo_origen, radio_km):
         id del último nodo en el área.
         Si ninguno califica → devuelve el origen mismo.
     """
-    origen_real = buscar_nodo_por_id(nodos, nodo_origen)
+    origen_real = obtener_nodo(catalog["indice_nodos"], nodo_origen)
     lat0, lon0 = origen_real["lat"], origen_real["lon"]
 
-    ultimo = nodo_origen
+    en_radio = set(nodes_within(catalog, lat0, lon0, radio_km)["elements"])
 
-    for i in range(lt.size(camino)):
+    for i in range(lt.size(camino) - 1, -1, -1):
         nid = lt.get_element(camino, i)
-        nodo = buscar_nodo_por_id(nodos, nid)
-
-        if nodo is None:
-            continue
-
-        d = haversine(lat0, lon0, nodo["lat"], nodo["lon"])
-        if d <= radio_km:
-            ultimo = nid
-
-    return ultimo
-
-
-def nodos_en_radio(nodos, origen_info, radio_km):
-    lista = lt.new_list()
-
-    for i in range(lt.size(nodos)):
-        nd = lt.get_element(nodos, i)
+        if nid in en_radio:
+            return nid
 
-        d = haversine(origen_info["lat"], origen_info["lon"], nd["lat"], nd["lon"])
+    return nodo_origen
 
-        if d <= radio_km:
-            lt.add_last(lista, nd["id"])
-
-    return lista
 
 # Funciones de consulta sobre el catálogo
 def req_1(catalog, lat_o, lon_o, lat_d, lon_d, crane_id):
@@ -955,19 +1372,15 @@ def req_1(catalog, lat_o, lon_o, lat_d, lon_d, crane_id):
     Usa DFS y los pesos de arcos del grafo para calcular distancias.
     """
     nodos = catalog["nodos"]
+    indice_nodos = catalog["indice_nodos"]
     grafo = catalog["grafo_1"]
     
     # 1. Encontrar nodos más cercanos usando función auxiliar
-    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o)
-    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d)
+    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o, catalog["arbol_nodos"])
+    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d, catalog["arbol_nodos"])
     
-    # 2. Buscar nodo de origen por ID y verificar grulla (inline)
-    nodo_origen_obj = None
-    for i in range(lt.size(nodos)):
-        nodo = lt.get_element(nodos, i)
-        if nodo["id"] == origen:
-            nodo_origen_obj = nodo
-            break
+    # 2. Buscar nodo de origen por ID y verificar grulla
+    nodo_origen_obj = obtener_nodo(indice_nodos, origen)
     
     if nodo_origen_obj is None:
         return {
@@ -992,9 +1405,13 @@ def req_1(catalog, lat_o, lon_o, lat_d, lon_d, crane_id):
             "destino": destino,
             "grulla": crane_id
         }
-    dfs_result = DFS.dfs(grafo, origen)
-    
-    if not DFS.has_path_to(destino, dfs_result):
+    # nodos en conjuntos distintos: no hay camino y no hace falta el DFS
+    if hay_conexion(catalog, origen, destino):
+        dfs_result = DFS.dfs_iterative(grafo, origen)
+    else:
+        dfs_result = None
+
+    if dfs_result is None or not DFS.has_path_to(destino, dfs_result):
         return {
             "mensaje": f"No existe un camino viable desde {origen} hasta {destino}.",
             "origen": origen,
@@ -1013,7 +1430,7 @@ def req_1(catalog, lat_o, lon_o, lat_d, lon_d, crane_id):
     detalles_completos = lt.new_list()
     for i in range(total_puntos):
         node_id = lt.get_element(camino, i)
-        nodo_actual = buscar_nodo_por_id(nodos, node_id)
+        nodo_actual = obtener_nodo(indice_nodos, node_id)
         
         if nodo_actual is None:
             lt.add_last(detalles_completos, {
@@ -1043,13 +1460,11 @@ def req_1(catalog, lat_o, lon_o, lat_d, lon_d, crane_id):
         dist_sig = "END"
         if i < total_puntos - 1:
             next_id = lt.get_element(camino, i + 1)
-            vertex = gp.get_vertex(grafo, node_id)
-            if vertex is not None:
-                edge = vtx.get_edge(vertex, next_id)
-                if edge is not None:
-                    peso_arco = edge["weight"]
-                    dist_sig = round(peso_arco,4)
-                    total_distancia += peso_arco
+            edge = gp.get_edge(grafo, node_id, next_id)
+            if edge is not None:
+                peso_arco = edge["weight"]
+                dist_sig = round(peso_arco,4)
+                total_distancia += peso_arco
         
         lt.add_last(detalles_completos, {
             "id": nodo_actual["id"],
@@ -1124,11 +1539,12 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
     
     # Obtener estructuras del catálogo
     nodos = catalog["nodos"]
+    indice_nodos = catalog["indice_nodos"]
     grafo = catalog["grafo_1"]  # Grafo de distancias de desplazamiento
 
     # PASO 1: Encontrar nodos migratorios más cercanos (Haversine)
-    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o)
-    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d)
+    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o, catalog["arbol_nodos"])
+    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d, catalog["arbol_nodos"])
 
     # Validar que se encontraron nodos válidos
     if origen is None or destino is None:
@@ -1138,8 +1554,11 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
             "destino": destino
         }
 
-    # PASO 2: Ejecutar BFS para encontrar camino más corto
-    camino = bfs_camino(grafo, origen, destino)
+    # PASO 2: Ejecutar BFS para encontrar camino más corto (si los nodos
+    # están en conjuntos distintos no hay camino y no hace falta buscar)
+    camino = None
+    if hay_conexion(catalog, origen, destino):
+        camino = bfs_camino(grafo, origen, destino)
 
     # Validar que existe un camino viable
     if camino is None:
@@ -1152,7 +1571,7 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
     total_puntos = lt.size(camino)
 
     # PASO 3: Identificar último nodo dentro del radio de interés
-    ultimo_radio = ultimo_nodo_en_radio(camino, nodos, origen, radio_km)
+    ultimo_radio = ultimo_nodo_en_radio(camino, catalog, origen, radio_km)
 
     # PASO 4: Calcular distancia total usando PESOS DE ARCOS del grafo
     
@@ -1169,8 +1588,8 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
             total_distancia += peso_arco
         else:
             # Si no existe arco (caso extraño), usar Haversine como fallback
-            na = buscar_nodo_por_id(nodos, nodo_actual)
-            nb = buscar_nodo_por_id(nodos, nodo_siguiente)
+            na = obtener_nodo(indice_nodos, nodo_actual)
+            nb = obtener_nodo(indice_nodos, nodo_siguiente)
             if na is not None and nb is not None:
                 total_distancia += haversine(na["lat"], na["lon"], nb["lat"], nb["lon"])
 
@@ -1180,7 +1599,7 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
 
     for i in range(total_puntos):
         nid = lt.get_element(camino, i)
-        nodo = buscar_nodo_por_id(nodos, nid)
+        nodo = obtener_nodo(indice_nodos, nid)
 
         # Manejar caso de nodo no encontrado
         if nodo is None:
@@ -1224,7 +1643,7 @@ def req_2(catalog, lat_o, lon_o, lat_d, lon_d, radio_km):
                 dist_next = peso_arco
             else:
                 # Fallback: calcular Haversine si no existe arco
-                nodo2 = buscar_nodo_por_id(nodos, nxt)
+                nodo2 = obtener_nodo(indice_nodos, nxt)
                 if nodo2 is not None:
                     dist_next = haversine(nodo["lat"], nodo["lon"], 
                                          nodo2["lat"], nodo2["lon"])
@@ -1311,27 +1730,56 @@ def req_3(catalog):
     - Saca el camino más largo (por # de nodos)
     - Calcula individuos totales
     - Extrae 5 primeros y 5 últimos nodos
+
+    Los grafos reales casi nunca son DAG (las grullas vuelven a nodos ya
+    visitados, A→B→A), así que cada ciclo (componente fuertemente conectado)
+    se colapsa en un solo nodo con peso igual a su número de nodos y el
+    camino más largo se busca en el DAG de componentes
+    (DataStructures/Graph/longest_path.py). Se reportan los ciclos
+    colapsados en todo el grafo y los que forman parte de la ruta. Dentro
+    de cada ciclo la ruta es un recorrido por arcos que pasa por todos sus
+    nodos, así que entre dos puntos consecutivos siempre hay un arco (y un
+    nodo del ciclo puede aparecer más de una vez). Si el grafo es un DAG el
+    resultado es el camino más largo usual.
     """
     # Obtener el camino más largo
     grafo = catalog["grafo_1"]
-    nodos = catalog["nodos"]
+    indice_nodos = catalog["indice_nodos"]
     
-    camino = longest_path_in_dag(grafo)
-    if camino is None:
+    resultado = lp.longest_path(grafo)
+    if resultado is None:
         return {
-            "mensaje": "El grafo no es un DAG o no tiene camino válido."
+            "mensaje": "El grafo no tiene nodos."
         }
-    total_puntos = lt.size(camino)
+
+    camino = lt.new_list()
+    for nid in resultado["path"]:
+        lt.add_last(camino, nid)
+
+    # ciclos colapsados que forman parte de la ruta: tamano es el número de
+    # nodos del ciclo y nodos el recorrido por arcos que hace la ruta dentro
+    # de él (puede repetir nodos)
+    ciclos_ruta = lt.new_list()
+    for ciclo in resultado["cycles"]:
+        nodos_ciclo = lt.new_list()
+        for nid in ciclo:
+            lt.add_last(nodos_ciclo, nid)
+        lt.add_last(ciclos_ruta, {"tamano": len(set(ciclo)), "nodos": nodos_ciclo})
+
+    # total_puntos cuenta los nodos distintos de la ruta; total_pasos los
+    # puntos del recorrido, con las repeticiones dentro de los ciclos
+    total_puntos = len(set(resultado["path"]))
+    total_pasos = lt.size(camino)
     individuos = mp.new_map(40000, 0.5)
     
     # Lista donde guardaremos los detalles finales de cada nodo
     detalles = lt.new_list()
     
     # Recorremos el camino
-    for i in range(total_puntos):
+    for i in range(total_pasos):
         nid = lt.get_element(camino, i)
 
-        nodo = buscar_nodo_por_id(nodos, nid)
+        nodo = obtener_nodo(indice_nodos, nid)
 
         grullas = nodo["grullas"]
         
@@ -1351,7 +1799,7 @@ def req_3(catalog):
             inicio_last = gsize - 3  
         else:
             limite_first = gsize
-            limite_first = 0
+            inicio_last = 0
             
         # primeras 3
         for f in range(limite_first):
@@ -1367,14 +1815,14 @@ def req_3(catalog):
         # nodo previo
         if i > 0:
             prev_id = lt.get_element(camino, i - 1)
-            prev = buscar_nodo_por_id(nodos, prev_id)
+            prev = obtener_nodo(indice_nodos, prev_id)
             if prev is not None:
                 dist_prev = haversine(nodo["lat"], nodo["lon"], prev["lat"], prev["lon"])
 
         # nodo siguiente
-        if i < total_puntos - 1:
+        if i < total_pasos - 1:
             next_id = lt.get_element(camino, i + 1)
-            nxt = buscar_nodo_por_id(nodos, next_id)
+            nxt = obtener_nodo(indice_nodos, next_id)
             if nxt is not None:
                 dist_next = haversine(nodo["lat"], nodo["lon"], nxt["lat"], nxt["lon"])
             
@@ -1415,36 +1863,120 @@ def req_3(catalog):
     
     return {
         "total_puntos": total_puntos,
+        "total_pasos": total_pasos,
         "total_individuos": total_ind,
         "primeros_5": primeros_5,
-        "ultimos_5": ultimo_5
+        "ultimos_5": ultimo_5,
+        "ciclos_colapsados": resultado["collapsed"],
+        "ciclos_en_ruta": ciclos_ruta
     }
     
 def req_4(catalog, lat_o, lon_o):
     nodos = catalog["nodos"]
+    indice_nodos = catalog["indice_nodos"]
     grafo = catalog["grafo_2"]
-    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o)
-    nodo_origen = buscar_nodo_por_id(nodos, origen)
+    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o, catalog["arbol_nodos"])
+    nodo_origen = obtener_nodo(indice_nodos, origen)
     if nodo_origen is None:
         return {"mensaje": f"El nodo {origen} no existe.", "origen": origen}
-    marked, edge_from = obtener_mst(grafo, origen, nodos)
-    nodos_mst_temp, dist_total = construir_lista_mst(marked, edge_from, nodos, origen)
-    nodos_ordenados = ordenar_nodos_por_distancia(nodos_mst_temp)
-    total_individuos = contar_individuos(nodos_ordenados, nodos)
-    detalles = preparar_detalles(nodos_ordenados, nodos)
-    detalles_mostrar = seleccionar_mostrar(detalles)
+    arbol = obtener_mst(grafo, origen)
+    total_puntos, total_individuos, detalles_mostrar = construir_corredor(
+        arbol, indice_nodos, nodo_origen)
 
     return {
         "mensaje": f"Corredor hídrico construido desde el origen {origen}.",
         "origen": origen,
-        "total_puntos": lt.size(nodos_ordenados),
+        "total_puntos": total_puntos,
         "total_individuos": total_individuos,
-        "distancia_total_agua": dist_total,
+        "distancia_total_agua": arbol["weight"],
         "detalles_mostrar": detalles_mostrar
     }
 
 
-def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
+def camino_por_distancia(catalog, origen, destino):
+    """
+    Camino de menor distancia en grafo_1 entre dos nodos, con A*.
+
+    Los pesos de grafo_1 son promedios de la distancia entre los registros
+    consecutivos de cada viaje, no la distancia entre los nodos, así que
+    Haversine hasta el destino puede sobreestimar lo que falta y no sirve
+    como heurística. Se usa astar.landmark_heuristic, que solo usa las
+    distancias del propio grafo hacia y desde los nodos de referencia
+    (preparar_astar) y nunca sobreestima. Además descarta sin recorrerlos
+    los nodos desde los que se prueba que no se llega al destino.
+
+    Retorna una búsqueda con la forma de dijsktra.dijkstra_to.
+    Si origen o destino no son vértices de grafo_1 lanza una excepción,
+    igual que astar.astar_to.
+    """
+    grafo = catalog["grafo_1"]
+    heuristica = astar.landmark_heuristic(grafo, destino, REFERENCIAS_ASTAR)
+    return astar.astar_to(grafo, origen, destino, heuristica)
+
+
+def grafo_req_5(tipo):
+    """
+    Retorna (nombre del grafo, descripción) según el tipo de optimización
+    de req_5, o None si el tipo no es válido.
+    """
+    if tipo.lower() == "distancia":
+        # Grafo de distancias de desplazamiento
+        return "grafo_1", "distancia de desplazamiento"
+    if tipo.lower() in ["hidrico", "agua", "hídrico"]:
+        # Grafo de proximidad a fuentes hídricas
+        return "grafo_2", "proximidad a fuentes hídricas"
+    return None
+
+
+def arbol_de_caminos(catalog, nombre_grafo, origen):
+    """
+    Retorna el árbol de caminos más cortos (dijsktra.dijkstra_tree) desde
+    origen en el grafo nombre_grafo del catálogo.
+
+    Los árboles se guardan en el cache LRU del catálogo con la llave
+    (nombre_grafo, origen), así las consultas repetidas desde el mismo
+    origen no repiten la búsqueda. El cache se vacía cada vez que se
+    construyen los grafos (construir_grafos, restaurar_catalogo) y no se
+    guarda en el snapshot.
+    """
+    cache = catalog["cache_caminos"]
+    clave = (nombre_grafo, origen)
+    arbol = lru.get(cache, clave)
+    if arbol is None:
+        arbol = dk.dijkstra_tree(catalog[nombre_grafo], origen)
+        lru.put(cache, clave, arbol)
+    return arbol
+
+
+def busqueda_req_5(catalog, nombre_grafo, origen, destino, usar_cache=True):
+    """
+    Búsqueda de req_5 de origen a destino en el grafo nombre_grafo.
+
+    La primera consulta desde un origen es punto a punto y se detiene al
+    llegar al destino: por distancia A* con nodos de referencia (ver
+    camino_por_distancia), por agua Dijkstra bidireccional (desde el origen
+    y desde el destino sobre el grafo invertido). Con usar_cache=True el
+    origen queda anotado en "origenes_vistos" y, si se vuelve a consultar,
+    se calcula y se guarda su árbol de caminos (arbol_de_caminos) para
+    responder esa y las siguientes consultas sin buscar. Con
+    usar_cache=False siempre se busca punto a punto y no se guarda nada.
+    """
+    if usar_cache:
+        clave = (nombre_grafo, origen)
+        if lru.contains(catalog["cache_caminos"], clave):
+            return arbol_de_caminos(catalog, nombre_grafo, origen)
+        vistos = catalog["origenes_vistos"]
+        if lru.contains(vistos, clave):
+            lru.remove(vistos, clave)
+            return arbol_de_caminos(catalog, nombre_grafo, origen)
+        lru.put(vistos, clave, True)
+
+    if nombre_grafo == "grafo_1":
+        return camino_por_distancia(catalog, origen, destino)
+    return bd.bidirectional_dijkstra(catalog[nombre_grafo], origen, destino)
+
+
+def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo, usar_cache=True):
     """
     Identificar la ruta migratoria más eficiente entre dos puntos.
     
@@ -1452,6 +1984,11 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
     de costo mínimo entre dos puntos migratorios. El usuario puede elegir
     entre optimizar por distancia de desplazamiento o por proximidad a
     fuentes hídricas.
+
+    La búsqueda es punto a punto; solo los orígenes que se consultan más de
+    una vez usan el árbol de caminos guardado en el cache del catálogo (ver
+    busqueda_req_5). Con usar_cache=False nunca se usa ni se guarda un
+    árbol. Para muchos pares a la vez ver req_5_lote.
     
     Args:
         catalog (dict): Catálogo con nodos y grafos del sistema.
@@ -1460,6 +1997,7 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
         lat_d (float): Latitud del punto de destino.
         lon_d (float): Longitud del punto de destino.
         tipo (str): Tipo de optimización - "distancia" o "hidrico"/"agua"
+        usar_cache (bool): Reutilizar árboles de caminos de orígenes repetidos.
     
     Returns:
         dict: Diccionario con el camino óptimo y sus características.
@@ -1467,24 +2005,20 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
     
     # Obtener estructuras del catálogo
     nodos = catalog["nodos"]
-    
 
     # PASO 1: Seleccionar grafo según tipo de optimización
-    if tipo.lower() == "distancia":
-        grafo = catalog["grafo_1"]  # Grafo de distancias de desplazamiento
-        tipo_texto = "distancia de desplazamiento"
-    elif tipo.lower() in ["hidrico", "agua", "hídrico"]:
-        grafo = catalog["grafo_2"]  # Grafo de proximidad a fuentes hídricas
-        tipo_texto = "proximidad a fuentes hídricas"
-    else:
+    seleccion = grafo_req_5(tipo)
+    if seleccion is None:
         return {
             "mensaje": f"Tipo de grafo no válido: '{tipo}'. Use 'distancia' o 'hidrico'.",
             "tipo_solicitado": tipo
         }
+    nombre_grafo, tipo_texto = seleccion
+    grafo = catalog[nombre_grafo]
     
     # PASO 2: Encontrar nodos migratorios más cercanos (Haversine)
-    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o)
-    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d)
+    origen = buscar_nodo_mas_cercano(nodos, lat_o, lon_o, catalog["arbol_nodos"])
+    destino = buscar_nodo_mas_cercano(nodos, lat_d, lon_d, catalog["arbol_nodos"])
     
     # Validar que se encontraron nodos válidos
     if origen is None or destino is None:
@@ -1496,18 +2030,120 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
         }
     
 
-    # PASO 3: Ejecutar algoritmo de Dijkstra desde el origen
-    
-    search_result = dk.dijkstra(grafo, origen)
+    # PASO 3: Búsqueda punto a punto, o árbol de caminos si el origen se
+    # repite (ver busqueda_req_5)
     
+    if not hay_conexion(catalog, origen, destino):
+        return sin_camino_req_5(origen, destino, tipo_texto)
+    search_result = busqueda_req_5(catalog, nombre_grafo, origen, destino, usar_cache)
+
+    return resultado_req_5(catalog, grafo, origen, destino, search_result, tipo_texto)
+
+
+def req_5_lote(catalog, pares, tipo):
+    """
+    req_5 para muchos pares de puntos a la vez.
+
+    Cada punto se ubica en su nodo más cercano una sola vez y los pares se
+    agrupan por nodo de origen: se hace una sola búsqueda (árbol de caminos,
+    ver arbol_de_caminos) por cada origen distinto y con ella se responden
+    todos los destinos del grupo.
+
+    Args:
+        catalog (dict): Catálogo con nodos y grafos del sistema.
+        pares (list): Tuplas (lat_o, lon_o, lat_d, lon_d).
+        tipo (str): Tipo de optimización - "distancia" o "hidrico"/"agua"
+
+    Returns:
+        array_list: Un resultado por par, en el mismo orden, igual al de req_5.
+    """
+    resultados = lt.new_list()
+    seleccion = grafo_req_5(tipo)
+    if seleccion is None:
+        for _ in pares:
+            lt.add_last(resultados, {
+                "mensaje": f"Tipo de grafo no válido: '{tipo}'. Use 'distancia' o 'hidrico'.",
+                "tipo_solicitado": tipo
+            })
+        return resultados
+    nombre_grafo, tipo_texto = seleccion
+    grafo = catalog[nombre_grafo]
+    nodos = catalog["nodos"]
+    arbol = catalog["arbol_nodos"]
+
+    # ubicar cada punto distinto una sola vez
+    ubicados = {}
+
+    def ubicar(lat, lon):
+        if (lat, lon) not in ubicados:
+            ubicados[(lat, lon)] = buscar_nodo_mas_cercano(nodos, lat, lon, arbol)
+        return ubicados[(lat, lon)]
+
+    # posiciones de los pares agrupadas por nodo de origen
+    grupos = {}
+    extremos = []
+    for lat_o, lon_o, lat_d, lon_d in pares:
+        origen = ubicar(lat_o, lon_o)
+        destino = ubicar(lat_d, lon_d)
+        extremos.append((origen, destino))
+        if origen is not None and destino is not None:
+            grupos.setdefault(origen, []).append(len(extremos) - 1)
+
+    respuestas = [None] * len(extremos)
+    # los pares sin conexión se responden sin buscar; un origen sin ningún
+    # destino conectado no necesita su árbol de caminos
+    for origen in list(grupos):
+        conectadas = []
+        for pos in grupos[origen]:
+            if hay_conexion(catalog, origen, extremos[pos][1]):
+                conectadas.append(pos)
+            else:
+                respuestas[pos] = sin_camino_req_5(origen, extremos[pos][1], tipo_texto)
+        if conectadas:
+            grupos[origen] = conectadas
+        else:
+            del grupos[origen]
+
+    for origen, posiciones in grupos.items():
+        search_result = arbol_de_caminos(catalog, nombre_grafo, origen)
+        for pos in posiciones:
+            respuestas[pos] = resultado_req_5(catalog, grafo, origen, extremos[pos][1],
+                                              search_result, tipo_texto)
+
+    for pos, (origen, destino) in enumerate(extremos):
+        if respuestas[pos] is None:
+            respuestas[pos] = {
+                "mensaje": "No se encontraron puntos migratorios cercanos.",
+                "origen": origen,
+                "destino": destino,
+                "tipo": tipo
+            }
+        lt.add_last(resultados, respuestas[pos])
+    return resultados
+
+
+def sin_camino_req_5(origen, destino, tipo_texto):
+    """
+    Respuesta de req_5 cuando no existe camino de origen a destino.
+    """
+    return {
+        "mensaje": "No existe camino viable entre los puntos especificados.",
+        "origen": origen,
+        "destino": destino,
+        "tipo": tipo_texto
+    }
+
+
+def resultado_req_5(catalog, grafo, origen, destino, search_result, tipo_texto):
+    """
+    Arma la respuesta de req_5 para el camino de origen a destino según la
+    búsqueda search_result (cualquier búsqueda que acepte dijsktra.path_to).
+    """
+    indice_nodos = catalog["indice_nodos"]
+
     # PASO 4: Verificar si existe camino al destino
     if not dk.has_path_to(destino, search_result):
-        return {
-            "mensaje": "No existe camino viable entre los puntos especificados.",
-            "origen": origen,
-            "destino": destino,
-            "tipo": tipo_texto
-        }
+        return sin_camino_req_5(origen, destino, tipo_texto)
     
     # PASO 5: Recuperar camino desde stack de Dijkstra
     stack_camino = dk.path_to(destino, search_result)
@@ -1528,7 +2164,7 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
     
     for i in range(total_puntos):
         nid = lt.get_element(camino, i)
-        nodo = buscar_nodo_por_id(nodos, nid)
+        nodo = obtener_nodo(indice_nodos, nid)
         
         # Manejar caso de nodo no encontrado
         if nodo is None:
@@ -1633,42 +2269,50 @@ def req_5(catalog, lat_o, lon_o, lat_d, lon_d, tipo):
         "detalles_mostrar": detalles_para_mostrar,
         "detalles_completos": detalles_completos  
     }
-def req_6(catalog):
+def req_6(catalog, modo):
     """
     Identifica grupos hídricos aislados (subredes).
     Retorna un diccionario con el total y la lista de subredes ordenada.
+
+    Las subredes son los componentes de grafo_2; el modo es obligatorio
+    porque los dos dan resultados muy distintos (en los datos incluidos hay
+    un solo componente débil y cientos de fuertes):
+
+    - modo="debil": nodos unidos por algún camino sin
+      importar el sentido de los arcos. Son los conjuntos de
+      catalog["conectividad"], que ya están construidos desde la carga.
+    - modo="fuerte": nodos que se alcanzan mutuamente siguiendo los arcos,
+      calculados en una sola pasada O(V + E)
+      (DataStructures/Graph/components.py).
+
+    Los componentes se numeran por su primer nodo en el grafo, así el
+    resultado no depende del orden del recorrido; los nodos de cada subred
+    van en el orden del grafo.
     """
     grafo = catalog["grafo_2"] # Grafo de proximidad hídrica
-    nodos_global = catalog["nodos"]
-    vertices = gp.vertices(grafo)
-    num_vertices = lt.size(vertices)
-    visitados_global = mp.new_map(num_vertices + 100, 0.5)
+    indice_nodos = catalog["indice_nodos"]
+
+    if modo == "debil":
+        # los conjuntos de catalog["conectividad"] son exactamente los
+        # componentes débiles (grafo_1 y grafo_2 tienen los mismos arcos)
+        componentes = uf.components(catalog["conectividad"])
+    elif modo == "fuerte":
+        componentes = cc.connected_components(grafo, cc.STRONG)
+    else:
+        raise ValueError("Modo de subred no válido: use 'debil' o 'fuerte'")
+
     lista_subredes = lt.new_list()
-    contador_id = 1
-    
-    # iterar sobre todos los vértices del grafo
-    for i in range(num_vertices):
-        nodo_id = lt.get_element(vertices, i)
-        
-        # si ya pertenece a una subred, saltar
-        if mp.contains(visitados_global, nodo_id):
-            continue
-        
-        # encontramos una nueva subred: obtener todos los nodos conectados (DFS)
-        ids_componente = obtener_nodos_dfs(grafo, nodo_id)
-        
-        # marcar estos nodos como visitados globalmente
-        size_comp = lt.size(ids_componente)
-        for j in range(size_comp):
-            uid = lt.get_element(ids_componente, j)
-            mp.put(visitados_global, uid, True)
-            
+    miembros = cc.component_members(componentes)
+
+    for c in range(componentes["count"]):
+        ids_componente = lt.new_list()
+        for v in miembros[c]:
+            lt.add_last(ids_componente, csr.key_of(grafo, v))
+
         # calcular estadísticas y guardar
-        stats = calcular_estadisticas_subred(contador_id, ids_componente, nodos_global)
+        stats = calcular_estadisticas_subred(c + 1, ids_componente, indice_nodos)
         lt.add_last(lista_subredes, stats)
         
-        contador_id += 1
-        
     # ordenar por tamaño (mayor a menor)
     lista_ordenada = lt.merge_sort(lista_subredes, cmp_subred)
     
@@ -1692,4 +2336,20 @@ def delta_time(start, end):
     devuelve la diferencia entre tiempos de procesamiento muestreados
     """
     elapsed = float(end - start)
-    return elapsed
\ No newline at end of file
+    return elapsed
+
+
+def get_peak_memory():
+    """
+    devuelve la memoria residente máxima (pico de RSS) del proceso en MB,
+    o None si el sistema operativo no la reporta (p. ej. Windows)
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KB y macOS reporta bytes
+    if sys.platform == "darwin":
+        return pico / (1024 * 1024)
+    return pico / 1024
\ No newline at end of file
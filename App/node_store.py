@@ -0,0 +1,269 @@
+"""
+Almacén columnar de nodos migratorios.
+
+Guarda los campos de los nodos en arreglos contiguos (array de Python):
+
+    - lat, lon, timestamp, prom_agua : float64 por nodo
+    - count                          : int64 por nodo (número de eventos)
+    - offsets, grullas               : pertenencia de grullas en formato
+      plano; las grullas del nodo i son grullas[offsets[i]:offsets[i+1]]
+      (códigos enteros que se traducen con la tabla de tags).
+    - ids, tags                      : textos (id de cada nodo y tag de cada
+      grulla) guardados como bytes UTF-8 con sus propios offsets.
+
+El almacén se puede escribir a disco (save) y abrir como memoria compartida
+(open_mapped): los arreglos se leen directamente del archivo mapeado con
+mmap, así varios procesos de análisis comparten una sola copia de los nodos.
+El encabezado guarda además la firma (tamaño, mtime) del archivo del que
+salieron los nodos, para saber si el almacén sigue vigente (read_source).
+
+get_node entrega un nodo con la misma forma de los nodos del catálogo
+(id, lat, lon, timestamp, epoch, grullas, prom_agua, count), para que el
+código que ya lee nodos (view.nodos_to_table, req_*) funcione sin cambios.
+"""
+import mmap
+import struct
+from array import array
+from datetime import datetime, timedelta
+
+from DataStructures.List import array_list as lt
+
+MAGIC = b"NODOS\x00\x02\x00"
+EPOCH = datetime(1970, 1, 1)
+
+# orden de las secciones del archivo: (campo, typecode)
+SECCIONES = (
+    ("lat", "d"),
+    ("lon", "d"),
+    ("timestamp", "d"),
+    ("prom_agua", "d"),
+    ("count", "q"),
+    ("offsets", "q"),
+    ("grullas", "q"),
+    ("id_offsets", "q"),
+    ("tag_offsets", "q"),
+    ("id_bytes", "B"),
+    ("tag_bytes", "B"),
+)
+# MAGIC, firma del archivo de origen (tamaño, mtime) y posición de cada sección
+ENCABEZADO = struct.Struct("<8sqq" + "q" * len(SECCIONES))
+
+
+def new_node_store():
+    """
+    Crea un almacén columnar vacío.
+    """
+    store = {"size": 0, "num_tags": 0, "mapped": None, "positions": None}
+    for campo, tipo in SECCIONES:
+        store[campo] = array(tipo)
+    store["offsets"].append(0)
+    store["id_offsets"].append(0)
+    store["tag_offsets"].append(0)
+    return store
+
+
+def from_nodes(nodos):
+    """
+    Construye un almacén columnar a partir del array_list de nodos del
+    catálogo.
+    """
+    store = new_node_store()
+    codigos = {}
+    id_bytes = bytearray()
+    tag_bytes = bytearray()
+
+    for i in range(lt.size(nodos)):
+        nodo = lt.get_element(nodos, i)
+        store["lat"].append(nodo["lat"])
+        store["lon"].append(nodo["lon"])
+        store["timestamp"].append(nodo["epoch"])
+        store["prom_agua"].append(nodo["prom_agua"])
+        store["count"].append(nodo["count"])
+
+        id_bytes += str(nodo["id"]).encode("utf-8")
+        store["id_offsets"].append(len(id_bytes))
+
+        tags = nodo["grullas"]
+        for j in range(lt.size(tags)):
+            tag = lt.get_element(tags, j)
+            codigo = codigos.get(tag)
+            if codigo is None:
+                codigo = len(codigos)
+                codigos[tag] = codigo
+                tag_bytes += str(tag).encode("utf-8")
+                store["tag_offsets"].append(len(tag_bytes))
+            store["grullas"].append(codigo)
+        store["offsets"].append(len(store["grullas"]))
+
+    store["id_bytes"] = array("B", id_bytes)
+    store["tag_bytes"] = array("B", tag_bytes)
+    store["size"] = lt.size(nodos)
+    store["num_tags"] = len(codigos)
+    return store
+
+
+def size(store):
+    """
+    Retorna el número de nodos del almacén.
+    """
+    return store["size"]
+
+
+def _text(blob, offsets, i):
+    return bytes(blob[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+
+def get_id(store, i):
+    """
+    Retorna el id del nodo en la posición i.
+    """
+    return _text(store["id_bytes"], store["id_offsets"], i)
+
+
+def get_tag(store, codigo):
+    """
+    Retorna el tag de la grulla con el código dado.
+    """
+    return _text(store["tag_bytes"], store["tag_offsets"], codigo)
+
+
+def get_crane_codes(store, i):
+    """
+    Retorna los códigos de las grullas del nodo i (en orden de llegada).
+    """
+    return store["grullas"][store["offsets"][i]:store["offsets"][i + 1]]
+
+
+def get_cranes(store, i):
+    """
+    Retorna un array_list con los tags de las grullas del nodo i.
+    """
+    grullas = lt.new_list()
+    for codigo in get_crane_codes(store, i):
+        lt.add_last(grullas, get_tag(store, codigo))
+    return grullas
+
+
+def get_node(store, i):
+    """
+    Retorna el nodo i con la misma forma que los nodos del catálogo.
+    El diccionario es una copia: modificarlo no cambia el almacén.
+    """
+    epoch = int(store["timestamp"][i])
+    return {
+        "id": get_id(store, i),
+        "lat": store["lat"][i],
+        "lon": store["lon"][i],
+        "timestamp": EPOCH + timedelta(seconds=epoch),
+        "epoch": epoch,
+        "grullas": get_cranes(store, i),
+        "prom_agua": store["prom_agua"][i],
+        "total_agua": store["prom_agua"][i] * store["count"][i],
+        "count": store["count"][i]
+    }
+
+
+def index_of(store, node_id):
+    """
+    Retorna la posición del nodo con id node_id, o -1 si no existe.
+    La tabla id → posición se construye la primera vez que se consulta.
+    """
+    if store["positions"] is None:
+        store["positions"] = {get_id(store, i): i for i in range(store["size"])}
+    return store["positions"].get(node_id, -1)
+
+
+def num_cranes(store):
+    """
+    Retorna el número de grullas distintas del almacén.
+    """
+    return store["num_tags"]
+
+
+def save(store, path, source=(0, 0)):
+    """
+    Escribe el almacén en un archivo binario que se puede abrir con
+    open_mapped. Cada sección empieza en una posición múltiplo de 8.
+
+    source es la firma (tamaño, mtime) del archivo del que salieron los
+    nodos; se guarda en el encabezado y se lee con read_source.
+    """
+    posiciones = []
+    actual = ENCABEZADO.size
+    for campo, _ in SECCIONES:
+        actual += (-actual) % 8
+        posiciones.append(actual)
+        actual += len(store[campo]) * store[campo].itemsize
+
+    with open(path, "wb") as f:
+        f.write(ENCABEZADO.pack(MAGIC, source[0], source[1], *posiciones))
+        for (campo, _), inicio in zip(SECCIONES, posiciones):
+            f.write(b"\x00" * (inicio - f.tell()))
+            store[campo].tofile(f)
+    return path
+
+
+def open_mapped(path):
+    """
+    Abre un almacén guardado con save sin copiarlo a memoria: los arreglos
+    son vistas (memoryview) sobre el archivo mapeado en modo lectura, que el
+    sistema operativo comparte entre todos los procesos que lo abren.
+    """
+    with open(path, "rb") as f:
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    datos = ENCABEZADO.unpack_from(mapa, 0)
+    if datos[0] != MAGIC:
+        mapa.close()
+        raise ValueError("El archivo no es un almacén de nodos: " + path)
+
+    posiciones = datos[3:]
+    vista = memoryview(mapa)
+    store = {"mapped": mapa, "view": vista, "positions": None,
+             "source": (datos[1], datos[2])}
+    for k, (campo, tipo) in enumerate(SECCIONES):
+        if campo == "id_bytes":
+            largo = store["id_offsets"][-1]
+        elif campo == "tag_bytes":
+            largo = store["tag_offsets"][-1]
+        else:
+            largo = posiciones[k + 1] - posiciones[k]
+        inicio = posiciones[k]
+        store[campo] = vista[inicio:inicio + largo].cast(tipo)
+
+    store["size"] = len(store["id_offsets"]) - 1
+    store["num_tags"] = len(store["tag_offsets"]) - 1
+    return store
+
+
+def read_source(path):
+    """
+    Retorna la firma (tamaño, mtime) del archivo de origen guardada en el
+    almacén, leyendo solo el encabezado. Retorna None si el archivo no
+    existe o no es un almacén de nodos de esta versión.
+    """
+    try:
+        with open(path, "rb") as f:
+            encabezado = f.read(ENCABEZADO.size)
+    except OSError:
+        return None
+    if len(encabezado) < ENCABEZADO.size:
+        return None
+    datos = ENCABEZADO.unpack(encabezado)
+    if datos[0] != MAGIC:
+        return None
+    return datos[1], datos[2]
+
+
+def close(store):
+    """
+    Libera el archivo mapeado de un almacén abierto con open_mapped.
+    """
+    mapa = store.get("mapped")
+    if mapa is None:
+        return
+    for campo, _ in SECCIONES:
+        store[campo].release()
+    store["view"].release()
+    mapa.close()
+    store["mapped"] = None
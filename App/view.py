@@ -2,6 +2,7 @@ import sys
 import time
 from tabulate import tabulate as tb
 import App.logic as l
+import App.node_store as ns
 
 from DataStructures.List import array_list as lt
 from DataStructures.Graph import digraph as gp
@@ -54,9 +55,10 @@ def load_data(control):
     res = l.load_data(control, filename)
     end = l.get_time()
     tiempo = round(l.delta_time(start, end), 2)
+    memoria = l.get_peak_memory()
     
     
-    nodos = control["nodos"]
+    nodos = control["almacen_nodos"]
     grafo1 = control["grafo_1"]
     grafo2 = control["grafo_2"]
     
@@ -77,6 +79,10 @@ def load_data(control):
     print(f"- Total de eventos cargados           : {total_eventos}")
     print(f"- Total de nodos construidos          : {total_nodos}")
     print(f"- Tiempo de carga (segundos)          : {tiempo}")
+    if memoria is None:
+        print("- Memoria pico RSS (MB)               : no disponible")
+    else:
+        print(f"- Memoria pico RSS (MB)               : {round(memoria, 2)}")
 
     # ===========================================================
     #   GRAFO 1 (Distancias migratorias)
@@ -122,9 +128,10 @@ def buscar_detalle(detalles, nid):
 
 def nodos_to_table(nodos, primeros=True, incluir_distancia=False):
     """
-    Convierte los primeros o últimos 5 nodos en una tabla imprimible.
+    Convierte los primeros o últimos 5 nodos del almacén columnar en una
+    tabla imprimible.
     """
-    total = lt.size(nodos)
+    total = ns.size(nodos)
     tabla = []
 
     if primeros:
@@ -133,7 +140,7 @@ def nodos_to_table(nodos, primeros=True, incluir_distancia=False):
         r_inicio, r_fin = max(0, total - 5), total
 
     for i in range(r_inicio, r_fin):
-        nodo = lt.get_element(nodos, i)
+        nodo = ns.get_node(nodos, i)
 
         grullas = []
         for j in range(lt.size(nodo["grullas"])):
@@ -144,7 +151,7 @@ def nodos_to_table(nodos, primeros=True, incluir_distancia=False):
             "Posición (lat,long)": f"({nodo['lat']:.4f}, {nodo['lon']:.4f})",
             "Fecha de creación": nodo["timestamp"],
             "Grullas (tags)": grullas,
-            "Conteo de eventos": lt.size(nodo["eventos"])
+            "Conteo de eventos": nodo["count"]
         }
         if incluir_distancia:
             fila["Dist. Hídri prom (km)"] = round(nodo["prom_agua"],4)
@@ -155,20 +162,9 @@ def nodos_to_table(nodos, primeros=True, incluir_distancia=False):
 
 def contar_grullas(nodos):
     """
-    Cuenta grullas únicas.
+    Cuenta grullas únicas del almacén columnar de nodos.
     """
-    grullas = {} # Dico para guardar unicos
-
-    n = lt.size(nodos)
-    for i in range(n):
-        nodo = lt.get_element(nodos, i)
-        lista_grullas = nodo["grullas"]
-
-        for j in range(lt.size(lista_grullas)):
-            g = lt.get_element(lista_grullas, j)
-            grullas[g] = True
-
-    return len(grullas)
+    return ns.num_cranes(nodos)
 
 
 def print_data(control, id):
@@ -368,32 +364,33 @@ def print_req_3(control):
     fin = time.time()
     
     print("\n===== Resultados del Requerimiento 3 =====")
-    print(f"Tiempo de ejecución: {fin - inicio} ms\n")
+    print(f"Tiempo de ejecución: {round((fin - inicio)*1000, 2)} ms\n")
     if "mensaje" in res:
         print(res["mensaje"])
         print("")
         return
     print(f"- Total de puntos en la ruta : {res['total_puntos']}")
+    print(f"- Puntos recorridos (con repeticiones en ciclos) : {res['total_pasos']}")
     print(f"- Total de individuos que usan la ruta : {res['total_individuos']}")
+    print(f"- Ciclos colapsados en el grafo : {res['ciclos_colapsados']}")
+
+    ciclos = res["ciclos_en_ruta"]
+    print(f"- Ciclos colapsados en la ruta : {lt.size(ciclos)}")
+    for i in range(lt.size(ciclos)):
+        ciclo = lt.get_element(ciclos, i)
+        nodos = [str(lt.get_element(ciclo["nodos"], j)) for j in range(lt.size(ciclo["nodos"]))]
+        print(f"    {ciclo['tamano']} nodos: {' -> '.join(nodos)}")
+    print("")
     
     filas = []
     N = 5
     primeros = res["primeros_5"]
     ultimos = res["ultimos_5"]
     
-    for p in primeros:
-        filas.append({
-            "ID": p["id"],
-            "Lat": p["lat"],
-            "Lon": p["lon"],
-            "#Grullas": p["num_grullas"],
-            "3 primeras": p["first3"],
-            "3 últimas": p["last3"],
-            "Dist prev": p["dist_prev"],
-            "Dist next": p["dist_next"]
-        })
+    for i in range(lt.size(primeros)):
+        filas.append(fila_req_3(lt.get_element(primeros, i)))
         
-    if res["total_puntos"] > 2 * N:
+    if res["total_pasos"] > 2 * N:
         filas.append({
             "ID": "...", "Lat": "...", "Lon": "...",
             "#Grullas": "...",
@@ -404,22 +401,36 @@ def print_req_3(control):
         })
 
     # últimos 5
-    for p in ultimos:
-        filas.append({
-            "ID": p["id"],
-            "Lat": p["lat"],
-            "Lon": p["lon"],
-            "#Grullas": p["num_grullas"],
-            "3 primeras": p["first3"],
-            "3 últimas": p["last3"],
-            "Dist prev": p["dist_prev"],
-            "Dist next": p["dist_next"]
-        })
+    for i in range(lt.size(ultimos)):
+        filas.append(fila_req_3(lt.get_element(ultimos, i)))
 
     print(tb(filas, headers="keys", tablefmt="presto"))
     print("")
 
 
+def fila_req_3(p):
+    """
+    Convierte el detalle de un nodo de req_3 en una fila de la tabla.
+    """
+    def unir(grullas):
+        lista = [str(lt.get_element(grullas, j)) for j in range(lt.size(grullas))]
+        return ", ".join(lista) if lista else "N/A"
+
+    def redondear(valor):
+        return valor if valor == "Unknown" else round(valor, 4)
+
+    return {
+        "ID": p["id"],
+        "Lat": round(p["lat"], 4),
+        "Lon": round(p["lon"], 4),
+        "#Grullas": p["num_grullas"],
+        "3 primeras": unir(p["first3"]),
+        "3 últimas": unir(p["last3"]),
+        "Dist prev": redondear(p["dist_prev"]),
+        "Dist next": redondear(p["dist_next"])
+    }
+
+
 def print_req_4(control):
     """
     Función que imprime la solución del Requerimiento 4 en consola
@@ -623,10 +634,24 @@ def print_req_6(control):
     """
     Función que imprime la solución del Requerimiento 6 en consola.
     """
+    print("\nSeleccione el tipo de subred:")
+    print("1 - DÉBIL: nodos unidos por algún camino, sin importar el sentido")
+    print("2 - FUERTE: nodos que se alcanzan mutuamente siguiendo los arcos")
+
+    modo_sel = input("Ingrese 1 o 2: ").strip()
+
+    if modo_sel == "1":
+        modo = "debil"
+    elif modo_sel == "2":
+        modo = "fuerte"
+    else:
+        print("Opción inválida.\n")
+        return
+
     print("\nEjecutando análisis de subredes hídricas (Req 6)...")
     
     start = l.get_time()
-    resultado = l.req_6(control) # Retorna diccionario
+    resultado = l.req_6(control, modo) # Retorna diccionario
     end = l.get_time()
     
     tiempo = round(l.delta_time(start, end), 2)
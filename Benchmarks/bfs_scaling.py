@@ -0,0 +1,87 @@
+"""
+Mide cómo escala BFS con el número de vértices en grafos sintéticos, con la
+cola actual (deque) y con la cola anterior basada en list.pop(0).
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.bfs_scaling [n_1 n_2 ...]
+
+Se usan dos familias de grafos (congelados en formato CSR):
+    - estrella: el origen apunta a todos los demás vértices; la frontera
+      tiene n vértices, el peor caso para una cola con pop(0).
+    - aleatorio: cada vértice tiene 4 arcos a vértices al azar.
+Para cada familia se reporta el tiempo con cada cola y el exponente de
+escalamiento entre el n más pequeño y el más grande: un valor cercano a 1
+indica crecimiento lineal.
+"""
+import math
+import random
+import sys
+
+import App.logic as l
+from DataStructures.Graph import bfs as BFS
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Queue import queue
+
+TAMANOS = [25000, 50000, 100000, 200000]
+
+
+def grafo_estrella(n):
+    return csr.new_csr_graph(range(n), [None] * n,
+                             ((0, i, 1.0) for i in range(1, n)))
+
+
+def grafo_aleatorio(n, grado=4, semilla=1):
+    rng = random.Random(semilla)
+    arcos = ((i, rng.randrange(n), 1.0) for i in range(n) for _ in range(grado))
+    return csr.new_csr_graph(range(n), [None] * n, arcos)
+
+
+def dequeue_lista(my_queue):
+    """
+    dequeue anterior: la cola es una lista y se retira con pop(0).
+    """
+    if queue.is_empty(my_queue):
+        raise Exception("EmptyStructureError: queue is empty")
+    my_queue["size"] -= 1
+    return my_queue["elements"].pop(0)
+
+
+def nueva_cola_lista():
+    return {"size": 0, "elements": []}
+
+
+def medir_bfs(grafo):
+    start = l.get_time()
+    BFS.bfs(grafo, 0)
+    return l.delta_time(start, l.get_time())
+
+
+def exponente(resultados):
+    (n1, t1), (n2, t2) = resultados[0], resultados[-1]
+    if n2 > n1 and t1 > 0:
+        return math.log(t2 / t1) / math.log(n2 / n1)
+    return float("nan")
+
+
+def main(tamanos):
+    actual = (queue.new_queue, queue.dequeue)
+    anterior = (nueva_cola_lista, dequeue_lista)
+
+    for nombre, construir in (("estrella", grafo_estrella), ("aleatorio", grafo_aleatorio)):
+        print(f"\n{nombre}")
+        print(f"{'n':>10}{'deque (ms)':>14}{'pop(0) (ms)':>14}")
+        tiempos = {"deque": [], "pop(0)": []}
+        for n in tamanos:
+            grafo = construir(n)
+            for etiqueta, (nueva, retirar) in (("deque", actual), ("pop(0)", anterior)):
+                queue.new_queue, queue.dequeue = nueva, retirar
+                try:
+                    tiempos[etiqueta].append((n, medir_bfs(grafo)))
+                finally:
+                    queue.new_queue, queue.dequeue = actual
+            print(f"{n:>10}{tiempos['deque'][-1][1]:>14.1f}{tiempos['pop(0)'][-1][1]:>14.1f}")
+        print(f"{'k':>10}{exponente(tiempos['deque']):>14.2f}{exponente(tiempos['pop(0)']):>14.2f}")
+
+
+if __name__ == "__main__":
+    main([int(n) for n in sys.argv[1:]] or TAMANOS)
@@ -0,0 +1,122 @@
+"""
+Compara las búsquedas punto a punto en una sola dirección con las
+bidireccionales sobre grafo_1 y grafo_2, contando los vértices establecidos
+(expandidos) y el tiempo, y verifica que den la misma longitud de camino.
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.bidirectional [archivo] [pares]
+
+Por defecto usa 1000_cranes_mongolia_large.csv con 200 pares de nodos al
+azar (semilla fija). Solo se promedian los pares que tienen camino.
+"""
+import random
+import sys
+
+import App.logic as l
+from DataStructures.Graph import bidirectional as bd
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Graph import dijsktra as dk
+
+
+def bfs_hacia(grafo, origen, destino):
+    """
+    BFS en una sola dirección sobre índices CSR que se detiene al sacar el
+    destino de la cola. Retorna (arcos del camino o None, vértices expandidos).
+    """
+    s = csr.index_of(grafo, origen)
+    t = csr.index_of(grafo, destino)
+    nivel = {s: 0}
+    cola = [s]
+    pos = 0
+    while pos < len(cola):
+        u = cola[pos]
+        pos += 1
+        if u == t:
+            return nivel[u], pos
+        targets, _ = csr.neighbors_index(grafo, u)
+        for w in targets:
+            if w not in nivel:
+                nivel[w] = nivel[u] + 1
+                cola.append(w)
+    return None, pos
+
+
+def medir(nombre, grafo, pares, una, dos):
+    expandidos = [0, 0]
+    tiempos = [0.0, 0.0]
+    con_camino = 0
+    for origen, destino in pares:
+        start = l.get_time()
+        dist_1, n_1 = una(grafo, origen, destino)
+        t_1 = l.delta_time(start, l.get_time())
+        start = l.get_time()
+        dist_2, n_2 = dos(grafo, origen, destino)
+        t_2 = l.delta_time(start, l.get_time())
+        if dist_1 != dist_2:
+            raise Exception(f"{nombre}: {origen} -> {destino} da {dist_1} y {dist_2}")
+        if dist_1 is None:
+            continue
+        con_camino += 1
+        expandidos[0] += n_1
+        expandidos[1] += n_2
+        tiempos[0] += t_1
+        tiempos[1] += t_2
+
+    if con_camino == 0:
+        print(f"{nombre:<22}sin pares con camino")
+        return
+    prom = [e / con_camino for e in expandidos]
+    ms = [t / con_camino for t in tiempos]
+    print(f"{nombre:<22}{con_camino:>7}{prom[0]:>12.1f}{prom[1]:>12.1f}"
+          f"{prom[0] / max(prom[1], 1):>9.1f}x{ms[0]:>10.3f}{ms[1]:>10.3f}")
+
+
+def bfs_una(grafo, origen, destino):
+    return bfs_hacia(grafo, origen, destino)
+
+
+def bfs_dos(grafo, origen, destino):
+    search = bd.bidirectional_bfs(grafo, origen, destino)
+    dist = search["dist_to"] if search["path"] is not None else None
+    return dist, search["settled"]
+
+
+def dijkstra_una(grafo, origen, destino):
+    search = dk.dijkstra_to(grafo, origen, destino)
+    dist = search["dist_to"] if search["path"] is not None else None
+    return dist, search["settled"]
+
+
+def dijkstra_dos(grafo, origen, destino):
+    search = bd.bidirectional_dijkstra(grafo, origen, destino)
+    dist = search["dist_to"] if search["path"] is not None else None
+    return dist, search["settled"]
+
+
+def main(filename, num_pares):
+    catalog = l.new_logic()
+    l.load_data(catalog, filename)
+    grafo_1 = catalog["grafo_1"]
+    grafo_2 = catalog["grafo_2"]
+    print(f"{filename}: {csr.order(grafo_1)} vértices, "
+          f"{csr.size(grafo_1)} arcos\n")
+
+    rng = random.Random(1)
+    llaves = csr.vertices(grafo_1)["elements"]
+    pares = [(rng.choice(llaves), rng.choice(llaves)) for _ in range(num_pares)]
+
+    # el grafo invertido se construye una sola vez por grafo
+    csr.reverse(grafo_1)
+    csr.reverse(grafo_2)
+
+    print(f"{'búsqueda':<22}{'pares':>7}{'una dir.':>12}{'bidir.':>12}"
+          f"{'reduc.':>10}{'ms una':>10}{'ms bidir':>10}")
+    medir("BFS grafo_1", grafo_1, pares, bfs_una, bfs_dos)
+    medir("Dijkstra grafo_1", grafo_1, pares, dijkstra_una, dijkstra_dos)
+    medir("Dijkstra grafo_2", grafo_2, pares, dijkstra_una, dijkstra_dos)
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    pares = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    main(archivo, pares)
@@ -0,0 +1,57 @@
+"""
+Mide cómo escala el tiempo de carga (load_data) con el tamaño del archivo.
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.load_scaling
+    python -m Benchmarks.load_scaling 1000_cranes_mongolia_small.csv 1000_cranes_mongolia_large.csv
+
+Para cada archivo presente en Data/ se reporta el número de eventos, de nodos,
+el tiempo total de carga y el tiempo por evento. Al final se estima el
+exponente de escalamiento entre el archivo más pequeño y el más grande:
+un valor cercano a 1 indica crecimiento lineal.
+"""
+import math
+import os
+import sys
+
+import App.logic as l
+
+ARCHIVOS = [
+    "1000_cranes_mongolia_small.csv",
+    "1000_cranes_mongolia_30pct.csv",
+    "1000_cranes_mongolia_80pct.csv",
+    "1000_cranes_mongolia_large.csv",
+]
+
+
+def medir_carga(filename):
+    """
+    Carga el archivo en un catálogo nuevo y retorna (eventos, nodos, ms).
+    """
+    catalog = l.new_logic()
+    start = l.get_time()
+    res = l.load_data(catalog, filename)
+    end = l.get_time()
+    return res["num_eventos"], res["num_nodos"], l.delta_time(start, end)
+
+
+def main(archivos):
+    resultados = []
+    print(f"{'archivo':<36}{'eventos':>10}{'nodos':>10}{'ms':>12}{'us/evento':>12}")
+    for filename in archivos:
+        if not os.path.exists("Data/" + filename):
+            print(f"{filename:<36}{'(no existe)':>10}")
+            continue
+        eventos, nodos, ms = medir_carga(filename)
+        resultados.append((eventos, ms))
+        print(f"{filename:<36}{eventos:>10}{nodos:>10}{ms:>12.1f}{1000 * ms / max(eventos, 1):>12.2f}")
+
+    if len(resultados) >= 2:
+        (n1, t1), (n2, t2) = min(resultados), max(resultados)
+        if n2 > n1 and t1 > 0:
+            exponente = math.log(t2 / t1) / math.log(n2 / n1)
+            print(f"\nExponente de escalamiento (tiempo ~ eventos^k): k = {exponente:.2f}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:] or ARCHIVOS)
@@ -0,0 +1,147 @@
+"""
+Compara el Prim original de req_4 (mapas por llave, adyacencias de un
+digraph y la cola de prioridad original) con el Prim sobre índices CSR
+(mst.prim_mst) y con Kruskal + union-find (mst.kruskal_mst) sobre grafo_2.
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.mst [archivo] [repeticiones]
+
+Por defecto usa 1000_cranes_mongolia_large.csv y 3 repeticiones; se reporta
+el mejor tiempo de cada caso (el Prim original corre sobre una copia de
+grafo_2 como digraph, que se construye antes de medir). Los dos Prim deben
+dar el mismo árbol. Kruskal toma los arcos sin sentido y cubre todo el
+grafo, así que su peso se compara con el de Prim con undirected=True cuando
+el grafo tiene un solo componente.
+"""
+import sys
+
+import App.logic as l
+from Benchmarks.node_lookup import medir
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Graph import digraph as gp
+from DataStructures.Graph import mst
+from DataStructures.Graph import vertex as vtx
+from DataStructures.List import array_list as lt
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Map import priority_queue
+from DataStructures.UnionFind import union_find as uf
+
+
+def grafo_mapas(grafo):
+    """
+    Copia de un grafo CSR como digraph (vértices y adyacencias en mapas),
+    el formato en que el Prim original recorría los grafos.
+    """
+    copia = gp.new_graph(csr.order(grafo))
+    for llave in grafo["keys"]:
+        gp.insert_vertex(copia, llave, None)
+    for u in range(csr.order(grafo)):
+        targets, weights = csr.neighbors_index(grafo, u)
+        for k in range(len(targets)):
+            gp.add_edge(copia, csr.key_of(grafo, u), csr.key_of(grafo, targets[k]), weights[k])
+    return copia
+
+
+def prim_anterior(grafo, origen):
+    """
+    Prim de req_4 tal como estaba en el código original: marked /
+    edge_from / dist_to en mapas por llave, adyacencias del digraph y la
+    cola de prioridad original (priority_queue, búsqueda lineal en contains
+    e improve_priority).
+    """
+    vertices = gp.vertices(grafo)
+    n = lt.size(vertices)
+    marked = mp.new_map(n, 0.5)
+    edge_from = mp.new_map(n, 0.5)
+    dist_to = mp.new_map(n, 0.5)
+    for i in range(n):
+        v = lt.get_element(vertices, i)
+        mp.put(marked, v, False)
+        mp.put(edge_from, v, None)
+        mp.put(dist_to, v, float("inf"))
+
+    heap = priority_queue.new_heap(is_min_pq=True)
+    mp.put(dist_to, origen, 0)
+    priority_queue.insert(heap, 0, origen)
+    while not priority_queue.is_empty(heap):
+        u = priority_queue.remove(heap)
+        if not mp.get(marked, u):
+            mp.put(marked, u, True)
+            vertex = gp.get_vertex(grafo, u)
+            if vertex is None:
+                continue
+            adjs = gp.adjacents(grafo, u)
+            for j in range(lt.size(adjs)):
+                v = lt.get_element(adjs, j)
+                if not mp.get(marked, v):
+                    edge = vtx.get_edge(vertex, v)
+                    if edge is None:
+                        continue
+                    peso = edge["weight"]
+                    if peso < mp.get(dist_to, v):
+                        mp.put(dist_to, v, peso)
+                        mp.put(edge_from, v, {"from": u, "to": v, "weight": peso})
+                        if priority_queue.contains(heap, v):
+                            priority_queue.improve_priority(heap, peso, v)
+                        else:
+                            priority_queue.insert(heap, peso, v)
+    return marked, edge_from
+
+
+def mismo_arbol(grafo, anterior, arbol):
+    marked, edge_from = anterior
+    keys = arbol["keys"]
+    for i in range(csr.order(grafo)):
+        if bool(arbol["marked"][i]) != bool(mp.get(marked, keys[i])):
+            return False
+        edge = mp.get(edge_from, keys[i])
+        desde = None if edge is None else edge["from"]
+        esperado = None if arbol["edge_from"][i] == -1 else keys[arbol["edge_from"][i]]
+        if desde != esperado:
+            return False
+    return True
+
+
+def main(filename, repeticiones):
+    catalog = l.new_logic()
+    l.load_data(catalog, filename)
+    grafo = catalog["grafo_2"]
+    origen = lt.get_element(catalog["nodos"], 0)["id"]
+    print(f"{filename}: {csr.order(grafo)} vértices, {csr.size(grafo)} arcos\n")
+
+    copia = grafo_mapas(grafo)
+    arbol = mst.prim_mst(grafo, origen)
+    if not mismo_arbol(grafo, prim_anterior(copia, origen), arbol):
+        raise Exception("El Prim con índices no da el mismo árbol que el original")
+
+    csr.reverse(grafo)
+    bosque = mst.kruskal_mst(grafo)
+    no_dirigido = mst.prim_mst(grafo, origen, undirected=True)
+    componentes = uf.count(bosque["components"])
+    if componentes == 1 and abs(no_dirigido["weight"] - bosque["weight"]) > 1e-6:
+        raise Exception("Prim sin sentido y Kruskal no dan el mismo peso")
+
+    casos = {
+        "prim original": lambda: prim_anterior(copia, origen),
+        "prim con índices": lambda: mst.prim_mst(grafo, origen),
+        "prim sin sentido": lambda: mst.prim_mst(grafo, origen, undirected=True),
+        "kruskal": lambda: mst.kruskal_mst(grafo),
+    }
+    print(f"{'caso':<20}{'ms':>12}{'vértices':>10}{'peso':>14}")
+    resultados = {
+        "prim original": (arbol["size"], arbol["weight"]),
+        "prim con índices": (arbol["size"], arbol["weight"]),
+        "prim sin sentido": (no_dirigido["size"], no_dirigido["weight"]),
+        "kruskal": (len(bosque["edges"]) + componentes, bosque["weight"]),
+    }
+    for nombre, funcion in casos.items():
+        tiempo = medir(funcion, repeticiones)
+        vertices, peso = resultados[nombre]
+        print(f"{nombre:<20}{tiempo:>12.1f}{vertices:>10}{peso:>14.2f}")
+    print(f"\nKruskal: {componentes} componente(s)")
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    main(archivo, reps)
@@ -0,0 +1,69 @@
+"""
+Compara req_3 y req_4 con búsquedas lineales de nodos (antes) y con el
+índice nodo-id → nodo del catálogo (después).
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.node_lookup [archivo] [repeticiones]
+
+Por defecto usa 1000_cranes_mongolia_large.csv y 3 repeticiones; se reporta
+el mejor tiempo de cada caso.
+"""
+import sys
+
+import App.logic as l
+from DataStructures.List import array_list as lt
+
+
+def medir(funcion, repeticiones):
+    """
+    Ejecuta ``funcion`` varias veces y retorna el mejor tiempo en ms.
+    """
+    mejor = None
+    for _ in range(repeticiones):
+        start = l.get_time()
+        funcion()
+        tiempo = l.delta_time(start, l.get_time())
+        if mejor is None or tiempo < mejor:
+            mejor = tiempo
+    return mejor
+
+
+def buscar_nodo_por_id(nodos, nodo_id):
+    """
+    Búsqueda anterior: recorre linealmente el array_list de nodos.
+    """
+    for i in range(lt.size(nodos)):
+        nodo = lt.get_element(nodos, i)
+        if nodo["id"] == nodo_id:
+            return nodo
+    return None
+
+
+def main(filename, repeticiones):
+    catalog = l.new_logic()
+    l.load_data(catalog, filename)
+    nodos = catalog["nodos"]
+    primero = lt.get_element(nodos, 0)
+
+    casos = {
+        "req_3": lambda: l.req_3(catalog),
+        "req_4": lambda: l.req_4(catalog, primero["lat"], primero["lon"]),
+    }
+
+    indexado = l.obtener_nodo
+    lineal = lambda indice_nodos, nodo_id: buscar_nodo_por_id(nodos, nodo_id)
+
+    print(f"{filename}: {lt.size(nodos)} nodos\n")
+    print(f"{'caso':<8}{'antes (ms)':>14}{'después (ms)':>16}{'mejora':>10}")
+    for nombre, funcion in casos.items():
+        l.obtener_nodo = lineal
+        antes = medir(funcion, repeticiones)
+        l.obtener_nodo = indexado
+        despues = medir(funcion, repeticiones)
+        print(f"{nombre:<8}{antes:>14.1f}{despues:>16.1f}{antes / max(despues, 1e-9):>9.1f}x")
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    main(archivo, reps)
@@ -0,0 +1,61 @@
+"""
+Mide construir_grafos en serie y repartiendo las grullas entre varios
+procesos, y verifica que todos los modos den los mismos arcos.
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.parallel_build [archivo] [procesos ...]
+
+Por defecto usa 1000_cranes_mongolia_large.csv con 1, 2 y 4 procesos. La
+mejora depende de los núcleos disponibles (se reporta os.cpu_count()).
+"""
+import os
+import sys
+
+import App.logic as l
+from DataStructures.Graph import digraph as gp
+from DataStructures.List import array_list as lt
+
+
+def arcos(grafo):
+    """
+    Retorna los arcos del grafo como {(origen, destino): peso}.
+    """
+    resultado = {}
+    vertices = gp.vertices(grafo)
+    for i in range(lt.size(vertices)):
+        u = lt.get_element(vertices, i)
+        for edge in gp.edges_vertex(grafo, u)["elements"]:
+            resultado[(u, edge["to"])] = edge["weight"]
+    return resultado
+
+
+def diferencia_maxima(a, b):
+    if a.keys() != b.keys():
+        return float("inf")
+    return max((abs(a[k] - b[k]) for k in a), default=0.0)
+
+
+def main(filename, lista_procesos):
+    catalog = l.new_logic()
+    l.load_data(catalog, filename, usar_snapshot=False)
+    print(f"{filename}: {catalog['eventos']['size']} eventos, "
+          f"{lt.size(catalog['nodos'])} nodos, {os.cpu_count()} núcleos\n")
+
+    referencia = None
+    print(f"{'procesos':>10}{'ms':>12}{'dif. máx. pesos':>18}")
+    for procesos in lista_procesos:
+        start = l.get_time()
+        l.construir_grafos(catalog, procesos)
+        ms = l.delta_time(start, l.get_time())
+        actual = (arcos(catalog["grafo_1"]), arcos(catalog["grafo_2"]))
+        if referencia is None:
+            referencia = actual
+        dif = max(diferencia_maxima(referencia[0], actual[0]),
+                  diferencia_maxima(referencia[1], actual[1]))
+        print(f"{procesos:>10}{ms:>12.1f}{dif:>18.2e}")
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    procesos = [int(p) for p in sys.argv[2:]] or [1, 2, 4]
+    main(archivo, procesos)
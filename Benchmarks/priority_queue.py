@@ -0,0 +1,60 @@
+"""
+Compara Dijkstra y Prim sobre los grafos del catálogo usando la cola de
+prioridad original (priority_queue, búsqueda lineal en contains e
+improve_priority) y la cola indexada (index_priority_queue).
+
+Uso (desde la raíz del repositorio):
+    python -m Benchmarks.priority_queue [archivo] [repeticiones]
+
+Por defecto usa 1000_cranes_mongolia_large.csv y 3 repeticiones; se reporta
+el mejor tiempo de cada caso. Ambas colas deben dar el mismo resultado.
+"""
+import sys
+
+import App.logic as l
+from Benchmarks.node_lookup import medir
+from DataStructures.Graph import dijsktra as dk
+from DataStructures.Graph import dijsktra_structure
+from DataStructures.Graph import mst
+from DataStructures.List import array_list as lt
+from DataStructures.Map import priority_queue
+from DataStructures.Map import index_priority_queue
+
+# módulos que usan la cola de prioridad como "pq"
+USUARIOS = (dk, dijsktra_structure, mst)
+
+
+def usar_cola(modulo):
+    for usuario in USUARIOS:
+        usuario.pq = modulo
+
+
+def main(filename, repeticiones):
+    catalog = l.new_logic()
+    l.load_data(catalog, filename)
+    origen = lt.get_element(catalog["nodos"], 0)["id"]
+
+    casos = {
+        "dijkstra grafo_1": lambda: dk.dijkstra(catalog["grafo_1"], origen),
+        "dijkstra grafo_2": lambda: dk.dijkstra(catalog["grafo_2"], origen),
+        "prim grafo_2": lambda: l.obtener_mst(catalog["grafo_2"], origen),
+    }
+
+    print(f"{filename}: {l.gp.order(catalog['grafo_1'])} vértices, "
+          f"{l.gp.size(catalog['grafo_1'])} arcos\n")
+    print(f"{'caso':<20}{'antes (ms)':>14}{'después (ms)':>16}{'mejora':>10}")
+    try:
+        for nombre, funcion in casos.items():
+            usar_cola(priority_queue)
+            antes = medir(funcion, repeticiones)
+            usar_cola(index_priority_queue)
+            despues = medir(funcion, repeticiones)
+            print(f"{nombre:<20}{antes:>14.1f}{despues:>16.1f}{antes / max(despues, 1e-9):>9.1f}x")
+    finally:
+        usar_cola(index_priority_queue)
+
+
+if __name__ == "__main__":
+    archivo = sys.argv[1] if len(sys.argv) > 1 else "1000_cranes_mongolia_large.csv"
+    reps = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    main(archivo, reps)
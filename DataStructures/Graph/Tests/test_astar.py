@@ -0,0 +1,135 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import dijsktra as DK
+from DataStructures.Graph import astar as A
+
+
+def geometric_graph(n, m, seed, stretch=1.5):
+    """
+    Puntos al azar en el plano; cada arco pesa entre 1 y stretch veces la
+    distancia euclidiana entre sus extremos.
+    """
+    rng = random.Random(seed)
+    points = [(rng.random() * 100, rng.random() * 100) for _ in range(n)]
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        edges.append((u, v, distance(points[u], points[v]) * rng.uniform(1, stretch)))
+    return C.new_csr_graph(range(n), points, edges), points
+
+
+def distance(p, q):
+    return math.hypot(p[0] - q[0], p[1] - q[1])
+
+
+def random_graph(n, m, seed):
+    # pesos al azar, sin relacion con ninguna geometria
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), rng.uniform(0, 10)) for _ in range(m)]
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+@handle_not_implemented
+def test_landmarks_distances_and_cache():
+    graph = random_graph(60, 150, 3)
+    tables = A.landmarks(graph, 3)
+    assert len(tables["vertices"]) == 3
+    assert len(set(tables["vertices"])) == 3
+    for k, landmark in enumerate(tables["vertices"]):
+        full = DK.dijkstra(graph, landmark)
+        for v in range(60):
+            if DK.has_path_to(v, full):
+                assert tables["dist_from"][k][v] == pytest.approx(DK.dist_to(v, full))
+            else:
+                assert tables["dist_from"][k][v] == math.inf
+            back = DK.dijkstra(graph, v)
+            expected = DK.dist_to(landmark, back) if DK.has_path_to(landmark, back) else math.inf
+            assert tables["dist_to"][k][v] == pytest.approx(expected)
+    assert A.landmarks(graph, 3) is tables
+    assert A.landmarks(C.new_csr_graph([], [], []))["vertices"] == []
+
+
+@handle_not_implemented
+def test_landmark_astar_same_dist_as_dijkstra():
+    for seed in range(4):
+        graph = random_graph(70, 160, seed)
+        for source in (0, 13, 42):
+            full = DK.dijkstra(graph, source)
+            for target in range(70):
+                h = A.landmark_heuristic(graph, target)
+                # la heuristica nunca sobreestima
+                if DK.has_path_to(target, full):
+                    assert h(source) <= DK.dist_to(target, full) + 1e-9
+                search = A.astar_to(graph, source, target, h)
+                assert DK.has_path_to(target, search) == DK.has_path_to(target, full)
+                if DK.has_path_to(target, full):
+                    assert DK.dist_to(target, search) == pytest.approx(DK.dist_to(target, full))
+                else:
+                    assert DK.path_to(target, search) is None
+
+
+@handle_not_implemented
+def test_landmark_heuristic_proves_no_path():
+    # 0 -> 1 -> 2 -> 3 y 4 -> 3; desde 3 no se llega a nada
+    graph = C.new_csr_graph(range(5), [None] * 5,
+                            [(0, 1, 1.0), (1, 2, 1.0), (2, 3, 1.0), (4, 3, 1.0)])
+    h = A.landmark_heuristic(graph, 0)
+    assert h(3) == math.inf
+    search = A.astar_to(graph, 3, 0, h)
+    assert search["path"] is None
+    assert search["settled"] == 0
+    with pytest.raises(Exception):
+        A.landmark_heuristic(graph, 9)
+
+
+@handle_not_implemented
+def test_astar_same_dist_as_dijkstra():
+    for seed in range(4):
+        graph, points = geometric_graph(80, 300, seed)
+        for source in (0, 9, 51):
+            full = DK.dijkstra(graph, source)
+            for target in range(80):
+                h = lambda v: distance(points[v], points[target])
+                search = A.astar_to(graph, source, target, h)
+                assert DK.has_path_to(target, search) == DK.has_path_to(target, full)
+                if DK.has_path_to(target, full):
+                    assert DK.dist_to(target, search) == pytest.approx(DK.dist_to(target, full))
+                else:
+                    assert DK.path_to(target, search) is None
+
+
+@handle_not_implemented
+def test_astar_zero_heuristic_is_dijkstra():
+    graph, _ = geometric_graph(50, 150, 7)
+    for target in range(50):
+        expected = DK.dijkstra_to(graph, 0, target)
+        search = A.astar_to(graph, 0, target, lambda v: 0.0)
+        assert search["path"] == expected["path"]
+        assert search["dist_to"] == expected["dist_to"]
+        assert search["settled"] == expected["settled"]
+
+
+@handle_not_implemented
+def test_astar_settles_fewer_vertices():
+    # malla de 30 x 30; los pesos son la distancia entre celdas vecinas
+    n = 30
+    points = [(r, c) for r in range(n) for c in range(n)]
+    edges = []
+    for r in range(n):
+        for c in range(n):
+            for dr, dc in ((0, 1), (1, 0), (0, -1), (-1, 0)):
+                if 0 <= r + dr < n and 0 <= c + dc < n:
+                    edges.append((r * n + c, (r + dr) * n + c + dc, 1.0))
+    graph = C.new_csr_graph(range(n * n), points, edges)
+    source, target = 15 * n + 2, 15 * n + 27
+    h = lambda v: distance(points[v], points[target])
+
+    search = A.astar_to(graph, source, target, h)
+    plain = DK.dijkstra_to(graph, source, target)
+    assert DK.dist_to(target, search) == DK.dist_to(target, plain) == 25.0
+    assert search["settled"] * 4 < plain["settled"]
+    assert A.astar_to(graph, source, n * n + 5, h)["path"] is None
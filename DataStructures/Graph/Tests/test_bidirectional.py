@@ -0,0 +1,144 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import bfs as BFS
+from DataStructures.Graph import dijsktra as DK
+from DataStructures.Graph import bidirectional as BD
+from DataStructures.Stack import stack as st
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(m):
+        # pesos enteros pequeños para que haya empates
+        edges.append((rng.randrange(n), rng.randrange(n), float(rng.randint(1, 5))))
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+def stack_to_list(path):
+    result = []
+    while not st.is_empty(path):
+        result.append(st.pop(path))
+    return result
+
+
+def path_weight(graph, path):
+    total = 0.0
+    for i in range(len(path) - 1):
+        edge = C.get_edge(graph, path[i], path[i + 1])
+        assert edge is not None
+        total += edge["weight"]
+    return total
+
+
+@handle_not_implemented
+def test_reverse():
+    graph = C.new_csr_graph(["a", "b", "c"], [1, 2, 3],
+                            [("a", "b", 1.0), ("a", "c", 2.0), ("b", "c", 3.0)])
+    reverse = C.reverse(graph)
+    assert C.size(reverse) == 3
+    assert C.get_vertex_information(reverse, "c") == 3
+    assert C.adjacents(reverse, "c")["elements"] == ["a", "b"]
+    assert C.get_edge(reverse, "c", "b")["weight"] == 3.0
+    assert C.adjacents(reverse, "a")["elements"] == []
+    # se guarda en el grafo
+    assert C.reverse(graph) is reverse
+
+
+@handle_not_implemented
+def test_bidirectional_bfs_same_hops_as_bfs():
+    for seed in range(4):
+        graph = random_graph(80, 160, seed)
+        for source in (0, 7, 41):
+            full = BFS.bfs(graph, source)
+            for target in range(80):
+                search = BD.bidirectional_bfs(graph, source, target)
+                assert BD.has_path_to(target, search) == BFS.has_path_to(target, full)
+                if not BFS.has_path_to(target, full):
+                    assert BD.path_to(target, search) is None
+                    continue
+                expected = stack_to_list(BFS.path_to(target, full))
+                path = stack_to_list(BD.path_to(target, search))
+                assert len(path) == len(expected)
+                assert BD.dist_to(target, search) == len(path) - 1
+                assert path[0] == source and path[-1] == target
+                path_weight(graph, path)
+
+
+@handle_not_implemented
+def test_bidirectional_dijkstra_same_dist_as_dijkstra():
+    for seed in range(4):
+        graph = random_graph(80, 200, seed)
+        for source in (0, 5, 33):
+            full = DK.dijkstra(graph, source)
+            for target in range(80):
+                search = BD.bidirectional_dijkstra(graph, source, target)
+                assert BD.has_path_to(target, search) == DK.has_path_to(target, full)
+                if not DK.has_path_to(target, full):
+                    assert BD.dist_to(target, search) == math.inf
+                    assert BD.path_to(target, search) is None
+                    continue
+                assert BD.dist_to(target, search) == DK.dist_to(target, full)
+                path = stack_to_list(BD.path_to(target, search))
+                assert path[0] == source and path[-1] == target
+                assert path_weight(graph, path) == BD.dist_to(target, search)
+
+
+@handle_not_implemented
+def test_bidirectional_settles_fewer_vertices():
+    # malla de 30 x 30 con arcos en las cuatro direcciones
+    n = 30
+    edges = []
+    for r in range(n):
+        for c in range(n):
+            if c + 1 < n:
+                edges.append((r * n + c, r * n + c + 1, 1.0))
+                edges.append((r * n + c + 1, r * n + c, 1.0))
+            if r + 1 < n:
+                edges.append((r * n + c, (r + 1) * n + c, 1.0))
+                edges.append(((r + 1) * n + c, r * n + c, 1.0))
+    graph = C.new_csr_graph(range(n * n), [None] * (n * n), edges)
+    source, target = 14 * n + 10, 14 * n + 20
+
+    one_way = DK.dijkstra_to(graph, source, target)
+    both_ways = BD.bidirectional_dijkstra(graph, source, target)
+    assert BD.dist_to(target, both_ways) == DK.dist_to(target, one_way) == 10.0
+    assert both_ways["settled"] < one_way["settled"]
+
+    search = BD.bidirectional_bfs(graph, source, target)
+    assert BD.dist_to(target, search) == 10
+    assert search["settled"] < one_way["settled"]
+
+
+@handle_not_implemented
+def test_bidirectional_trivial_cases():
+    graph = C.new_csr_graph(range(3), [None] * 3, [(0, 1, 2.0)])
+    for algorithm in (BD.bidirectional_bfs, BD.bidirectional_dijkstra):
+        search = algorithm(graph, 1, 1)
+        assert stack_to_list(BD.path_to(1, search)) == [1]
+        assert algorithm(graph, 1, 0)["path"] is None
+        assert algorithm(graph, 0, 9)["path"] is None
+        with pytest.raises(Exception):
+            algorithm(graph, 9, 0)
+        with pytest.raises(Exception):
+            BD.dist_to(2, algorithm(graph, 0, 1))
+    assert BD.dist_to(1, BD.bidirectional_dijkstra(graph, 0, 1)) == 2.0
+
+
+@handle_not_implemented
+def test_bidirectional_on_digraph():
+    graph = G.new_graph(4)
+    for key in "abcd":
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "a", "b", 1.0)
+    G.add_edge(graph, "b", "d", 1.0)
+    G.add_edge(graph, "a", "c", 0.5)
+    G.add_edge(graph, "c", "d", 0.5)
+    search = BD.bidirectional_dijkstra(graph, "a", "d")
+    assert stack_to_list(BD.path_to("d", search)) == ["a", "c", "d"]
+    assert BD.dist_to("d", BD.bidirectional_bfs(graph, "a", "d")) == 2
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import components as CC
+from DataStructures.Graph import topological as T
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), 1.0) for _ in range(m)]
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+def reachable(graph, source):
+    seen = {source}
+    pending = [source]
+    while pending:
+        u = pending.pop()
+        targets, _ = C.neighbors_index(graph, u)
+        for w in targets:
+            if w not in seen:
+                seen.add(w)
+                pending.append(w)
+    return seen
+
+
+@handle_not_implemented
+def test_scc_same_as_mutual_reachability():
+    for seed in range(6):
+        graph = random_graph(60, 90, seed)
+        scc = CC.strongly_connected_components(graph)
+        component = scc["component"]
+        reach = [reachable(graph, u) for u in range(60)]
+        for u in range(60):
+            for v in range(60):
+                same = v in reach[u] and u in reach[v]
+                assert (component[u] == component[v]) == same
+        assert sum(scc["sizes"]) == 60
+        assert max(component) == scc["count"] - 1
+
+
+@handle_not_implemented
+def test_scc_numbering_and_cache():
+    # 0 <-> 1, 2 solo, 3 -> 4 -> 5 -> 3
+    graph = C.new_csr_graph(range(6), [None] * 6,
+                            [(0, 1, 1.0), (1, 0, 1.0), (1, 2, 1.0),
+                             (3, 4, 1.0), (4, 5, 1.0), (5, 3, 1.0), (2, 3, 1.0)])
+    scc = CC.strongly_connected_components(graph)
+    assert list(scc["component"]) == [0, 0, 1, 2, 2, 2]
+    assert list(scc["sizes"]) == [2, 1, 3]
+    assert CC.strongly_connected_components(graph) is scc
+
+    dag = CC.condensation(graph)
+    assert C.order(dag) == 3
+    assert C.adjacents(dag, 0)["elements"] == [1]
+    assert C.adjacents(dag, 1)["elements"] == [2]
+    assert dag["links"][(1, 2)] == (2, 3)
+    assert T.is_dag(dag)
+    assert CC.condensation(graph) is dag
+
+
+@handle_not_implemented
+def test_scc_long_cycle_without_recursion():
+    n = 200000
+    graph = C.new_csr_graph(range(n), [None] * n,
+                            [(i, (i + 1) % n, 1.0) for i in range(n)])
+    scc = CC.strongly_connected_components(graph)
+    assert scc["count"] == 1
+    assert scc["sizes"][0] == n
+
+
+@handle_not_implemented
+def test_scc_digraph():
+    graph = G.new_graph(3)
+    for key in "abc":
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "a", "b")
+    G.add_edge(graph, "b", "a")
+    scc = CC.strongly_connected_components(graph)
+    assert scc["count"] == 2
+    assert CC.SCC_KEY not in graph
+
+
+@handle_not_implemented
+def test_wcc_same_as_undirected_reachability():
+    for seed in range(6):
+        graph = random_graph(60, 45, seed)
+        wcc = CC.connected_components(graph, CC.WEAK)
+        edges = [(u, v, 1.0) for u in range(60) for v in C.neighbors_index(graph, u)[0]]
+        undirected = C.new_csr_graph(range(60), [None] * 60,
+                                     edges + [(v, u, w) for u, v, w in edges])
+        for u in range(60):
+            reach = reachable(undirected, u)
+            for v in range(60):
+                assert (wcc["component"][u] == wcc["component"][v]) == (v in reach)
+        assert sum(wcc["sizes"]) == 60
+
+
+@handle_not_implemented
+def test_wcc_numbering_members_and_modes():
+    # 2 -> 0, 3 -> 1 <- 4, 5 solo
+    graph = C.new_csr_graph(range(6), [None] * 6,
+                            [(2, 0, 1.0), (3, 1, 1.0), (4, 1, 1.0)])
+    wcc = CC.weakly_connected_components(graph)
+    assert list(wcc["component"]) == [0, 1, 0, 1, 1, 2]
+    assert list(wcc["sizes"]) == [2, 3, 1]
+    assert CC.component_members(wcc) == [[0, 2], [1, 3, 4], [5]]
+    assert CC.connected_components(graph) is wcc
+
+    scc = CC.connected_components(graph, CC.STRONG)
+    assert scc["count"] == 6
+    with pytest.raises(Exception):
+        CC.connected_components(graph, "otro")
@@ -0,0 +1,119 @@
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import dfs as DFS
+from DataStructures.Graph import bfs as BFS
+from DataStructures.Graph import dijsktra as DK
+from DataStructures.Stack import stack as st
+
+
+def setup_tests():
+    graph = G.new_graph(5)
+    for key in ["A", "B", "C", "D", "E"]:
+        G.insert_vertex(graph, key, {"name": key})
+
+    G.add_edge(graph, "A", "B", 4.0)
+    G.add_edge(graph, "A", "C", 1.0)
+    G.add_edge(graph, "C", "B", 2.0)
+    G.add_edge(graph, "B", "D", 5.0)
+    G.add_edge(graph, "C", "D", 8.0)
+    G.add_edge(graph, "D", "A", 3.0)
+
+    return graph, C.from_digraph(graph)
+
+
+def stack_to_list(path):
+    result = []
+    while not st.is_empty(path):
+        result.append(st.pop(path))
+    return result
+
+
+@handle_not_implemented
+def test_new_csr_graph():
+    graph = C.new_csr_graph(["x", "y", "z"], [1, 2, 3],
+                            [("x", "y", 1.0), ("y", "z", 2.0), ("x", "y", 7.0)])
+
+    assert G.order(graph) == 3
+    assert G.size(graph) == 2
+    assert G.get_edge(graph, "x", "y")["weight"] == 7.0
+    assert G.get_edge(graph, "z", "x") is None
+    assert G.get_vertex_information(graph, "z") == 3
+    assert C.index_of(graph, "y") == 1
+    assert C.index_of(graph, "w") == -1
+    assert C.key_of(graph, 2) == "z"
+
+    with pytest.raises(Exception):
+        C.new_csr_graph(["x"], [None], [("x", "w", 1.0)])
+
+
+@handle_not_implemented
+def test_from_digraph():
+    graph, frozen = setup_tests()
+
+    assert G.order(frozen) == G.order(graph)
+    assert G.size(frozen) == G.size(graph)
+    assert G.vertices(frozen)["elements"] == G.vertices(graph)["elements"]
+
+    for key in G.vertices(graph)["elements"]:
+        assert G.adjacents(frozen, key)["elements"] == G.adjacents(graph, key)["elements"]
+        assert G.edges_vertex(frozen, key)["elements"] == G.edges_vertex(graph, key)["elements"]
+        assert G.degree(frozen, key) == G.degree(graph, key)
+
+    assert G.contains_vertex(frozen, "A")
+    assert not G.contains_vertex(frozen, "Z")
+    assert G.degree(frozen, "Z") == 0
+
+    with pytest.raises(Exception):
+        G.adjacents(frozen, "Z")
+    with pytest.raises(Exception):
+        G.add_edge(frozen, "A", "E", 1.0)
+    with pytest.raises(Exception):
+        G.insert_vertex(frozen, "F", None)
+    with pytest.raises(Exception):
+        G.update_vertex_info(frozen, "A", None)
+
+
+@handle_not_implemented
+def test_neighbors_index():
+    graph, frozen = setup_tests()
+
+    i = C.index_of(frozen, "A")
+    targets, weights = C.neighbors_index(frozen, i)
+
+    assert C.degree_index(frozen, i) == 2
+    assert [C.key_of(frozen, t) for t in targets] == G.adjacents(graph, "A")["elements"]
+    assert sorted(weights) == [1.0, 4.0]
+
+
+@handle_not_implemented
+def test_get_vertex():
+    graph, frozen = setup_tests()
+
+    vertex = G.get_vertex(frozen, "C")
+    assert vertex["key"] == "C"
+    assert vertex["value"] == {"name": "C"}
+    assert G.get_vertex(frozen, "Z") is None
+
+
+@handle_not_implemented
+def test_algorithms_unchanged():
+    graph, frozen = setup_tests()
+
+    dfo_a = DFS.dfs(graph, "A")
+    dfo_b = DFS.dfs(frozen, "A")
+    assert dfo_a["pre"]["elements"] == dfo_b["pre"]["elements"]
+
+    bfo_a = BFS.bfs(graph, "A")
+    bfo_b = BFS.bfs(frozen, "A")
+    for key in ["B", "C", "D", "E"]:
+        assert BFS.has_path_to(key, bfo_a) == BFS.has_path_to(key, bfo_b)
+
+    search_a = DK.dijkstra(graph, "A")
+    search_b = DK.dijkstra(frozen, "A")
+    for key in ["B", "C", "D"]:
+        assert DK.dist_to(key, search_a) == DK.dist_to(key, search_b)
+        assert stack_to_list(DK.path_to(key, search_a)) == stack_to_list(DK.path_to(key, search_b))
+    assert DK.dist_to("B", search_b) == 3.0
+    assert not DK.has_path_to("E", search_b)
@@ -0,0 +1,78 @@
+import random
+
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import dfs as DFS
+from DataStructures.Map import map_linear_probing as mp
+from DataStructures.Stack import stack as st
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    graph = G.new_graph(n)
+    for i in range(n):
+        G.insert_vertex(graph, i, None)
+    for _ in range(m):
+        G.add_edge(graph, rng.randrange(n), rng.randrange(n), 1.0)
+    return graph
+
+
+def path_graph(n):
+    return C.new_csr_graph(range(n), [None] * n,
+                           ((i, i + 1, 1.0) for i in range(n - 1)))
+
+
+def stack_to_list(my_stack):
+    result = []
+    while not st.is_empty(my_stack):
+        result.append(st.pop(my_stack))
+    return result
+
+
+def assert_same_dfo(a, b, vertices):
+    assert a["source"] == b["source"]
+    assert a["pre"]["elements"] == b["pre"]["elements"]
+    assert a["post"]["elements"] == b["post"]["elements"]
+    assert stack_to_list(a["reversepost"]) == stack_to_list(b["reversepost"])
+    for v in vertices:
+        assert mp.contains(a["marked"], v) == mp.contains(b["marked"], v)
+        assert mp.get(a["edge_to"], v) == mp.get(b["edge_to"], v)
+
+
+@handle_not_implemented
+def test_dfs_iterative_same_as_recursive():
+    for seed in range(5):
+        graph = random_graph(60, 120, seed)
+        for source in (0, 17, 42):
+            assert_same_dfo(DFS.dfs(graph, source),
+                            DFS.dfs_iterative(graph, source),
+                            range(60))
+
+
+@handle_not_implemented
+def test_dfs_iterative_single_vertex():
+    graph = G.new_graph(1)
+    G.insert_vertex(graph, "A", None)
+
+    dfo = DFS.dfs_iterative(graph, "A")
+    assert list(dfo["pre"]["elements"]) == ["A"]
+    assert list(dfo["post"]["elements"]) == ["A"]
+    assert DFS.has_path_to("A", dfo)
+    assert stack_to_list(DFS.path_to("A", dfo)) == ["A"]
+
+
+@handle_not_implemented
+def test_dfs_iterative_deep_path():
+    n = 10 ** 6
+    dfo = DFS.dfs_iterative(path_graph(n), 0)
+
+    assert mp.size(dfo["marked"]) == n
+    assert dfo["pre"]["elements"][-1] == n - 1
+    assert dfo["post"]["elements"][0] == n - 1
+    assert st.peek(dfo["reversepost"]) == 0
+    assert mp.get(dfo["edge_to"], n - 1) == n - 2
+
+    path = DFS.path_to(n - 1, dfo)
+    assert st.size(path) == n
+    assert st.pop(path) == 0
@@ -0,0 +1,99 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import dijsktra as DK
+from DataStructures.Stack import stack as st
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(m):
+        # pesos enteros pequeños para que haya empates
+        edges.append((rng.randrange(n), rng.randrange(n), float(rng.randint(1, 5))))
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+def stack_to_list(path):
+    result = []
+    while not st.is_empty(path):
+        result.append(st.pop(path))
+    return result
+
+
+@handle_not_implemented
+def test_dijkstra_to_same_as_dijkstra():
+    for seed in range(4):
+        graph = random_graph(80, 200, seed)
+        workspace = DK.new_workspace(graph)
+        for source in (0, 5, 33):
+            full = DK.dijkstra(graph, source)
+            for target in range(80):
+                search = DK.dijkstra_to(graph, source, target, workspace)
+                assert DK.has_path_to(target, search) == DK.has_path_to(target, full)
+                if DK.has_path_to(target, full):
+                    assert DK.dist_to(target, search) == DK.dist_to(target, full)
+                    assert stack_to_list(DK.path_to(target, search)) == \
+                        stack_to_list(DK.path_to(target, full))
+                else:
+                    assert DK.dist_to(target, search) == math.inf
+                    assert DK.path_to(target, search) is None
+
+
+@handle_not_implemented
+def test_dijkstra_to_early_exit():
+    # camino 0 -> 1 -> ... -> 99
+    graph = C.new_csr_graph(range(100), [None] * 100,
+                            [(i, i + 1, 1.0) for i in range(99)])
+    search = DK.dijkstra_to(graph, 0, 3)
+    assert search["settled"] == 4
+    assert DK.dist_to(3, search) == 3.0
+    assert stack_to_list(DK.path_to(3, search)) == [0, 1, 2, 3]
+
+    # el espacio de trabajo del grafo se reutiliza sin afectar la busqueda anterior
+    other = DK.dijkstra_to(graph, 50, 52)
+    assert graph["workspace"]["stamp"] == 2
+    assert stack_to_list(DK.path_to(52, other)) == [50, 51, 52]
+    assert stack_to_list(DK.path_to(3, search)) == [0, 1, 2, 3]
+
+    with pytest.raises(Exception):
+        DK.dist_to(2, search)
+
+
+@handle_not_implemented
+def test_dijkstra_to_digraph():
+    graph = G.new_graph(3)
+    for key in ["A", "B", "C"]:
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "A", "B", 2.0)
+    G.add_edge(graph, "B", "C", 2.0)
+    G.add_edge(graph, "A", "C", 5.0)
+
+    search = DK.dijkstra_to(graph, "A", "C")
+    assert DK.dist_to("C", search) == 4.0
+    assert stack_to_list(DK.path_to("C", search)) == ["A", "B", "C"]
+    assert DK.dijkstra_to(graph, "A", "Z")["path"] is None
+
+
+@handle_not_implemented
+def test_dijkstra_tree_same_as_dijkstra():
+    for seed in range(4):
+        graph = random_graph(80, 200, seed)
+        for source in (0, 5, 33):
+            full = DK.dijkstra(graph, source)
+            tree = DK.dijkstra_tree(graph, source)
+            for target in range(80):
+                assert DK.has_path_to(target, tree) == DK.has_path_to(target, full)
+                assert DK.dist_to(target, tree) == DK.dist_to(target, full)
+                if DK.has_path_to(target, full):
+                    assert stack_to_list(DK.path_to(target, tree)) == \
+                        stack_to_list(DK.path_to(target, full))
+                else:
+                    assert DK.path_to(target, tree) is None
+
+    with pytest.raises(Exception):
+        DK.dist_to(999, DK.dijkstra_tree(graph, 0))
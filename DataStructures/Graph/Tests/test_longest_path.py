@@ -0,0 +1,85 @@
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import longest_path as LP
+
+
+def random_dag(n, m, seed):
+    rng = random.Random(seed)
+    edges = []
+    for _ in range(m):
+        u, v = sorted(rng.sample(range(n), 2))
+        edges.append((u, v, 1.0))
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+def longest_by_brute_force(graph):
+    # DP simple sobre el orden 0..n-1 (los arcos van de menor a mayor)
+    n = C.order(graph)
+    best = [1] * n
+    for u in range(n):
+        targets, _ = C.neighbors_index(graph, u)
+        for v in targets:
+            best[v] = max(best[v], best[u] + 1)
+    return max(best)
+
+
+@handle_not_implemented
+def test_dag_longest_path():
+    for seed in range(5):
+        graph = random_dag(50, 120, seed)
+        result = LP.longest_path(graph)
+        path = result["path"]
+        assert result["weight"] == len(path) == longest_by_brute_force(graph)
+        assert result["cycles"] == [] and result["collapsed"] == 0
+        for i in range(len(path) - 1):
+            assert C.get_edge(graph, path[i], path[i + 1]) is not None
+
+
+@handle_not_implemented
+def test_cycles_are_collapsed():
+    # a -> b -> c -> b (ciclo b, c) -> d ; e -> a ; x <-> y aparte
+    edges = [("a", "b", 1.0), ("b", "c", 1.0), ("c", "b", 1.0), ("c", "d", 1.0),
+             ("e", "a", 1.0), ("x", "y", 1.0), ("y", "x", 1.0)]
+    graph = C.new_csr_graph(list("abcdexy"), [None] * 7, edges)
+    result = LP.longest_path(graph)
+    # se entra al ciclo por b y se sale por c
+    assert result["path"] == ["e", "a", "b", "c", "d"]
+    assert result["weight"] == 5
+    assert result["cycles"] == [["b", "c"]]
+    assert result["collapsed"] == 2
+
+
+@handle_not_implemented
+def test_vertex_weights_and_empty_graph():
+    graph = C.new_csr_graph(range(4), [None] * 4,
+                            [(0, 1, 1.0), (1, 3, 1.0), (0, 2, 1.0), (2, 3, 1.0)])
+    result = LP.longest_path(graph, vertex_weights=[1, 1, 5, 1])
+    assert result["path"] == [0, 2, 3]
+    assert result["weight"] == 7
+
+    assert LP.longest_path(C.new_csr_graph([], [], [])) is None
+
+
+@handle_not_implemented
+def test_path_is_a_walk_through_cycles():
+    # x -> y -> z -> x; se entra y se sale por x
+    edges = [("s", "x", 1.0), ("x", "y", 1.0), ("y", "z", 1.0), ("z", "x", 1.0),
+             ("x", "t", 1.0)]
+    graph = C.new_csr_graph(list("sxyzt"), [None] * 5, edges)
+    result = LP.longest_path(graph)
+    assert result["path"] == ["s", "x", "y", "z", "x", "t"]
+    assert result["cycles"] == [["x", "y", "z", "x"]]
+    assert result["weight"] == 5
+
+    rng = random.Random(4)
+    for _ in range(5):
+        edges = [(rng.randrange(40), rng.randrange(40), 1.0) for _ in range(70)]
+        graph = C.new_csr_graph(range(40), [None] * 40, edges)
+        result = LP.longest_path(graph)
+        path = result["path"]
+        for i in range(len(path) - 1):
+            assert C.get_edge(graph, path[i], path[i + 1]) is not None
+        assert len(set(path)) == result["weight"]
@@ -0,0 +1,113 @@
+import math
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import mst as MST
+from DataStructures.Map import index_priority_queue as pq
+from DataStructures.UnionFind import union_find as UF
+
+
+def random_graph(n, m, seed):
+    rng = random.Random(seed)
+    edges = [(rng.randrange(n), rng.randrange(n), float(rng.randint(1, 9)))
+             for _ in range(m)]
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+def prim_with_dicts(graph, source):
+    # Prim con diccionarios por llave, como el Prim con mapas de req_4
+    marked = {}
+    edge_from = {}
+    dist_to = {source: 0}
+    heap = pq.new_heap()
+    pq.insert(heap, 0, source)
+    while not pq.is_empty(heap):
+        u = pq.remove(heap)
+        if marked.get(u):
+            continue
+        marked[u] = True
+        targets, weights = C.neighbors_index(graph, u)
+        for v, w in zip(targets, weights):
+            if not marked.get(v) and w < dist_to.get(v, math.inf):
+                dist_to[v] = w
+                edge_from[v] = u
+                if pq.contains(heap, v):
+                    pq.improve_priority(heap, w, v)
+                else:
+                    pq.insert(heap, w, v)
+    return marked, edge_from
+
+
+@handle_not_implemented
+def test_prim_same_tree_as_dicts():
+    for seed in range(6):
+        graph = random_graph(80, 240, seed)
+        tree = MST.prim_mst(graph, 0)
+        marked, edge_from = prim_with_dicts(graph, 0)
+        assert tree["size"] == len(marked)
+        for v in range(80):
+            assert bool(tree["marked"][v]) == (v in marked)
+            assert tree["edge_from"][v] == edge_from.get(v, -1)
+        weight = sum(tree["dist_to"][v] for v in range(1, 80) if tree["marked"][v])
+        assert tree["weight"] == weight
+
+
+@handle_not_implemented
+def test_undirected_prim_same_weight_as_kruskal():
+    for seed in range(6):
+        graph = random_graph(60, 150, seed)
+        forest = MST.kruskal_mst(graph)
+        for source in (0, 17):
+            tree = MST.prim_mst(graph, source, undirected=True)
+            trees = forest["components"]
+            assert tree["size"] == UF.set_size(trees, source)
+            in_component = [(u, v, w) for u, v, w in forest["edges"]
+                            if UF.connected(trees, u, source)]
+            assert len(in_component) == tree["size"] - 1
+            assert tree["weight"] == pytest.approx(sum(w for _, _, w in in_component))
+
+
+@handle_not_implemented
+def test_kruskal_forest():
+    # a - b (1), b - c (2), a - c (3), d solo
+    graph = C.new_csr_graph(list("abcd"), [None] * 4,
+                            [("a", "b", 1.0), ("c", "b", 2.0), ("a", "c", 3.0)])
+    forest = MST.kruskal_mst(graph)
+    assert forest["edges"] == [(0, 1, 1.0), (2, 1, 2.0)]
+    assert forest["weight"] == 3.0
+    assert UF.count(forest["components"]) == 2
+
+
+@handle_not_implemented
+def test_prim_follows_edge_direction():
+    # desde b no se llega a a
+    graph = C.new_csr_graph(list("abc"), [None] * 3,
+                            [("a", "b", 1.0), ("b", "c", 4.0), ("a", "c", 2.0)])
+    tree = MST.prim_mst(graph, "b")
+    assert list(tree["marked"]) == [0, 1, 1]
+    assert tree["weight"] == 4.0
+
+    tree = MST.prim_mst(graph, "b", undirected=True)
+    assert tree["size"] == 3
+    assert tree["weight"] == 3.0
+    assert list(tree["edge_from"]) == [1, -1, 0]
+
+
+@handle_not_implemented
+def test_prim_trivial_and_digraph():
+    graph = C.new_csr_graph(["a"], [None], [])
+    tree = MST.prim_mst(graph, "a")
+    assert tree["size"] == 1 and tree["weight"] == 0.0
+    with pytest.raises(Exception):
+        MST.prim_mst(graph, "z")
+    assert MST.kruskal_mst(C.new_csr_graph([], [], []))["edges"] == []
+
+    digraph = G.new_graph(3)
+    for key in "xyz":
+        G.insert_vertex(digraph, key, None)
+    G.add_edge(digraph, "x", "y", 2.0)
+    G.add_edge(digraph, "y", "z", 1.0)
+    assert MST.prim_mst(digraph, "x")["weight"] == 3.0
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Graph import digraph as G
+from DataStructures.Graph import csr_graph as C
+from DataStructures.Graph import topological as T
+
+
+def random_dag(n, m, seed):
+    rng = random.Random(seed)
+    rank = list(range(n))
+    rng.shuffle(rank)
+    edges = []
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if rank[u] < rank[v]:
+            edges.append((u, v, 1.0))
+    return C.new_csr_graph(range(n), [None] * n, edges)
+
+
+@handle_not_implemented
+def test_order_respects_edges():
+    for seed in range(5):
+        graph = random_dag(100, 400, seed)
+        order = T.topological_order(graph)
+        assert sorted(order) == list(range(100))
+        position = {v: i for i, v in enumerate(order)}
+        for u in range(100):
+            targets, _ = C.neighbors_index(graph, u)
+            for v in targets:
+                assert position[u] < position[v]
+
+
+@handle_not_implemented
+def test_kahn_fifo_order():
+    # 0 y 3 no tienen arcos de entrada; la cola se procesa en orden FIFO
+    graph = C.new_csr_graph(["a", "b", "c", "d"], [None] * 4,
+                            [("a", "c", 1.0), ("d", "b", 1.0), ("a", "b", 1.0)])
+    assert T.topological_keys(graph)["elements"] == ["a", "d", "c", "b"]
+    assert T.is_dag(graph)
+
+
+@handle_not_implemented
+def test_cycle_and_cache():
+    graph = C.new_csr_graph(range(3), [None] * 3,
+                            [(0, 1, 1.0), (1, 2, 1.0), (2, 1, 1.0)])
+    assert T.topological_order(graph) is None
+    assert T.topological_keys(graph) is None
+    assert not T.is_dag(graph)
+
+    dag = random_dag(30, 60, 1)
+    order = T.topological_order(dag)
+    # el orden queda guardado en el grafo
+    assert T.topological_order(dag) is order
+    assert dag[T.CACHE_KEY] is order
+
+
+@handle_not_implemented
+def test_digraph():
+    graph = G.new_graph(3)
+    for key in ("x", "y", "z"):
+        G.insert_vertex(graph, key, None)
+    G.add_edge(graph, "z", "y")
+    G.add_edge(graph, "y", "x")
+    assert T.topological_keys(graph)["elements"] == ["z", "y", "x"]
+    assert T.CACHE_KEY not in graph
+    G.add_edge(graph, "x", "z")
+    assert T.topological_order(graph) is None
@@ -0,0 +1,233 @@
+"""
+Busqueda A* punto a punto sobre grafos CSR.
+
+A* es Dijkstra con la prioridad dist(v) + heuristic(v), donde heuristic(v)
+estima la distancia que falta de v al destino. El camino encontrado es el
+mas corto solo si la heuristica es consistente: heuristic(u) <= peso(u, v) +
+heuristic(v) para todo arco u -> v (y por lo tanto nunca sobreestima).
+
+Una cota geometrica (por ejemplo Haversine) solo es consistente si ningun
+arco pesa menos que la distancia entre sus extremos, y eso no se cumple
+cuando los pesos son promedios. landmark_heuristic no depende de la forma de
+los pesos (solo de que no sean negativos): usa las distancias desde y hacia
+unos pocos vertices de referencia (landmarks) y la desigualdad triangular
+del propio grafo (ALT: A*, landmarks, triangle inequality).
+"""
+import math
+from array import array
+
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Graph import dijsktra as dk
+from DataStructures.Map import index_priority_queue as pq
+
+# Numero de vertices de referencia por defecto
+LANDMARKS = 4
+
+# Llave con la que las tablas de landmarks quedan guardadas en el grafo
+CACHE_KEY = "landmarks"
+
+
+def landmarks(my_graph, count=LANDMARKS):
+    """
+    Elige count vertices de referencia y calcula las distancias mas cortas
+    desde cada uno (dist_from) y hacia cada uno (dist_to, con Dijkstra sobre
+    csr_graph.reverse). Cuesta 2 * count arboles de Dijkstra mas uno para
+    elegir el primero; como el grafo CSR no cambia, el resultado queda
+    guardado en el grafo.
+
+    Los vertices se eligen lejos unos de otros: el primero es el mas lejano
+    (alcanzable) desde el vertice 0, y cada uno de los siguientes el que
+    tiene la mayor distancia finita a los ya elegidos.
+
+    Retorna un diccionario con:
+
+    - **vertices**: Indices de los vertices de referencia.
+    - **dist_from**: Por cada referencia L, arreglo con d(L, v) por indice (inf si no hay camino).
+    - **dist_to**: Por cada referencia L, arreglo con d(v, L) por indice (inf si no hay camino).
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    cached = my_graph.get(CACHE_KEY)
+    if cached is not None and len(cached["vertices"]) == count:
+        return cached
+
+    n = csr.order(my_graph)
+    keys = my_graph["keys"]
+    result = {"vertices": [], "dist_from": [], "dist_to": []}
+    if n == 0:
+        return result
+
+    reversed_graph = csr.reverse(my_graph)
+    first = dk.dijkstra_tree(my_graph, keys[0])["dist"]
+    current = _farthest(first)
+    if current == -1:
+        current = 0
+    closest = array("d", [math.inf]) * n
+    while len(result["vertices"]) < min(count, n) and current != -1:
+        dist_from = dk.dijkstra_tree(my_graph, keys[current])["dist"]
+        dist_to = dk.dijkstra_tree(reversed_graph, keys[current])["dist"]
+        result["vertices"].append(current)
+        result["dist_from"].append(dist_from)
+        result["dist_to"].append(dist_to)
+        for v in range(n):
+            d = min(dist_from[v], dist_to[v])
+            if d < closest[v]:
+                closest[v] = d
+        current = _farthest(closest)
+
+    my_graph[CACHE_KEY] = result
+    return result
+
+
+def _farthest(dist):
+    """
+    Indice con la mayor distancia finita y positiva, o -1 si no hay.
+    """
+    best = -1
+    for v in range(len(dist)):
+        if dist[v] < math.inf and dist[v] > 0 and (best == -1 or dist[v] > dist[best]):
+            best = v
+    return best
+
+
+def landmark_heuristic(my_graph, target, count=LANDMARKS):
+    """
+    Retorna la heuristica consistente heuristic(key_v) para llegar a target,
+    con las referencias de landmarks:
+
+        d(v, t) >= d(L, t) - d(L, v)    y    d(v, t) >= d(v, L) - d(t, L)
+
+    tomando el maximo sobre las referencias L (y 0). Ademas retorna inf si
+    las referencias prueban que no hay camino de v a target (L llega a v
+    pero no a target, o target llega a L pero v no), asi astar_to descarta
+    esos vertices sin recorrerlos.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    t = csr.index_of(my_graph, target)
+    if t == -1:
+        raise Exception("El vertice no existe")
+
+    tables = landmarks(my_graph, count)
+    bounds = []
+    for k in range(len(tables["vertices"])):
+        dist_from = tables["dist_from"][k]
+        dist_to = tables["dist_to"][k]
+        bounds.append((dist_from, dist_from[t], dist_to, dist_to[t]))
+    index = my_graph["index"]
+
+    def heuristic(key_v):
+        v = index[key_v]
+        best = 0.0
+        for dist_from, from_t, dist_to, to_t in bounds:
+            from_v = dist_from[v]
+            to_v = dist_to[v]
+            if from_v < math.inf:
+                if from_t == math.inf:
+                    return math.inf
+                if from_t - from_v > best:
+                    best = from_t - from_v
+            if to_t < math.inf:
+                if to_v == math.inf:
+                    return math.inf
+                if to_v - to_t > best:
+                    best = to_v - to_t
+        return best
+
+    return heuristic
+
+
+def astar_to(my_graph, source, target, heuristic, workspace=None):
+    """
+    A* punto a punto: busca el camino mas corto de source a target guiado
+    por heuristic(key_v), y se detiene en cuanto target queda establecido.
+
+    La heuristica debe ser consistente (por ejemplo landmark_heuristic); se
+    evalua una vez por vertice alcanzado. Los vertices con heuristica inf
+    (desde ellos no se llega a target) no se agregan a la cola. Usa el mismo espacio de trabajo que
+    dijsktra.dijkstra_to (el que el grafo guarda si no se pasa uno) y
+    retorna una busqueda con la misma forma, que has_path_to, dist_to y
+    path_to de dijsktra aceptan para target.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+
+    s = csr.index_of(my_graph, source)
+    t = csr.index_of(my_graph, target)
+    if s == -1:
+        raise Exception("El vertice no existe")
+
+    if workspace is None:
+        workspace = my_graph.get("workspace")
+        if workspace is None:
+            workspace = dk.new_workspace(my_graph)
+            my_graph["workspace"] = workspace
+
+    workspace["stamp"] += 1
+    stamp = workspace["stamp"]
+    dist = workspace["dist"]
+    parent = workspace["parent"]
+    seen = workspace["seen"]
+    settled = workspace["settled"]
+    estimate = {s: heuristic(source)}
+    if estimate[s] == math.inf:
+        t = -1
+
+    dist[s] = 0.0
+    parent[s] = -1
+    seen[s] = stamp
+    heap = pq.new_heap()
+    pq.insert(heap, estimate[s], s)
+    count = 0
+
+    while not pq.is_empty(heap) and t != -1:
+        u = pq.remove(heap)
+        if settled[u] == stamp:
+            continue
+        settled[u] = stamp
+        count += 1
+        if u == t:
+            break
+
+        targets, weights = csr.neighbors_index(my_graph, u)
+        for k in range(len(targets)):
+            w = targets[k]
+            if settled[w] == stamp:
+                continue
+
+            h = estimate.get(w)
+            if h is None:
+                h = heuristic(csr.key_of(my_graph, w))
+                estimate[w] = h
+            if h == math.inf:
+                continue
+
+            new_dist = dist[u] + weights[k]
+            if seen[w] != stamp or new_dist < dist[w]:
+                seen[w] = stamp
+                dist[w] = new_dist
+                parent[w] = u
+
+                if pq.contains(heap, w):
+                    pq.improve_priority(heap, new_dist + h, w)
+                else:
+                    pq.insert(heap, new_dist + h, w)
+
+    search = {
+        "source": source,
+        "target": target,
+        "dist_to": math.inf,
+        "path": None,
+        "settled": count
+    }
+    if t != -1 and settled[t] == stamp:
+        path = []
+        current = t
+        while current != -1:
+            path.append(csr.key_of(my_graph, current))
+            current = parent[current]
+        search["dist_to"] = dist[t]
+        search["path"] = path
+    return search
@@ -0,0 +1,266 @@
+"""
+Busquedas punto a punto bidireccionales sobre grafos CSR.
+
+Cada busqueda avanza al mismo tiempo desde source por los arcos del grafo y
+desde target por los arcos del grafo invertido (csr_graph.reverse), y se
+detiene cuando las dos mitades garantizan el camino mas corto. En grafos
+grandes cada mitad explora una region mucho menor que la de una busqueda
+desde source hasta target.
+
+- bidirectional_bfs: camino con el menor numero de arcos.
+- bidirectional_dijkstra: camino de menor peso (pesos no negativos).
+
+Ambas retornan una busqueda con la misma forma de dijsktra.dijkstra_to
+("source", "target", "dist_to", "path" del destino al origen, "settled"),
+asi que has_path_to, dist_to y path_to de este modulo (o de dijsktra)
+entregan la misma pila de camino que bfs.path_to y dijsktra.path_to.
+Entre caminos empatados el camino elegido puede ser otro que el de la
+busqueda en una sola direccion.
+"""
+import math
+
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Map import index_priority_queue as pq
+from DataStructures.Stack import stack as stack
+
+
+def _prepare(my_graph, source, target):
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    s = csr.index_of(my_graph, source)
+    if s == -1:
+        raise Exception("El vertice no existe")
+    t = csr.index_of(my_graph, target)
+    return my_graph, s, t
+
+
+def _new_search(source, target, settled):
+    return {
+        "source": source,
+        "target": target,
+        "dist_to": math.inf,
+        "path": None,
+        "settled": settled
+    }
+
+
+def _join(my_graph, search, u, w, parent_f, parent_b):
+    """
+    Arma el camino source -> u -> w -> target (del destino al origen).
+    """
+    forward = []
+    current = u
+    while current != -1:
+        forward.append(current)
+        current = parent_f[current]
+    path = []
+    current = w
+    while current != -1:
+        path.append(current)
+        current = parent_b[current]
+    path.reverse()
+    path.extend(forward)
+    search["path"] = [csr.key_of(my_graph, i) for i in path]
+
+
+def bidirectional_bfs(my_graph, source, target):
+    """
+    BFS bidireccional: busca el camino de source a target con el menor
+    numero de arcos.
+
+    En cada paso se expande un nivel completo de la frontera mas pequeña
+    (la de source si son iguales). Al terminar el primer nivel en que un
+    arco toca un vertice ya descubierto por la otra mitad, el mejor de esos
+    contactos es un camino minimo.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+
+    Retorna una busqueda con dist_to = numero de arcos del camino y
+    "settled" = numero de vertices expandidos entre las dos mitades.
+    """
+    my_graph, s, t = _prepare(my_graph, source, target)
+    search = _new_search(source, target, 0)
+    if t == -1:
+        return search
+    if s == t:
+        search["dist_to"] = 0
+        search["path"] = [source]
+        return search
+
+    reverse = csr.reverse(my_graph)
+    # por cada mitad: grafo, padres (vertice -> padre), niveles y frontera
+    parent_f = {s: -1}
+    parent_b = {t: -1}
+    level_f = {s: 0}
+    level_b = {t: 0}
+    frontier_f = [s]
+    frontier_b = [t]
+    settled = 0
+    best = math.inf
+    meet = None
+
+    while frontier_f and frontier_b and meet is None:
+        forward = len(frontier_f) <= len(frontier_b)
+        if forward:
+            graph, frontier = my_graph, frontier_f
+            parent, level, other = parent_f, level_f, level_b
+        else:
+            graph, frontier = reverse, frontier_b
+            parent, level, other = parent_b, level_b, level_f
+
+        next_frontier = []
+        for u in frontier:
+            settled += 1
+            depth = level[u] + 1
+            targets, _ = csr.neighbors_index(graph, u)
+            for w in targets:
+                if w in other:
+                    length = depth + other[w]
+                    if length < best:
+                        best = length
+                        meet = (u, w) if forward else (w, u)
+                if w not in parent:
+                    parent[w] = u
+                    level[w] = depth
+                    next_frontier.append(w)
+
+        if forward:
+            frontier_f = next_frontier
+        else:
+            frontier_b = next_frontier
+
+    search["settled"] = settled
+    if meet is not None:
+        search["dist_to"] = best
+        _join(my_graph, search, meet[0], meet[1], parent_f, parent_b)
+    return search
+
+
+def bidirectional_dijkstra(my_graph, source, target):
+    """
+    Dijkstra bidireccional: busca el camino de menor peso de source a target.
+
+    En cada paso se establece el vertice con menor distancia entre las dos
+    colas de prioridad. Cada arco relajado que llega a un vertice alcanzado
+    por la otra mitad es un camino candidato; la busqueda termina cuando la
+    suma de los minimos de las dos colas ya no es menor que el mejor
+    candidato.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+
+    Retorna una busqueda con "settled" = numero de vertices establecidos
+    entre las dos mitades. dist_to se acumula en el orden del camino, igual
+    que en dijkstra_to.
+    """
+    my_graph, s, t = _prepare(my_graph, source, target)
+    search = _new_search(source, target, 0)
+    if t == -1:
+        return search
+    if s == t:
+        search["dist_to"] = 0.0
+        search["path"] = [source]
+        return search
+
+    reverse = csr.reverse(my_graph)
+    dist_f = {s: 0.0}
+    dist_b = {t: 0.0}
+    parent_f = {s: -1}
+    parent_b = {t: -1}
+    # peso del arco hacia el padre en la mitad de target, para sumar el
+    # camino en orden
+    weight_b = {t: 0.0}
+    done_f = set()
+    done_b = set()
+    heap_f = pq.new_heap()
+    heap_b = pq.new_heap()
+    pq.insert(heap_f, 0.0, s)
+    pq.insert(heap_b, 0.0, t)
+    settled = 0
+    best = math.inf
+    meet = None
+
+    while not pq.is_empty(heap_f) and not pq.is_empty(heap_b):
+        top_f = dist_f[pq.get_first_priority(heap_f)]
+        top_b = dist_b[pq.get_first_priority(heap_b)]
+        if top_f + top_b >= best:
+            break
+
+        forward = top_f <= top_b
+        if forward:
+            graph, heap, dist, parent, done, other = \
+                my_graph, heap_f, dist_f, parent_f, done_f, dist_b
+        else:
+            graph, heap, dist, parent, done, other = \
+                reverse, heap_b, dist_b, parent_b, done_b, dist_f
+
+        u = pq.remove(heap)
+        done.add(u)
+        settled += 1
+
+        targets, weights = csr.neighbors_index(graph, u)
+        for k in range(len(targets)):
+            w = targets[k]
+            new_dist = dist[u] + weights[k]
+            if w in other and new_dist + other[w] < best:
+                best = new_dist + other[w]
+                meet = (u, w) if forward else (w, u)
+            if w in done:
+                continue
+
+            if w not in dist or new_dist < dist[w]:
+                dist[w] = new_dist
+                parent[w] = u
+                if not forward:
+                    weight_b[w] = weights[k]
+                if pq.contains(heap, w):
+                    pq.improve_priority(heap, new_dist, w)
+                else:
+                    pq.insert(heap, new_dist, w)
+
+    search["settled"] = settled
+    if meet is not None:
+        u, w = meet
+        total = dist_f[u] + _weight(my_graph, u, w)
+        current = w
+        while current != t:
+            total += weight_b[current]
+            current = parent_b[current]
+        search["dist_to"] = total
+        _join(my_graph, search, u, w, parent_f, parent_b)
+    return search
+
+
+def _weight(my_graph, u, w):
+    targets, weights = csr.neighbors_index(my_graph, u)
+    for k in range(len(targets)):
+        if targets[k] == w:
+            return weights[k]
+    raise Exception("El arco no existe")
+
+
+def _check_target(vertex, search):
+    if vertex != search["target"]:
+        raise Exception("La busqueda punto a punto solo conoce el destino")
+
+
+def has_path_to(vertex, search):
+    _check_target(vertex, search)
+    return search["path"] is not None
+
+
+def dist_to(vertex, search):
+    _check_target(vertex, search)
+    return search["dist_to"]
+
+
+def path_to(vertex, search):
+    """
+    Retorna una pila con el camino desde el origen (arriba) hasta vertex,
+    o None si no hay camino.
+    """
+    if not has_path_to(vertex, search):
+        return None
+    path = stack.new_stack()
+    for key in search["path"]:
+        stack.push(path, key)
+    return path
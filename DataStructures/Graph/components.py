@@ -0,0 +1,255 @@
+"""
+Componentes de un grafo CSR sobre los indices enteros de los vertices.
+
+- weakly_connected_components: componentes debilmente conectados (los
+  arcos se recorren en ambos sentidos).
+- strongly_connected_components: componentes fuertemente conectados
+  (algoritmo de Tarjan, sin recursion).
+- connected_components: cualquiera de los dos segun el modo.
+- condensation: grafo de componentes (un vertice por componente), que
+  siempre es un DAG.
+
+Los componentes se numeran 0..k-1 en el orden en que aparece su primer
+vertice en el grafo, asi la numeracion no depende del recorrido. Como los
+grafos CSR no cambian, los resultados quedan guardados en el grafo.
+"""
+from array import array
+
+from DataStructures.Graph import csr_graph as csr
+
+# Modos de connected_components
+WEAK = "weak"
+STRONG = "strong"
+
+# Llaves con las que los resultados quedan guardados en el grafo
+WCC_KEY = "weak_components"
+SCC_KEY = "strong_components"
+CONDENSATION_KEY = "condensation"
+
+
+def _as_csr(my_graph):
+    if csr.is_csr(my_graph):
+        return my_graph, True
+    return csr.from_digraph(my_graph), False
+
+
+def connected_components(my_graph, mode=WEAK):
+    """
+    Etiqueta cada vertice con su componente en una sola pasada O(V + E):
+    debilmente conectado (mode=WEAK) o fuertemente conectado (mode=STRONG).
+
+    Retorna el mismo diccionario que weakly_connected_components y
+    strongly_connected_components.
+    """
+    if mode == WEAK:
+        return weakly_connected_components(my_graph)
+    if mode == STRONG:
+        return strongly_connected_components(my_graph)
+    raise Exception("Modo de componentes no valido: " + str(mode))
+
+
+def weakly_connected_components(my_graph):
+    """
+    Etiqueta cada vertice con su componente debilmente conectado: dos
+    vertices estan en el mismo componente si hay un camino entre ellos
+    ignorando el sentido de los arcos.
+
+    Retorna un diccionario con:
+
+    - **component**: Arreglo con el componente de cada vertice (por indice).
+    - **count**: Numero de componentes.
+    - **sizes**: Arreglo con el numero de vertices de cada componente.
+
+    Recorre cada vertice y cada arco (en ambos sentidos, con
+    csr_graph.reverse) una vez. Si my_graph no es CSR se convierte primero
+    con csr_graph.from_digraph y el resultado no se guarda.
+    """
+    my_graph, cache = _as_csr(my_graph)
+    if cache and WCC_KEY in my_graph:
+        return my_graph[WCC_KEY]
+
+    n = csr.order(my_graph)
+    sides = (my_graph, csr.reverse(my_graph))
+    component = array("q", [-1]) * n
+    sizes = array("q")
+    count = 0
+
+    # cada recorrido empieza en el menor vertice sin componente, asi los
+    # componentes quedan numerados por su primer vertice
+    for root in range(n):
+        if component[root] != -1:
+            continue
+        component[root] = count
+        pending = [root]
+        pos = 0
+        while pos < len(pending):
+            u = pending[pos]
+            pos += 1
+            for graph in sides:
+                offsets = graph["offsets"]
+                targets = graph["targets"]
+                for k in range(offsets[u], offsets[u + 1]):
+                    w = targets[k]
+                    if component[w] == -1:
+                        component[w] = count
+                        pending.append(w)
+        sizes.append(len(pending))
+        count += 1
+
+    result = {"component": component, "count": count, "sizes": sizes}
+    if cache:
+        my_graph[WCC_KEY] = result
+    return result
+
+
+def component_members(components):
+    """
+    Retorna una lista con los vertices (por indice, en orden) de cada
+    componente de un resultado de connected_components.
+    """
+    members = [[] for _ in range(components["count"])]
+    component = components["component"]
+    for v in range(len(component)):
+        members[component[v]].append(v)
+    return members
+
+
+def strongly_connected_components(my_graph):
+    """
+    Etiqueta cada vertice con su componente fuertemente conectado.
+
+    Retorna un diccionario con:
+
+    - **component**: Arreglo con el componente de cada vertice (por indice).
+    - **count**: Numero de componentes.
+    - **sizes**: Arreglo con el numero de vertices de cada componente.
+
+    Corre en O(V + E). Si my_graph no es CSR se convierte primero con
+    csr_graph.from_digraph y el resultado no se guarda.
+    """
+    my_graph, cache = _as_csr(my_graph)
+    if cache and SCC_KEY in my_graph:
+        return my_graph[SCC_KEY]
+
+    label, count = _tarjan(my_graph)
+    result = _canonical(label, count)
+    if cache:
+        my_graph[SCC_KEY] = result
+    return result
+
+
+def _tarjan(my_graph):
+    n = csr.order(my_graph)
+    offsets = my_graph["offsets"]
+    targets = my_graph["targets"]
+
+    index = array("q", [-1]) * n
+    low = array("q", bytes(8 * n))
+    on_stack = bytearray(n)
+    label = array("q", [-1]) * n
+    stack = []
+    counter = 0
+    count = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = 1
+        # marcos (vertice, siguiente arco por revisar)
+        work = [(root, offsets[root])]
+
+        while work:
+            v, pos = work[-1]
+            end = offsets[v + 1]
+            descended = False
+            while pos < end:
+                w = targets[pos]
+                pos += 1
+                if index[w] == -1:
+                    work[-1] = (v, pos)
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = 1
+                    work.append((w, offsets[w]))
+                    descended = True
+                    break
+                if on_stack[w] and index[w] < low[v]:
+                    low[v] = index[w]
+            if descended:
+                continue
+
+            work.pop()
+            if low[v] == index[v]:
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    label[w] = count
+                    if w == v:
+                        break
+                count += 1
+            if work:
+                parent = work[-1][0]
+                if low[v] < low[parent]:
+                    low[parent] = low[v]
+
+    return label, count
+
+
+def _canonical(label, count):
+    """
+    Renumera los componentes en el orden de aparicion de su primer vertice.
+    """
+    remap = array("q", [-1]) * count
+    component = array("q", bytes(8 * len(label)))
+    sizes = array("q", bytes(8 * count))
+    following = 0
+    for v in range(len(label)):
+        c = remap[label[v]]
+        if c == -1:
+            c = following
+            remap[label[v]] = c
+            following += 1
+        component[v] = c
+        sizes[c] += 1
+    return {"component": component, "count": count, "sizes": sizes}
+
+
+def condensation(my_graph):
+    """
+    Retorna el grafo de componentes fuertemente conectados: un grafo CSR con
+    llaves 0..k-1 (los componentes) y un arco c -> d si algun arco u -> v
+    del grafo va de c a d, con peso 1.
+
+    El grafo guarda ademas en "links" el primer arco (u, v) del grafo
+    original (por indices) que produjo cada arco (c, d), recorriendo los
+    vertices y sus arcos en orden.
+    """
+    my_graph, cache = _as_csr(my_graph)
+    if cache and CONDENSATION_KEY in my_graph:
+        return my_graph[CONDENSATION_KEY]
+
+    scc = strongly_connected_components(my_graph)
+    component = scc["component"]
+    offsets = my_graph["offsets"]
+    targets = my_graph["targets"]
+
+    links = {}
+    for u in range(csr.order(my_graph)):
+        c = component[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            d = component[v]
+            if c != d and (c, d) not in links:
+                links[(c, d)] = (u, v)
+
+    count = scc["count"]
+    graph = csr.new_csr_graph(range(count), list(scc["sizes"]),
+                              ((c, d, 1.0) for c, d in links))
+    graph["links"] = links
+    if cache:
+        my_graph[CONDENSATION_KEY] = graph
+    return graph
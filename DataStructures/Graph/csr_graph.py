@@ -0,0 +1,246 @@
+"""
+Grafo dirigido congelado en formato CSR (compressed sparse row).
+
+Los vertices se numeran 0..n-1 en el orden en que se entregan. Los arcos del
+vertice i son las posiciones offsets[i]..offsets[i+1]-1 de los arreglos
+targets (indice del vertice destino) y weights (peso del arco).
+
+El grafo no se puede modificar despues de construido. Expone las mismas
+funciones de consulta que digraph (order, size, vertices, adjacents,
+edges_vertex, ...) recibiendo y retornando las llaves originales, asi que
+dfs, bfs, dijkstra y Prim funcionan sobre el sin cambios; digraph delega en
+este modulo cuando recibe un grafo CSR. Las funciones *_index trabajan
+directamente con los indices enteros.
+"""
+from array import array
+
+from DataStructures.Map import map_linear_probing as mlp
+from DataStructures.Graph import edge as edg
+
+CSR = "CSR"
+
+
+def new_csr_graph(keys, infos, edges):
+    """
+    Crea un grafo CSR.
+
+    :param keys: Llaves de los vertices, en orden (el indice de cada vertice es su posicion).
+    :param infos: Informacion (value) de cada vertice, en el mismo orden que keys.
+    :param edges: Iterable de tuplas (key_u, key_v, weight). Los arcos de cada
+        vertice conservan el orden en que aparecen. Si un arco se repite, el
+        ultimo peso reemplaza al anterior, igual que en digraph.add_edge.
+
+    :returns: Grafo CSR
+    """
+    index = {}
+    for i, key in enumerate(keys):
+        index[key] = i
+    n = len(index)
+
+    # arcos unicos por (u, v) conservando el orden de primera aparicion
+    pesos = {}
+    for key_u, key_v, weight in edges:
+        if key_u not in index:
+            raise Exception("El vertice u no existe")
+        if key_v not in index:
+            raise Exception("El vertice v no existe")
+        pesos[(index[key_u], index[key_v])] = weight
+
+    # conteo por vertice de origen y acumulado (counting sort estable)
+    offsets = array("q", bytes(8 * (n + 1)))
+    for u, _ in pesos:
+        offsets[u + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+
+    m = len(pesos)
+    targets = array("q", bytes(8 * m))
+    weights = array("d", bytes(8 * m))
+    siguiente = array("q", offsets[:n])
+    for (u, v), weight in pesos.items():
+        pos = siguiente[u]
+        targets[pos] = v
+        weights[pos] = weight
+        siguiente[u] = pos + 1
+
+    graph = {
+        "type": CSR,
+        "keys": list(keys),
+        "infos": list(infos),
+        "index": index,
+        "offsets": offsets,
+        "targets": targets,
+        "weights": weights,
+        "num_edges": m
+    }
+    return graph
+
+
+def from_digraph(my_graph):
+    """
+    Crea un grafo CSR con los mismos vertices, arcos y pesos de un digraph.
+    El orden de los vertices y de los arcos de cada vertice es el mismo que
+    entregan digraph.vertices y digraph.edges_vertex.
+    """
+    keys = []
+    infos = []
+    edges = []
+    vertices = mlp.value_set(my_graph["vertices"])
+    for vertex in vertices["elements"]:
+        keys.append(vertex["key"])
+        infos.append(vertex["value"])
+        for edge in mlp.value_set(vertex["adjacents"])["elements"]:
+            edges.append((vertex["key"], edge["to"], edge["weight"]))
+    return new_csr_graph(keys, infos, edges)
+
+
+def reverse(my_graph):
+    """
+    Retorna el grafo CSR con los mismos vertices (y los mismos indices) y
+    cada arco invertido. Se construye la primera vez y queda guardado en el
+    grafo, que no cambia.
+    """
+    reversed_graph = my_graph.get("reverse")
+    if reversed_graph is None:
+        keys = my_graph["keys"]
+        edges = []
+        for u in range(len(keys)):
+            targets, weights = neighbors_index(my_graph, u)
+            for k in range(len(targets)):
+                edges.append((keys[targets[k]], keys[u], weights[k]))
+        reversed_graph = new_csr_graph(keys, my_graph["infos"], edges)
+        my_graph["reverse"] = reversed_graph
+    return reversed_graph
+
+
+def is_csr(my_graph):
+    """
+    Retorna True si my_graph es un grafo CSR.
+    """
+    return my_graph.get("type") == CSR
+
+
+def _index(my_graph, key_u):
+    i = my_graph["index"].get(key_u)
+    if i is None:
+        raise Exception("El vertice no existe")
+    return i
+
+
+def index_of(my_graph, key_u):
+    """
+    Retorna el indice entero del vertice key_u, o -1 si no existe.
+    """
+    return my_graph["index"].get(key_u, -1)
+
+
+def key_of(my_graph, i):
+    """
+    Retorna la llave del vertice con indice i.
+    """
+    return my_graph["keys"][i]
+
+
+def contains_vertex(my_graph, key_u):
+    """
+    Retorna True si el vertice con llave key_u existe en el grafo.
+    """
+    return key_u in my_graph["index"]
+
+
+def order(my_graph):
+    """
+    Retorna el numero de vertices del grafo.
+    """
+    return len(my_graph["keys"])
+
+
+def size(my_graph):
+    """
+    Retorna el numero de arcos del grafo.
+    """
+    return my_graph["num_edges"]
+
+
+def degree(my_graph, key_u):
+    """
+    Retorna el numero de arcos salientes del vertice key_u (0 si no existe).
+    """
+    i = my_graph["index"].get(key_u)
+    if i is None:
+        return 0
+    return degree_index(my_graph, i)
+
+
+def degree_index(my_graph, i):
+    """
+    Retorna el numero de arcos salientes del vertice con indice i.
+    """
+    return my_graph["offsets"][i + 1] - my_graph["offsets"][i]
+
+
+def neighbors_index(my_graph, i):
+    """
+    Retorna (targets, weights) del vertice con indice i: los indices de los
+    destinos y los pesos de sus arcos, en el mismo orden.
+    """
+    inicio = my_graph["offsets"][i]
+    fin = my_graph["offsets"][i + 1]
+    return my_graph["targets"][inicio:fin], my_graph["weights"][inicio:fin]
+
+
+def vertices(my_graph):
+    """
+    Retorna una array_list con las llaves de todos los vertices.
+    """
+    keys = my_graph["keys"]
+    return {"elements": list(keys), "size": len(keys)}
+
+
+def adjacents(my_graph, key_u):
+    """
+    Retorna una array_list con las llaves de los vertices adyacentes a key_u.
+    """
+    i = _index(my_graph, key_u)
+    keys = my_graph["keys"]
+    inicio = my_graph["offsets"][i]
+    fin = my_graph["offsets"][i + 1]
+    elements = [keys[v] for v in my_graph["targets"][inicio:fin]]
+    return {"elements": elements, "size": len(elements)}
+
+
+def edges_vertex(my_graph, key_u):
+    """
+    Retorna una array_list con los arcos ({"to", "weight"}) del vertice key_u.
+    Los arcos se crean en cada llamado; modificarlos no cambia el grafo.
+    """
+    i = _index(my_graph, key_u)
+    keys = my_graph["keys"]
+    targets = my_graph["targets"]
+    weights = my_graph["weights"]
+    elements = []
+    for pos in range(my_graph["offsets"][i], my_graph["offsets"][i + 1]):
+        elements.append(edg.new_edge(keys[targets[pos]], weights[pos]))
+    return {"elements": elements, "size": len(elements)}
+
+
+def get_edge(my_graph, key_u, key_v):
+    """
+    Retorna el arco key_u -> key_v, o None si no existe.
+    """
+    i = my_graph["index"].get(key_u)
+    j = my_graph["index"].get(key_v)
+    if i is None or j is None:
+        return None
+    targets = my_graph["targets"]
+    for pos in range(my_graph["offsets"][i], my_graph["offsets"][i + 1]):
+        if targets[pos] == j:
+            return edg.new_edge(key_v, my_graph["weights"][pos])
+    return None
+
+
+def get_vertex_information(my_graph, key_u):
+    """
+    Retorna la informacion (value) del vertice key_u.
+    """
+    return my_graph["infos"][_index(my_graph, key_u)]
@@ -51,6 +51,51 @@ def dfs_vertex(my_graph, vertex, dfo):
     stack.push(dfo["reversepost"], vertex)
     
     
+def dfs_iterative(my_graph, source):
+    """
+    Ejecuta DFS desde un vertice origen sin recursion, con una pila explicita.
+    Visita los vertices en el mismo orden que dfs, asi que retorna una
+    dfo_structure identica (marked, edge_to, pre, post y reversepost), pero
+    no depende del limite de recursion de Python: sirve para caminos de
+    cualquier profundidad.
+    """
+
+    # crear la estructura
+    dfo = new_dfo_structure(G.order(my_graph))
+
+    dfo["edge_to"] = map.new_map(G.order(my_graph),0.5)
+
+    # cada marco de la pila es [vertice, adyacentes, siguiente posicion]
+    map.put(dfo["marked"], source, True)
+    queue.enqueue(dfo["pre"], source)
+    pila = [[source, G.adjacents(my_graph, source)["elements"], 0]]
+
+    while pila:
+        marco = pila[-1]
+        vertex, adjs, pos = marco
+
+        # buscar el siguiente vecino sin visitar
+        while pos < len(adjs) and map.contains(dfo["marked"], adjs[pos]):
+            pos += 1
+
+        if pos < len(adjs):
+            w = adjs[pos]
+            marco[2] = pos + 1
+            map.put(dfo["marked"], w, True)
+            map.put(dfo["edge_to"], w, vertex)
+            queue.enqueue(dfo["pre"], w)
+            pila.append([w, G.adjacents(my_graph, w)["elements"], 0])
+        else:
+            # todos los vecinos visitados: postorden
+            pila.pop()
+            queue.enqueue(dfo["post"], vertex)
+            stack.push(dfo["reversepost"], vertex)
+
+    dfo["source"] = source
+
+    return dfo
+
+
 def has_path_to(vertex, dfo):
     """
     Retorna True si vertex fue visitado.
@@ -2,6 +2,10 @@ from DataStructures.Map import map_functions as mf
 import DataStructures.Map.map_linear_probing as mlp
 
 from DataStructures.Graph import vertex as vtx
+from DataStructures.Graph import csr_graph as csr
+
+# Las funciones de consulta tambien aceptan grafos congelados en formato CSR
+# (ver csr_graph.py) y les delegan la operacion.
 
 
 def new_graph(order):
@@ -13,6 +17,9 @@ def new_graph(order):
     return graph
 
 def insert_vertex(my_graph, key_u, info_u):
+    if csr.is_csr(my_graph):
+        raise Exception("El grafo CSR no se puede modificar")
+
     # Crear un nuevo vértice 
     new_v = vtx.new_vertex(key_u, info_u)
 
@@ -23,6 +30,9 @@ def insert_vertex(my_graph, key_u, info_u):
 
 
 def add_edge(my_graph, key_u, key_v, weight=1.0):
+    if csr.is_csr(my_graph):
+        raise Exception("El grafo CSR no se puede modificar")
+
     # Buscar el vertice u
     vertex_u = mlp.get(my_graph["vertices"], key_u)
     if vertex_u is None:
@@ -52,18 +62,24 @@ def contains_vertex(my_graph, key_u):
     """
     Retorna True si el vertice con llave key_u existe en el grafo.
     """
+    if csr.is_csr(my_graph):
+        return csr.contains_vertex(my_graph, key_u)
     return mlp.contains(my_graph["vertices"], key_u)
 
 def order(my_graph):
     """
     Retorna el número de vértices del grafo (orden).
     """
+    if csr.is_csr(my_graph):
+        return csr.order(my_graph)
     return mlp.size(my_graph["vertices"])
 
 def size(my_graph):
     """
     Retorna el número de aristas del grafo.
     """
+    if csr.is_csr(my_graph):
+        return csr.size(my_graph)
     return my_graph["num_edges"]
 
 
@@ -71,6 +87,8 @@ def degree(my_graph, key_u):
     """
     Retorna el grado (número de arcos salientes) del vértice key_u.
     """
+    if csr.is_csr(my_graph):
+        return csr.degree(my_graph, key_u)
     vertex = mlp.get(my_graph["vertices"], key_u)
     if vertex is None:
         return 0  # No existe
@@ -82,6 +100,8 @@ def adjacents(my_graph, key_u):
     """
     Retorna una lista con las llaves de los vértices adyacentes a key_u.
     """
+    if csr.is_csr(my_graph):
+        return csr.adjacents(my_graph, key_u)
     vertex = mlp.get(my_graph["vertices"], key_u)
     if vertex is None:
         raise Exception("El vertice no existe")
@@ -95,6 +115,8 @@ def vertices(my_graph):
     """
     Retorna una array_list con las llaves de todos los vertices.
     """
+    if csr.is_csr(my_graph):
+        return csr.vertices(my_graph)
     # Obtener los vertices del grafo
     vertices_map = my_graph["vertices"]
 
@@ -104,6 +126,8 @@ def edges_vertex(my_graph, key_u):
     """
     Retorna una lista con todos los arcos del vertice key_u.
     """
+    if csr.is_csr(my_graph):
+        return csr.edges_vertex(my_graph, key_u)
     vertex = mlp.get(my_graph["vertices"], key_u)
     if vertex is None:
         raise Exception("El vertice no existe")
@@ -114,13 +138,36 @@ def edges_vertex(my_graph, key_u):
 def get_vertex(my_graph, key_u):
     """
     Retorna el vertice completo con llave key_u.
-    """
+    En un grafo CSR el vertice se arma en cada llamado (es una copia).
+    """
+    if csr.is_csr(my_graph):
+        if not csr.contains_vertex(my_graph, key_u):
+            return None
+        vertex = vtx.new_vertex(key_u, csr.get_vertex_information(my_graph, key_u))
+        for edge in csr.edges_vertex(my_graph, key_u)["elements"]:
+            vtx.add_adjacent(vertex, edge["to"], edge["weight"])
+        return vertex
     return mlp.get(my_graph["vertices"], key_u)
 
+def get_edge(my_graph, key_u, key_v):
+    """
+    Retorna el arco key_u -> key_v, o None si no existe.
+    """
+    if csr.is_csr(my_graph):
+        return csr.get_edge(my_graph, key_u, key_v)
+
+    vertex = mlp.get(my_graph["vertices"], key_u)
+    if vertex is None:
+        return None
+
+    return vtx.get_edge(vertex, key_v)
+
 def get_vertex_information(my_graph, key_u):
     """
     Retorna la informacion (value) del vertice con llave key_u.
     """
+    if csr.is_csr(my_graph):
+        return csr.get_vertex_information(my_graph, key_u)
     vertex = mlp.get(my_graph["vertices"], key_u)
 
     if vertex is None:
@@ -133,6 +180,9 @@ def update_vertex_info(my_graph, key_u, new_info_u):
     """
     Actualiza la informacion del vertice key_u.
     """
+    if csr.is_csr(my_graph):
+        raise Exception("El grafo CSR no se puede modificar")
+
     vertices_map = my_graph["vertices"]
 
     # Buscar el vertice
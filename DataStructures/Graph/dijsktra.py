@@ -1,10 +1,12 @@
 import math
-from DataStructures.Map import priority_queue as pq
+from DataStructures.Map import index_priority_queue as pq
 from DataStructures.Graph import digraph as dg
 from DataStructures.Map import map_linear_probing as map
 from DataStructures.Stack import stack as stack
 from DataStructures.Graph import dijsktra_structure as dijsktra_structure
 from DataStructures.List import array_list as lt
+from DataStructures.Graph import csr_graph as csr
+from array import array
 
 
 def dijkstra(my_graph, source):
@@ -74,12 +76,212 @@ def dijkstra(my_graph, source):
     return search
 
 
+def new_workspace(my_graph):
+    """
+    Crea el espacio de trabajo reutilizable de dijkstra_to para un grafo CSR:
+    arreglos de distancia y padre indexados por el indice entero de cada
+    vertice.
+
+    Para no limpiar los arreglos en cada consulta, cada busqueda usa un sello
+    (stamp) nuevo: la distancia de un vertice solo es valida si seen[i] es el
+    sello actual, y el vertice esta establecido si settled[i] es el sello
+    actual. Asi el costo de una consulta es proporcional a la region
+    explorada y no al tamaño del grafo.
+    """
+    n = csr.order(my_graph)
+    workspace = {
+        "dist": array("d", bytes(8 * n)),
+        "parent": array("q", bytes(8 * n)),
+        "seen": array("q", bytes(8 * n)),
+        "settled": array("q", bytes(8 * n)),
+        "stamp": 0
+    }
+    return workspace
+
+
+def dijkstra_to(my_graph, source, target, workspace=None):
+    """
+    Dijkstra punto a punto: busca el camino mas corto de source a target y
+    se detiene en cuanto target queda establecido.
+
+    Los vertices se inicializan solo cuando se alcanzan y el estado vive en
+    un espacio de trabajo (ver new_workspace) que se reutiliza entre
+    consultas; si no se pasa uno, se usa el que el grafo guarda para ello.
+    Las operaciones sobre la cola de prioridad son las mismas de dijkstra,
+    asi que el camino encontrado es el mismo.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+
+    Retorna una busqueda que has_path_to, dist_to y path_to aceptan solo
+    para target, con "settled" = numero de vertices establecidos.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+
+    s = csr.index_of(my_graph, source)
+    t = csr.index_of(my_graph, target)
+    if s == -1:
+        raise Exception("El vertice no existe")
+
+    if workspace is None:
+        workspace = my_graph.get("workspace")
+        if workspace is None:
+            workspace = new_workspace(my_graph)
+            my_graph["workspace"] = workspace
+
+    workspace["stamp"] += 1
+    stamp = workspace["stamp"]
+    dist = workspace["dist"]
+    parent = workspace["parent"]
+    seen = workspace["seen"]
+    settled = workspace["settled"]
+
+    dist[s] = 0.0
+    parent[s] = -1
+    seen[s] = stamp
+    heap = pq.new_heap()
+    pq.insert(heap, 0, s)
+    count = 0
+
+    while not pq.is_empty(heap):
+        u = pq.remove(heap)
+        if settled[u] == stamp:
+            continue
+        settled[u] = stamp
+        count += 1
+        if u == t:
+            break
+
+        targets, weights = csr.neighbors_index(my_graph, u)
+        for k in range(len(targets)):
+            w = targets[k]
+            if settled[w] == stamp:
+                continue
+
+            new_dist = dist[u] + weights[k]
+            if seen[w] != stamp or new_dist < dist[w]:
+                seen[w] = stamp
+                dist[w] = new_dist
+                parent[w] = u
+
+                if pq.contains(heap, w):
+                    pq.improve_priority(heap, new_dist, w)
+                else:
+                    pq.insert(heap, new_dist, w)
+
+    search = {
+        "source": source,
+        "target": target,
+        "dist_to": math.inf,
+        "path": None,
+        "settled": count
+    }
+    if t != -1 and settled[t] == stamp:
+        # se copia el camino: la busqueda sigue valida aunque el espacio de
+        # trabajo se reutilice
+        path = []
+        current = t
+        while current != -1:
+            path.append(csr.key_of(my_graph, current))
+            current = parent[current]
+        search["dist_to"] = dist[t]
+        search["path"] = path
+    return search
+
+
+def dijkstra_tree(my_graph, source):
+    """
+    Dijkstra desde source hacia todos los vertices, guardando el arbol de
+    caminos mas cortos en arreglos indexados por el indice entero de cada
+    vertice (en lugar de mapas como dijkstra).
+
+    Las operaciones sobre la cola de prioridad son las mismas de dijkstra y
+    dijkstra_to, asi que el camino a cada vertice es el mismo. La busqueda
+    es independiente del grafo y de su espacio de trabajo, asi que se puede
+    guardar y consultar despues con has_path_to, dist_to y path_to para
+    cualquier vertice.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+
+    s = csr.index_of(my_graph, source)
+    if s == -1:
+        raise Exception("El vertice no existe")
+
+    n = csr.order(my_graph)
+    dist = array("d", [math.inf]) * n
+    parent = array("q", [-1]) * n
+    settled = bytearray(n)
+
+    dist[s] = 0.0
+    heap = pq.new_heap()
+    pq.insert(heap, 0, s)
+    count = 0
+
+    while not pq.is_empty(heap):
+        u = pq.remove(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        count += 1
+
+        targets, weights = csr.neighbors_index(my_graph, u)
+        for k in range(len(targets)):
+            w = targets[k]
+            if settled[w]:
+                continue
+
+            new_dist = dist[u] + weights[k]
+            if new_dist < dist[w]:
+                dist[w] = new_dist
+                parent[w] = u
+
+                if pq.contains(heap, w):
+                    pq.improve_priority(heap, new_dist, w)
+                else:
+                    pq.insert(heap, new_dist, w)
+
+    search = {
+        "source": source,
+        "index": my_graph["index"],
+        "keys": my_graph["keys"],
+        "dist": dist,
+        "parent": parent,
+        "settled": count
+    }
+    return search
+
+
+def _tree_index(vertex, search):
+    i = search["index"].get(vertex)
+    if i is None:
+        raise Exception("El vertice no existe")
+    return i
+
+
+def _check_target(vertex, search):
+    if vertex != search["target"]:
+        raise Exception("La busqueda punto a punto solo conoce el destino")
+
+
 def has_path_to(vertex,search):
+    if "target" in search:
+        _check_target(vertex, search)
+        return search["path"] is not None
+    if "parent" in search:
+        return search["dist"][_tree_index(vertex, search)] < math.inf
     v_info = map.get(search["visited"], vertex)
     return v_info is not None and v_info["dist_to"] < math.inf
 
 
 def dist_to(vertex,search):
+    if "target" in search:
+        _check_target(vertex, search)
+        return search["dist_to"]
+    if "parent" in search:
+        return search["dist"][_tree_index(vertex, search)]
     v_info = map.get(search["visited"], vertex)
     return v_info["dist_to"]
 
@@ -88,6 +290,23 @@ def path_to(vertex, search):
     if not has_path_to(vertex, search):
         return None
 
+    if "target" in search:
+        # path va del destino al origen: apilado queda el origen arriba
+        path = stack.new_stack()
+        for key in search["path"]:
+            stack.push(path, key)
+        return path
+
+    if "parent" in search:
+        path = stack.new_stack()
+        keys = search["keys"]
+        parent = search["parent"]
+        current = _tree_index(vertex, search)
+        while current != -1:
+            stack.push(path, keys[current])
+            current = parent[current]
+        return path
+
     path = stack.new_stack()
     current = vertex
     source = search["source"]
@@ -0,0 +1,167 @@
+"""
+Camino mas largo (por peso de vertices) en un grafo dirigido cualquiera.
+
+Un grafo con ciclos no tiene camino simple mas largo calculable en tiempo
+lineal, asi que cada componente fuertemente conectado se colapsa en un solo
+vertice (components.condensation) cuyo peso es la suma de los pesos de sus
+vertices, y la programacion dinamica corre sobre el DAG de componentes en
+orden topologico. Si el grafo ya es un DAG cada componente es un vertice y
+el resultado es el camino mas largo usual.
+"""
+from array import array
+
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Graph import components as cc
+from DataStructures.Graph import topological as topo
+
+
+def longest_path(my_graph, vertex_weights=None):
+    """
+    Busca la cadena de componentes fuertemente conectados de mayor peso.
+
+    :param my_graph: Grafo (CSR o digraph)
+    :param vertex_weights: Peso de cada vertice por indice; por defecto 1,
+        asi el peso de un componente es su numero de vertices.
+
+    Retorna None si el grafo no tiene vertices; si no, un diccionario con:
+
+    - **path**: Llaves de los vertices del camino; cada dos consecutivos
+      hay un arco. Cada componente aporta un recorrido (ver _walk) que
+      empieza en el vertice por el que se entra, pasa por todos sus
+      vertices y termina en el vertice por el que se sale al siguiente
+      componente; dentro de un ciclo un vertice puede repetirse.
+    - **weight**: Peso total del camino.
+    - **components**: Componentes del camino, en orden.
+    - **cycles**: Por cada componente del camino con mas de un vertice (un
+      ciclo colapsado), su recorrido (llaves en el orden de path).
+    - **collapsed**: Numero de componentes con mas de un vertice en todo el grafo.
+
+    Entre caminos de igual peso gana el que la relajacion en orden
+    topologico encuentra primero, y entre finales empatados el primer
+    componente.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    n = csr.order(my_graph)
+    if n == 0:
+        return None
+
+    scc = cc.strongly_connected_components(my_graph)
+    component = scc["component"]
+    count = scc["count"]
+    dag = cc.condensation(my_graph)
+    links = dag["links"]
+
+    weight = array("d", bytes(8 * count))
+    for v in range(n):
+        weight[component[v]] += 1 if vertex_weights is None else vertex_weights[v]
+
+    best = array("d", weight)
+    prev = array("q", [-1]) * count
+    for c in topo.topological_order(dag):
+        targets, _ = csr.neighbors_index(dag, c)
+        for d in targets:
+            if best[c] + weight[d] > best[d]:
+                best[d] = best[c] + weight[d]
+                prev[d] = c
+
+    last = 0
+    for c in range(1, count):
+        if best[c] > best[last]:
+            last = c
+
+    chain = []
+    c = last
+    while c != -1:
+        chain.append(c)
+        c = prev[c]
+    chain.reverse()
+
+    members = _members(component, chain)
+    keys = my_graph["keys"]
+    path = []
+    cycles = []
+    for pos, c in enumerate(chain):
+        entry = links[(chain[pos - 1], c)][1] if pos > 0 else members[c][0]
+        leave = links[(c, chain[pos + 1])][0] if pos + 1 < len(chain) else -1
+        walk = _walk(my_graph, component, c, entry, leave, len(members[c]))
+        path.extend(keys[v] for v in walk)
+        if len(walk) > 1:
+            cycles.append([keys[v] for v in walk])
+
+    collapsed = 0
+    for size in scc["sizes"]:
+        if size > 1:
+            collapsed += 1
+
+    result = {
+        "path": path,
+        "weight": best[last],
+        "components": chain,
+        "cycles": cycles,
+        "collapsed": collapsed
+    }
+    return result
+
+
+def _members(component, chain):
+    """
+    Vertices (por indice, en orden) de cada componente de la cadena.
+    """
+    wanted = set(chain)
+    members = {c: [] for c in chain}
+    for v in range(len(component)):
+        if component[v] in wanted:
+            members[component[v]].append(v)
+    return members
+
+
+def _walk(my_graph, component, c, entry, leave, size):
+    """
+    Recorrido por arcos del componente c que empieza en entry, visita sus
+    size vertices y termina en leave si se indica. Desde el vertice actual
+    se va (por el camino con menos arcos dentro del componente) al vertice
+    sin visitar mas cercano, y al final a leave. Como el componente es
+    fuertemente conectado, siempre hay camino.
+    """
+    if size == 1:
+        return [entry]
+    walk = [entry]
+    visited = {entry}
+    current = entry
+    while len(visited) < size:
+        route = _route(my_graph, component, c, current, visited, -1)
+        walk.extend(route)
+        visited.update(route)
+        current = route[-1]
+    if leave != -1 and leave != current:
+        walk.extend(_route(my_graph, component, c, current, None, leave))
+    return walk
+
+
+def _route(my_graph, component, c, start, visited, goal):
+    """
+    BFS dentro del componente c desde start hasta goal (o, si goal es -1,
+    hasta el primer vertice que no esta en visited). Retorna los vertices
+    del camino sin start.
+    """
+    parent = {start: -1}
+    pending = [start]
+    pos = 0
+    while pos < len(pending):
+        u = pending[pos]
+        pos += 1
+        targets, _ = csr.neighbors_index(my_graph, u)
+        for w in targets:
+            if component[w] != c or w in parent:
+                continue
+            parent[w] = u
+            if w == goal or (goal == -1 and w not in visited):
+                route = []
+                while w != start:
+                    route.append(w)
+                    w = parent[w]
+                route.reverse()
+                return route
+            pending.append(w)
+    return []
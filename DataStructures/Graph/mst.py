@@ -0,0 +1,146 @@
+"""
+Arboles de expansion minima sobre los indices enteros de un grafo CSR.
+
+- prim_mst: Prim desde un origen con una cola de prioridad indexada y
+  arreglos planos dist_to / edge_from / marked. Por defecto sigue el
+  sentido de los arcos (solo usa los arcos que salen de cada vertice del
+  arbol), igual que el Prim con mapas de req_4; con undirected=True usa los
+  arcos en ambos sentidos.
+- kruskal_mst: Kruskal con union-find sobre todos los arcos tomados sin
+  sentido; retorna el bosque de expansion minima de todo el grafo.
+"""
+import math
+from array import array
+
+from DataStructures.Graph import csr_graph as csr
+from DataStructures.Map import index_priority_queue as pq
+from DataStructures.UnionFind import union_find as uf
+
+
+def prim_mst(my_graph, source, undirected=False):
+    """
+    Ejecuta Prim desde source y retorna el arbol encontrado.
+
+    La cola de prioridad recibe las mismas operaciones (insert,
+    improve_priority, remove) en el mismo orden que el Prim con mapas, asi
+    que el arbol es el mismo.
+
+    Retorna un diccionario con:
+
+    - **source**: Vertice de inicio.
+    - **keys**: Llaves de los vertices (por indice).
+    - **marked**: marked[i] = 1 si el vertice i esta en el arbol.
+    - **edge_from**: Indice del vertice desde el que se llega a i en el arbol (-1 si no hay).
+    - **dist_to**: Peso del arco con el que i entra al arbol (0 para el origen, inf si no esta).
+    - **size**: Numero de vertices del arbol.
+    - **weight**: Suma de los pesos de los arcos del arbol.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    s = csr.index_of(my_graph, source)
+    if s == -1:
+        raise Exception("El vertice no existe")
+
+    n = csr.order(my_graph)
+    sides = [my_graph]
+    if undirected:
+        sides.append(csr.reverse(my_graph))
+
+    marked = bytearray(n)
+    edge_from = array("q", [-1]) * n
+    dist_to = array("d", [math.inf]) * n
+    heap = pq.new_heap()
+
+    dist_to[s] = 0.0
+    pq.insert(heap, 0, s)
+    size = 0
+    weight = 0.0
+
+    while not pq.is_empty(heap):
+        u = pq.remove(heap)
+        if marked[u]:
+            continue
+        marked[u] = 1
+        size += 1
+        if u != s:
+            weight += dist_to[u]
+
+        for graph in sides:
+            offsets = graph["offsets"]
+            targets = graph["targets"]
+            weights = graph["weights"]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if marked[v]:
+                    continue
+                if weights[k] < dist_to[v]:
+                    dist_to[v] = weights[k]
+                    edge_from[v] = u
+                    if pq.contains(heap, v):
+                        pq.improve_priority(heap, weights[k], v)
+                    else:
+                        pq.insert(heap, weights[k], v)
+
+    result = {
+        "source": source,
+        "keys": my_graph["keys"],
+        "marked": marked,
+        "edge_from": edge_from,
+        "dist_to": dist_to,
+        "size": size,
+        "weight": weight
+    }
+    return result
+
+
+def kruskal_mst(my_graph):
+    """
+    Ejecuta Kruskal sobre todos los arcos del grafo tomados sin sentido: los
+    arcos se recorren de menor a mayor peso (entre pesos iguales, en el
+    orden del grafo) y se agrega cada arco que une dos arboles distintos
+    (union-find).
+
+    Retorna un diccionario con:
+
+    - **keys**: Llaves de los vertices (por indice).
+    - **edges**: Lista de arcos (u, v, peso) del bosque, por indices, en el orden en que se agregaron.
+    - **weight**: Suma de los pesos de los arcos del bosque.
+    - **components**: Union-find con los arboles del bosque.
+
+    Si my_graph no es CSR se convierte primero con csr_graph.from_digraph.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+
+    n = csr.order(my_graph)
+    offsets = my_graph["offsets"]
+    targets = my_graph["targets"]
+    weights = my_graph["weights"]
+
+    # posiciones de los arcos en el CSR ordenadas por peso (sort estable)
+    order = sorted(range(csr.size(my_graph)), key=weights.__getitem__)
+    source_of = array("q", bytes(8 * len(targets)))
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            source_of[k] = u
+
+    forest = uf.new_union_find(n)
+    edges = []
+    weight = 0.0
+    for k in order:
+        u, v = source_of[k], targets[k]
+        if uf.union(forest, u, v):
+            edges.append((u, v, weights[k]))
+            weight += weights[k]
+            if len(edges) == n - 1:
+                break
+
+    result = {
+        "keys": my_graph["keys"],
+        "edges": edges,
+        "weight": weight,
+        "components": forest
+    }
+    return result
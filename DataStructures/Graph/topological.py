@@ -0,0 +1,84 @@
+"""
+Orden topologico (algoritmo de Kahn) sobre los indices enteros de un grafo
+CSR.
+
+Los grados de entrada se guardan en un arreglo plano que se llena con una
+sola pasada por el arreglo de destinos del grafo. La cola de vertices con
+grado 0 empieza con los vertices en su orden y se procesa en orden FIFO,
+recorriendo los arcos de cada vertice en su orden, asi que el resultado es
+el mismo de la version con mapas.
+
+Como los grafos CSR no cambian, el orden se calcula una sola vez y queda
+guardado en el grafo.
+"""
+from array import array
+
+from DataStructures.Graph import csr_graph as csr
+
+# Llave con la que el orden queda guardado en el grafo
+CACHE_KEY = "topological_order"
+
+
+def topological_order(my_graph):
+    """
+    Retorna un arreglo con los indices de los vertices en orden topologico,
+    o None si el grafo tiene un ciclo.
+
+    En un grafo CSR el resultado se guarda en el grafo y las llamadas
+    siguientes lo retornan sin recalcular. Si my_graph no es CSR se
+    convierte primero con csr_graph.from_digraph (y no se guarda nada,
+    porque un digraph puede cambiar).
+    """
+    if not csr.is_csr(my_graph):
+        return _kahn(csr.from_digraph(my_graph))
+
+    if CACHE_KEY not in my_graph:
+        my_graph[CACHE_KEY] = _kahn(my_graph)
+    return my_graph[CACHE_KEY]
+
+
+def topological_keys(my_graph):
+    """
+    Retorna una array_list con las llaves de los vertices en orden
+    topologico, o None si el grafo tiene un ciclo.
+    """
+    if not csr.is_csr(my_graph):
+        my_graph = csr.from_digraph(my_graph)
+    order = topological_order(my_graph)
+    if order is None:
+        return None
+    keys = my_graph["keys"]
+    elements = [keys[i] for i in order]
+    return {"elements": elements, "size": len(elements)}
+
+
+def is_dag(my_graph):
+    """
+    Retorna True si el grafo no tiene ciclos.
+    """
+    return topological_order(my_graph) is not None
+
+
+def _kahn(my_graph):
+    n = csr.order(my_graph)
+    offsets = my_graph["offsets"]
+    targets = my_graph["targets"]
+
+    indegree = array("q", bytes(8 * n))
+    for w in targets:
+        indegree[w] += 1
+
+    order = array("q", [u for u in range(n) if indegree[u] == 0])
+    pos = 0
+    while pos < len(order):
+        u = order[pos]
+        pos += 1
+        for k in range(offsets[u], offsets[u + 1]):
+            w = targets[k]
+            indegree[w] -= 1
+            if indegree[w] == 0:
+                order.append(w)
+
+    if len(order) != n:
+        return None
+    return order
@@ -86,7 +86,7 @@ def add_last(my_list, element):
 def remove_first(lst):
     """
     Elimina y retorna el primer elemento de la lista.
-    Lanza IndexError si la lista está vacía.
+    Si la lista está vacía, lo informa y retorna None.
     """
     if lst["size"] == 0:
         print("La lista está vacía")
@@ -0,0 +1,101 @@
+import random
+
+import pytest
+from DataStructures.Map import index_priority_queue as ipq
+from DataStructures.Map import priority_queue as pq
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+def check_index(heap):
+    elements = heap["elements"]["elements"]
+    assert len(heap["index"]) == heap["size"]
+    for value, pos in heap["index"].items():
+        assert elements[pos]["value"] == value
+
+
+@handle_not_implemented
+def test_new_heap():
+    heap = ipq.new_heap()
+    assert ipq.size(heap) == 0
+    assert ipq.is_empty(heap)
+    assert ipq.remove(heap) is None
+    assert ipq.get_first_priority(heap) is None
+
+
+@handle_not_implemented
+def test_insert_remove():
+    heap = ipq.new_heap()
+    for priority, value in [(5, "a"), (1, "b"), (3, "c"), (4, "d")]:
+        ipq.insert(heap, priority, value)
+        check_index(heap)
+
+    assert ipq.size(heap) == 4
+    assert ipq.get_first_priority(heap) == "b"
+    assert [ipq.remove(heap) for _ in range(4)] == ["b", "c", "d", "a"]
+    assert ipq.is_empty(heap)
+    check_index(heap)
+
+    with pytest.raises(Exception):
+        ipq.insert(heap, 1, "x")
+        ipq.insert(heap, 2, "x")
+
+
+@handle_not_implemented
+def test_max_heap():
+    heap = ipq.new_heap(is_min_pq=False)
+    for priority, value in [(5, "a"), (1, "b"), (3, "c")]:
+        ipq.insert(heap, priority, value)
+    assert [ipq.remove(heap) for _ in range(3)] == ["a", "c", "b"]
+
+
+@handle_not_implemented
+def test_contains_improve_priority():
+    heap = ipq.new_heap()
+    for priority, value in [(5, "a"), (6, "b"), (7, "c")]:
+        ipq.insert(heap, priority, value)
+
+    assert ipq.contains(heap, "c")
+    assert not ipq.contains(heap, "z")
+    assert ipq.is_present_value(heap, "z") == -1
+
+    # una prioridad peor no cambia nada
+    ipq.improve_priority(heap, 9, "c")
+    assert ipq.get_first_priority(heap) == "a"
+
+    ipq.improve_priority(heap, 1, "c")
+    check_index(heap)
+    assert ipq.get_first_priority(heap) == "c"
+
+    ipq.remove(heap)
+    assert not ipq.contains(heap, "c")
+    check_index(heap)
+
+
+@handle_not_implemented
+def test_same_behaviour_as_priority_queue():
+    rng = random.Random(7)
+    a = pq.new_heap()
+    b = ipq.new_heap()
+    present = set()
+
+    for step in range(2000):
+        op = rng.random()
+        if op < 0.5:
+            value = rng.randrange(300)
+            priority = rng.randrange(50)
+            if value in present:
+                pq.improve_priority(a, priority, value)
+                ipq.improve_priority(b, priority, value)
+            else:
+                pq.insert(a, priority, value)
+                ipq.insert(b, priority, value)
+                present.add(value)
+        else:
+            x = pq.remove(a)
+            y = ipq.remove(b)
+            assert x == y
+            present.discard(x)
+
+        assert a["elements"]["elements"] == b["elements"]["elements"]
+        assert pq.contains(a, 5) == ipq.contains(b, 5)
+    check_index(b)
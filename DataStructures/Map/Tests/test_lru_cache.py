@@ -0,0 +1,51 @@
+import pytest
+from DataStructures.Map import lru_cache as lru
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_lru_cache():
+    cache = lru.new_lru_cache(3)
+    assert lru.size(cache) == 0
+    assert lru.is_empty(cache)
+    assert lru.get(cache, "a") is None
+    assert cache["misses"] == 1
+    with pytest.raises(Exception):
+        lru.new_lru_cache(0)
+
+
+@handle_not_implemented
+def test_evicts_least_recently_used():
+    cache = lru.new_lru_cache(3)
+    for key in ("a", "b", "c"):
+        lru.put(cache, key, key.upper())
+    assert lru.keys(cache)["elements"] == ["a", "b", "c"]
+
+    # usar "a" la deja como la más reciente
+    assert lru.get(cache, "a") == "A"
+    lru.put(cache, "d", "D")
+    assert lru.size(cache) == 3
+    assert not lru.contains(cache, "b")
+    assert lru.keys(cache)["elements"] == ["c", "a", "d"]
+
+    # reemplazar un valor también cuenta como uso
+    lru.put(cache, "c", "C2")
+    lru.put(cache, "e", "E")
+    assert lru.keys(cache)["elements"] == ["d", "c", "e"]
+    assert lru.get(cache, "c") == "C2"
+    assert cache["hits"] == 2
+
+
+@handle_not_implemented
+def test_tuple_keys_remove_and_clear():
+    cache = lru.new_lru_cache(2)
+    lru.put(cache, ("grafo_1", "n1"), 1)
+    lru.put(cache, ("grafo_2", "n1"), 2)
+    assert lru.get(cache, ("grafo_1", "n1")) == 1
+    lru.remove(cache, ("grafo_1", "n1"))
+    lru.remove(cache, ("grafo_1", "n9"))
+    assert lru.size(cache) == 1
+
+    lru.clear(cache)
+    assert lru.is_empty(cache)
+    assert cache["hits"] == 0 and cache["misses"] == 0
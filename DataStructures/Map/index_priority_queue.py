@@ -0,0 +1,172 @@
+"""
+Cola de prioridad indexada (heap binario orientado a menor o mayor).
+
+Tiene las mismas funciones y el mismo comportamiento que priority_queue: el
+heap se guarda en las mismas posiciones y swim/sink hacen los mismos
+intercambios. Además mantiene un índice valor → posición en el heap que se
+actualiza en cada intercambio, así contains es O(1) e improve_priority es
+O(log n) en lugar de recorrer todo el heap.
+
+Cada valor puede estar una sola vez en la cola.
+"""
+from DataStructures.Map import pq_entry as pqe
+from DataStructures.List import array_list as al
+from DataStructures.Map.priority_queue import (
+    default_compare_lower_value,
+    default_compare_higher_value,
+)
+
+
+def new_heap(is_min_pq=True):
+    """
+    Crea una cola de prioridad indexada vacía, orientada a menor (por defecto)
+    o a mayor.
+    """
+    elements = al.new_list()
+    elements = al.add_last(elements, None)
+
+    if is_min_pq:
+        cmp_function = default_compare_lower_value
+    else:
+        cmp_function = default_compare_higher_value
+
+    my_heap = {
+        "elements": elements,
+        "size": 0,
+        "cmp_function": cmp_function,
+        "index": {}
+    }
+
+    return my_heap
+
+
+def exchange(my_heap, pos1, pos2):
+    """
+    Intercambia los elementos en las posiciones pos1 y pos2 dentro del heap
+    y actualiza sus posiciones en el índice.
+    """
+    elements = my_heap["elements"]["elements"]
+    index = my_heap["index"]
+    elements[pos1], elements[pos2] = elements[pos2], elements[pos1]
+    index[elements[pos1]["value"]] = pos1
+    index[elements[pos2]["value"]] = pos2
+
+
+def size(my_heap):
+    return my_heap["size"]
+
+
+def is_empty(my_heap):
+    return size(my_heap) == 0
+
+
+def swim(my_heap, pos):
+    """Sube el elemento en la posición 'pos' hasta su lugar correcto"""
+    elements = my_heap["elements"]["elements"]
+    cmp_function = my_heap["cmp_function"]
+
+    while pos > 1 and not cmp_function(elements[pos // 2], elements[pos]):
+        exchange(my_heap, pos // 2, pos)
+        pos = pos // 2
+
+    return my_heap
+
+
+def sink(my_heap, pos):
+    """Baja el elemento en la posición 'pos' hasta su lugar correcto"""
+    elements = my_heap["elements"]["elements"]
+    cmp_function = my_heap["cmp_function"]
+    size = my_heap["size"]
+
+    while 2 * pos <= size:
+        j = 2 * pos
+
+        # Elegir el mejor hijo según min/max heap
+        if j < size and not cmp_function(elements[j], elements[j + 1]):
+            j += 1
+
+        # Si el padre ya tiene mayor prioridad que el hijo, parar
+        if cmp_function(elements[pos], elements[j]):
+            break
+
+        exchange(my_heap, pos, j)
+        pos = j
+
+    return my_heap
+
+
+def insert(my_heap, priority, value):
+    """
+    Agrega value con la prioridad dada.
+    Lanza una excepción si value ya está en la cola.
+    """
+    if value in my_heap["index"]:
+        raise Exception("El valor ya está en la cola de prioridad")
+
+    new = pqe.new_pq_entry(priority, value)
+    my_heap["elements"]["elements"].append(new)
+    my_heap["elements"]["size"] += 1
+    my_heap["size"] += 1
+    my_heap["index"][value] = my_heap["size"]
+    swim(my_heap, my_heap["size"])
+    return my_heap
+
+
+def remove(my_heap):
+    """Elimina y retorna el valor con mayor prioridad"""
+    if is_empty(my_heap):
+        return None
+
+    elements = my_heap["elements"]["elements"]
+    root = elements[1]["value"]
+    del my_heap["index"][root]
+
+    # Mover el último al primer lugar
+    last = elements.pop()
+    my_heap["size"] -= 1
+    my_heap["elements"]["size"] -= 1
+
+    if my_heap["size"] > 0:
+        elements[1] = last
+        my_heap["index"][last["value"]] = 1
+        sink(my_heap, 1)
+
+    return root
+
+
+def get_first_priority(my_heap):
+    """Retorna el valor con mayor prioridad sin eliminarlo"""
+    if is_empty(my_heap):
+        return None
+    return my_heap["elements"]["elements"][1]["value"]
+
+
+def is_present_value(my_heap, value):
+    """Retorna la posición de value en el heap, o -1 si no está"""
+    return my_heap["index"].get(value, -1)
+
+
+def contains(my_heap, value):
+    """Retorna True si el valor existe en el heap"""
+    return value in my_heap["index"]
+
+
+def improve_priority(my_heap, priority, value):
+    """
+    Mejora la prioridad de un valor existente si la nueva prioridad es mejor.
+    """
+    pos = is_present_value(my_heap, value)
+    if pos == -1:
+        return my_heap
+
+    entry = my_heap["elements"]["elements"][pos]
+
+    temp = pqe.new_pq_entry(priority, value)
+
+    # Si la nueva prioridad no es mejor, no hacer nada
+    if my_heap["cmp_function"](entry, temp):
+        return my_heap
+
+    pqe.set_priority(entry, priority)
+    swim(my_heap, pos)
+    return my_heap
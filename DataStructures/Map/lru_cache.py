@@ -0,0 +1,101 @@
+"""
+Cache LRU (least recently used) de capacidad fija.
+
+Guarda pares llave → valor en el orden de su último uso. Cuando se agrega
+una llave nueva y el cache está lleno, se descarta la llave usada hace más
+tiempo. get y put son O(1).
+
+Las llaves deben ser hashables (por ejemplo tuplas).
+"""
+from collections import OrderedDict
+
+
+def new_lru_cache(capacity):
+    """
+    Crea un cache LRU vacío que guarda a lo más capacity valores.
+
+    Se crea un cache con los siguientes atributos:
+
+    - **entries**: Pares llave → valor, del menos al más recientemente usado.
+    - **capacity**: Número máximo de valores.
+    - **hits**: Número de consultas (get) que encontraron la llave.
+    - **misses**: Número de consultas (get) que no la encontraron.
+    """
+    if capacity < 1:
+        raise Exception("La capacidad del cache debe ser al menos 1")
+    cache = {
+        "entries": OrderedDict(),
+        "capacity": capacity,
+        "hits": 0,
+        "misses": 0
+    }
+    return cache
+
+
+def size(cache):
+    return len(cache["entries"])
+
+
+def is_empty(cache):
+    return size(cache) == 0
+
+
+def contains(cache, key):
+    """
+    Retorna True si key está en el cache, sin marcarla como usada.
+    """
+    return key in cache["entries"]
+
+
+def get(cache, key):
+    """
+    Retorna el valor de key y la marca como la más recientemente usada, o
+    None si key no está en el cache.
+    """
+    entries = cache["entries"]
+    if key not in entries:
+        cache["misses"] += 1
+        return None
+    cache["hits"] += 1
+    entries.move_to_end(key)
+    return entries[key]
+
+
+def put(cache, key, value):
+    """
+    Guarda value en key como la llave más recientemente usada. Si el cache
+    queda con más valores que su capacidad, descarta el menos usado.
+    """
+    entries = cache["entries"]
+    entries[key] = value
+    entries.move_to_end(key)
+    if len(entries) > cache["capacity"]:
+        entries.popitem(last=False)
+    return cache
+
+
+def remove(cache, key):
+    """
+    Elimina key del cache, si está.
+    """
+    cache["entries"].pop(key, None)
+    return cache
+
+
+def clear(cache):
+    """
+    Vacía el cache y reinicia sus contadores.
+    """
+    cache["entries"].clear()
+    cache["hits"] = 0
+    cache["misses"] = 0
+    return cache
+
+
+def keys(cache):
+    """
+    Retorna una array_list con las llaves, de la menos a la más
+    recientemente usada.
+    """
+    elements = list(cache["entries"])
+    return {"elements": elements, "size": len(elements)}
@@ -77,3 +77,19 @@ def test_size():
 
     queue.dequeue(my_queue)
     assert queue.size(my_queue) == 2
+
+@handle_not_implemented
+def test_fifo_order_large():
+    # Verifica el orden FIFO con muchas operaciones intercaladas
+    my_queue = setup_queue()
+    esperado = 0
+    for i in range(10000):
+        queue.enqueue(my_queue, i)
+        if i % 3 == 0:
+            assert queue.dequeue(my_queue) == esperado
+            esperado += 1
+
+    while not queue.is_empty(my_queue):
+        assert queue.dequeue(my_queue) == esperado
+        esperado += 1
+    assert esperado == 10000
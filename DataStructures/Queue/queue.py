@@ -1,5 +1,16 @@
+from collections import deque
+
+
 def new_queue():
-    return {"size": 0, "elements": []}
+    """Crea una cola vacía.
+
+    Los elementos se guardan en un deque: agregar al final y retirar del
+    inicio toman tiempo constante.
+
+    Returns:
+        dict: La cola vacía.
+    """
+    return {"size": 0, "elements": deque()}
     
     
 def enqueue(my_queue,
@@ -30,7 +41,7 @@ def dequeue(my_queue):
     """
     if is_empty(my_queue):
         raise Exception("EmptyStructureError: queue is empty")
-    element = my_queue["elements"].pop(0)
+    element = my_queue["elements"].popleft()
     my_queue["size"] -= 1
     return element
 
@@ -0,0 +1,86 @@
+import math
+import random
+
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Spatial import grid_index as gi
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat / 2) ** 2 + math.cos(math.radians(lat1)) * \
+        math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2
+    return 2 * 6371 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def setup_points(n, seed):
+    rnd = random.Random(seed)
+    points = []
+    for _ in range(n):
+        points.append((rnd.uniform(45.0, 45.3), rnd.uniform(100.0, 100.4),
+                       rnd.uniform(0, 20 * 3600)))
+    return points
+
+
+@handle_not_implemented
+def test_new_grid_index():
+    grid = gi.new_grid_index(3, 50)
+    assert gi.size(grid) == 0
+    assert grid["time_window"] is None
+    assert grid["lat_deg"] > 0
+    assert grid["lon_deg"] >= grid["lat_deg"]
+    assert abs(grid["lon_cells"] * grid["lon_deg"] - 360) < 1e-9
+
+
+@handle_not_implemented
+def test_insert():
+    grid = gi.new_grid_index(3, 50, 3600)
+    gi.insert(grid, 45.0, 100.0, 0, "A")
+    gi.insert(grid, 45.0, 100.0, 10, "B")
+    assert gi.size(grid) == 2
+    assert gi.candidates(grid, 45.0, 100.0, 5) == ["A", "B"]
+
+
+@handle_not_implemented
+def test_candidates_cover_neighbors():
+    points = setup_points(400, 3)
+    grid = gi.new_grid_index(3, 45.3, 3 * 3600)
+    for idx, (lat, lon, t) in enumerate(points):
+        gi.insert(grid, lat, lon, t, idx)
+
+    for lat, lon, t in setup_points(200, 4):
+        found = gi.candidates(grid, lat, lon, t)
+        assert found == sorted(found)
+        for idx, (plat, plon, pt) in enumerate(points):
+            if haversine(plat, plon, lat, lon) <= 3 and abs(pt - t) <= 3 * 3600:
+                assert idx in found
+
+
+@handle_not_implemented
+def test_candidates_wrap_longitude():
+    grid = gi.new_grid_index(3, 10)
+    gi.insert(grid, 0.0, 179.99, None, 1)
+    assert gi.candidates(grid, 0.0, -179.99) == [1]
+    assert gi.candidates(grid, 0.0, 0.0) == []
+
+
+@handle_not_implemented
+def test_candidates_within_cover_radius():
+    rnd = random.Random(11)
+    points = [(rnd.uniform(40.0, 60.0), rnd.uniform(90.0, 130.0)) for _ in range(3000)]
+    points += [(rnd.uniform(85.0, 90.0), rnd.uniform(-180.0, 180.0)) for _ in range(200)]
+    points += [(rnd.uniform(-10.0, 10.0), rnd.uniform(175.0, 180.0)) for _ in range(200)]
+    points += [(rnd.uniform(-10.0, 10.0), rnd.uniform(-180.0, -175.0)) for _ in range(200)]
+    grid = gi.new_grid_index(10, 60)
+    for idx, (lat, lon) in enumerate(points):
+        gi.insert(grid, lat, lon, None, idx)
+
+    queries = [(50.0, 110.0, 0.0), (50.0, 110.0, 25.0), (45.0, 100.0, 300.0),
+               (59.9, 129.9, 80.0), (88.0, 0.0, 400.0), (0.0, 179.9, 150.0),
+               (0.0, -179.9, 150.0), (50.0, 110.0, 30000.0)]
+    for lat, lon, radius in queries:
+        found = gi.candidates_within(grid, lat, lon, radius)
+        assert found == sorted(found)
+        inside = [idx for idx, (a, b) in enumerate(points)
+                  if haversine(a, b, lat, lon) <= radius]
+        assert set(inside) <= set(found)
@@ -0,0 +1,61 @@
+import math
+import random
+from array import array
+
+import pytest
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Spatial import haversine as hv
+
+
+def setup_points(n, seed):
+    rnd = random.Random(seed)
+    lats = [rnd.uniform(-90, 90) for _ in range(n)]
+    lons = [rnd.uniform(-180, 180) for _ in range(n)]
+    # puntos repetidos, cercanos y antipodas
+    lats += [10.0, 10.0, 10.0000001, -10.0, 90.0, -90.0]
+    lons += [20.0, 20.0, 20.0000001, -160.0, 0.0, 0.0]
+    return lats, lons
+
+
+@handle_not_implemented
+def test_haversine_scalar():
+    assert hv.haversine(10, 20, 10, 20) == 0
+    assert abs(hv.haversine(0, 0, 0, 1) - 2 * math.pi * 6371 / 360) < 1e-9
+    assert abs(hv.haversine(10, 20, -10, -160) - math.pi * 6371) < 1e-3
+
+
+@handle_not_implemented
+def test_one_to_many_python_parity():
+    lats, lons = setup_points(500, 1)
+    for lat, lon in [(10.0, 20.0), (45.5, 105.2), (-89.9, 179.9)]:
+        result = hv.one_to_many(lat, lon, lats, lons, use_numpy=False)
+        expected = [hv.haversine(lats[i], lons[i], lat, lon) for i in range(len(lats))]
+        # Python puro da exactamente los mismos valores que la version escalar
+        assert result == expected
+
+    assert hv.one_to_many(0, 0, array("d"), array("d"), use_numpy=False) == []
+
+
+@handle_not_implemented
+def test_pairwise_python_parity():
+    lats, lons = setup_points(500, 2)
+    lats2, lons2 = lats[::-1], lons[::-1]
+    result = hv.pairwise(array("d", lats), array("d", lons), lats2, lons2, use_numpy=False)
+    assert result == [hv.haversine(lats[i], lons[i], lats2[i], lons2[i]) for i in range(len(lats))]
+
+    with pytest.raises(ValueError):
+        hv.pairwise([1.0], [1.0], [], [], use_numpy=False)
+
+
+@handle_not_implemented
+def test_numpy_parity():
+    pytest.importorskip("numpy")
+    lats, lons = setup_points(500, 3)
+    result = hv.one_to_many(45.5, 105.2, lats, lons, use_numpy=True)
+    for i in range(len(lats)):
+        assert abs(result[i] - hv.haversine(lats[i], lons[i], 45.5, 105.2)) < 1e-6
+
+    lats2, lons2 = lats[::-1], lons[::-1]
+    result = hv.pairwise(lats, lons, lats2, lons2, use_numpy=True)
+    for i in range(len(lats)):
+        assert abs(result[i] - hv.haversine(lats[i], lons[i], lats2[i], lons2[i])) < 1e-6
@@ -0,0 +1,69 @@
+import math
+import random
+
+from DataStructures.Utils.utils import handle_not_implemented
+from DataStructures.Spatial import kd_tree as kd
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = (math.sin(dlat / 2) ** 2
+         + math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) ** 2)
+    return 6371 * 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+
+
+def linear_nearest(lats, lons, lat, lon):
+    best, best_dist = -1, math.inf
+    for i in range(len(lats)):
+        d = haversine(lats[i], lons[i], lat, lon)
+        if d < best_dist:
+            best, best_dist = i, d
+    return best
+
+
+@handle_not_implemented
+def test_empty_tree():
+    tree = kd.new_kd_tree([], [])
+    assert kd.size(tree) == 0
+    assert kd.nearest(tree, 0, 0, haversine) == -1
+
+
+@handle_not_implemented
+def test_nearest_same_as_linear():
+    rng = random.Random(3)
+    lats = [rng.uniform(40, 55) for _ in range(2000)]
+    lons = [rng.uniform(95, 120) for _ in range(2000)]
+    tree = kd.new_kd_tree(lats, lons)
+
+    assert kd.size(tree) == 2000
+    for _ in range(300):
+        lat = rng.uniform(35, 60)
+        lon = rng.uniform(90, 125)
+        assert kd.nearest(tree, lat, lon, haversine) == linear_nearest(lats, lons, lat, lon)
+
+
+@handle_not_implemented
+def test_nearest_whole_sphere():
+    rng = random.Random(5)
+    lats = [math.degrees(math.asin(rng.uniform(-1, 1))) for _ in range(1000)]
+    lons = [rng.uniform(-180, 180) for _ in range(1000)]
+    tree = kd.new_kd_tree(lats, lons)
+
+    queries = [(90, 0), (-90, 0), (0, 180), (0, -180), (10, 179.999)]
+    queries += [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(200)]
+    for lat, lon in queries:
+        assert kd.nearest(tree, lat, lon, haversine) == linear_nearest(lats, lons, lat, lon)
+
+
+@handle_not_implemented
+def test_ties_keep_first_position():
+    # puntos repetidos y puntos simetricos respecto a la consulta
+    lats = [1.0, 2.0, 1.0, 0.0, 1.0] * 10
+    lons = [1.0, 2.0, 1.0, 2.0, 0.0] * 10
+    tree = kd.new_kd_tree(lats, lons)
+
+    assert kd.nearest(tree, 1.0, 1.0, haversine) == 0
+    assert kd.nearest(tree, 0.5, 1.0, haversine) == linear_nearest(lats, lons, 0.5, 1.0)
+    assert kd.nearest(tree, 1.5, 1.5, haversine) == linear_nearest(lats, lons, 1.5, 1.5)
+    assert kd.nearest(tree, 0.0, 2.0, haversine) == 3
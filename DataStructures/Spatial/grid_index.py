@@ -0,0 +1,198 @@
+import math
+
+EARTH_RADIUS_KM = 6371
+
+
+def new_grid_index(cell_km, max_abs_lat, time_window=None):
+    """
+    Crea un indice de rejilla espacio-temporal.
+
+    La rejilla divide la superficie en celdas de latitud/longitud de al menos
+    ``cell_km`` kilometros de ancho y, si ``time_window`` no es ``None``, divide
+    el tiempo en ventanas de ``time_window`` segundos. Con este tamaño dos puntos
+    a una distancia Haversine menor o igual a ``cell_km`` (y a una diferencia
+    temporal menor o igual a ``time_window``) siempre caen en celdas vecinas.
+
+    El ancho en longitud se calcula con la latitud absoluta maxima
+    ``max_abs_lat`` de los puntos que se van a indexar o consultar, que es donde
+    los meridianos estan mas juntos.
+
+    Se crea un indice con los siguientes atributos:
+
+    - **lat_deg**: Alto de cada celda en grados de latitud.
+    - **lon_deg**: Ancho de cada celda en grados de longitud.
+    - **lon_cells**: Numero de columnas de longitud (la ultima es vecina de la primera).
+    - **time_window**: Largo de cada ventana de tiempo en segundos, o ``None``.
+    - **cells**: Diccionario (celda -> lista de valores en orden de insercion).
+    - **size**: Numero de valores indexados.
+
+    :param cell_km: Ancho minimo de la celda en kilometros
+    :type cell_km: float
+    :param max_abs_lat: Latitud absoluta maxima de los puntos
+    :type max_abs_lat: float
+    :param time_window: Largo de la ventana de tiempo en segundos
+    :type time_window: float
+
+    :returns: Indice de rejilla vacio
+    :rtype: grid_index
+    """
+    ang = cell_km / EARTH_RADIUS_KM
+    # margen relativo para absorber errores de redondeo de Haversine
+    lat_deg = math.degrees(ang) * (1 + 1e-9)
+
+    s = math.sin(ang / 2)
+    c = math.cos(math.radians(min(abs(max_abs_lat), 90.0)))
+    if c <= s:
+        lon_cells = 1
+    else:
+        lon_deg = math.degrees(2 * math.asin(s / c)) * (1 + 1e-9)
+        lon_cells = max(1, int(360 // lon_deg))
+
+    return {
+        "lat_deg": lat_deg,
+        "lon_deg": 360.0 / lon_cells,
+        "lon_cells": lon_cells,
+        "time_window": time_window,
+        "cells": {},
+        "size": 0
+    }
+
+
+def cell_of(grid, lat, lon, t=None):
+    """
+    Retorna la celda (fila, columna[, ventana]) que contiene el punto dado.
+    """
+    i = math.floor(lat / grid["lat_deg"])
+    j = math.floor((lon + 180.0) / grid["lon_deg"]) % grid["lon_cells"]
+    if grid["time_window"] is None:
+        return (i, j)
+    return (i, j, math.floor(t / grid["time_window"]))
+
+
+def insert(grid, lat, lon, t, value):
+    """
+    Agrega ``value`` a la celda del punto (lat, lon, t).
+    Si la rejilla no es temporal, ``t`` se ignora.
+    """
+    key = cell_of(grid, lat, lon, t)
+    bucket = grid["cells"].get(key)
+    if bucket is None:
+        grid["cells"][key] = [value]
+    else:
+        bucket.append(value)
+    grid["size"] += 1
+    return grid
+
+
+def _neighbor_columns(grid, j):
+    n = grid["lon_cells"]
+    if n <= 3:
+        return range(n)
+    return ((j - 1) % n, j, (j + 1) % n)
+
+
+def candidates(grid, lat, lon, t=None):
+    """
+    Retorna una lista con los valores guardados en la celda del punto
+    (lat, lon, t) y en sus celdas vecinas.
+
+    Si los valores se insertaron en orden creciente (por ejemplo, posiciones
+    en una lista), la lista retornada tambien esta ordenada de forma creciente.
+    Esto permite conservar la semantica de "primer candidato que cumple".
+    """
+    key = cell_of(grid, lat, lon, t)
+    cells = grid["cells"]
+    columns = _neighbor_columns(grid, key[1])
+    found = []
+    buckets = 0
+
+    for di in (-1, 0, 1):
+        i = key[0] + di
+        for j in columns:
+            if grid["time_window"] is None:
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    found.extend(bucket)
+                    buckets += 1
+            else:
+                for dk in (-1, 0, 1):
+                    bucket = cells.get((i, j, key[2] + dk))
+                    if bucket is not None:
+                        found.extend(bucket)
+                        buckets += 1
+
+    if buckets > 1:
+        found.sort()
+    return found
+
+
+def candidates_within(grid, lat, lon, radius_km):
+    """
+    Retorna una lista con los valores de todas las celdas que pueden tener
+    puntos a una distancia Haversine menor o igual a ``radius_km`` de
+    (lat, lon). Es un superconjunto: quien consulta debe refinar con la
+    distancia exacta. Solo sirve para rejillas sin ventanas de tiempo.
+
+    Las filas cubren la latitud de la consulta mas o menos el radio. El ancho
+    en longitud del circulo se calcula con la latitud de la consulta (no con
+    la latitud maxima de la rejilla); si el circulo contiene un polo se
+    recorren todas las columnas. Si el rango de celdas es mayor que el numero
+    de celdas ocupadas, se recorren las celdas ocupadas.
+
+    Igual que en candidates, si los valores se insertaron en orden creciente
+    la lista retornada esta ordenada de forma creciente.
+
+    :param grid: Rejilla sin ventanas de tiempo
+    :type grid: grid_index
+    :param lat: Latitud de la consulta
+    :type lat: float
+    :param lon: Longitud de la consulta
+    :type lon: float
+    :param radius_km: Radio de la consulta en kilometros
+    :type radius_km: float
+
+    :returns: Lista de valores candidatos
+    :rtype: list
+    """
+    cells = grid["cells"]
+    n = grid["lon_cells"]
+    ang = radius_km / EARTH_RADIUS_KM * (1 + 1e-9)
+    ang_deg = math.degrees(ang)
+
+    i_min = math.floor((lat - ang_deg) / grid["lat_deg"])
+    i_max = math.floor((lat + ang_deg) / grid["lat_deg"])
+
+    if abs(lat) + ang_deg >= 90.0 or ang >= math.pi / 2:
+        columns = range(n)
+    else:
+        dlon = math.degrees(math.asin(min(1.0, math.sin(ang) / math.cos(math.radians(lat)))))
+        j_min = math.floor((lon - dlon + 180.0) / grid["lon_deg"])
+        j_max = math.floor((lon + dlon + 180.0) / grid["lon_deg"])
+        if j_max - j_min + 1 >= n:
+            columns = range(n)
+        else:
+            columns = [j % n for j in range(j_min, j_max + 1)]
+
+    found = []
+    if (i_max - i_min + 1) * len(columns) > len(cells):
+        # mas celdas por revisar que celdas ocupadas
+        columnas = set(columns)
+        for (i, j), bucket in cells.items():
+            if i_min <= i <= i_max and j in columnas:
+                found.extend(bucket)
+    else:
+        for i in range(i_min, i_max + 1):
+            for j in columns:
+                bucket = cells.get((i, j))
+                if bucket is not None:
+                    found.extend(bucket)
+
+    found.sort()
+    return found
+
+
+def size(grid):
+    """
+    Retorna el numero de valores indexados.
+    """
+    return grid["size"]
@@ -0,0 +1,100 @@
+"""
+Distancia Haversine (en kilometros) entre puntos dados en grados.
+
+Ademas de la version escalar hay dos versiones para muchos puntos a la vez:
+
+- one_to_many: distancia de un punto a cada punto de un arreglo.
+- pairwise: distancia entre los puntos i de dos arreglos del mismo largo.
+
+Si NumPy esta instalado, estas dos funciones trabajan sobre arreglos float64
+y retornan un ndarray; si no, usan Python puro y retornan una lista. Las
+coordenadas pueden ser listas, array('d') o ndarray.
+"""
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+EARTH_RADIUS_KM = 6371
+
+HAS_NUMPY = np is not None
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """
+    Calcula la distancia entre dos puntos usando la fórmula Haversine.
+    """
+    R = EARTH_RADIUS_KM
+    dlat = math.radians(lat2 - lat1)
+    dlon = math.radians(lon2 - lon1)
+    a = math.sin(dlat/2)**2 + math.cos(math.radians(lat1))*math.cos(math.radians(lat2))*math.sin(dlon/2)**2
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+    return R * c
+
+
+def one_to_many(lat, lon, lats, lons, use_numpy=None):
+    """
+    Retorna las distancias haversine(lats[i], lons[i], lat, lon) para cada i.
+
+    :param lat: Latitud del punto
+    :param lon: Longitud del punto
+    :param lats: Latitudes de los demas puntos
+    :param lons: Longitudes de los demas puntos
+    :param use_numpy: Forzar (True) o evitar (False) NumPy; por defecto se usa si esta instalado
+
+    :returns: Distancias en kilometros (ndarray con NumPy, lista sin NumPy)
+    """
+    if _numpy(use_numpy):
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        return _kernel_numpy(lats, lons, np.float64(lat), np.float64(lon))
+
+    radians, sin, cos, sqrt, atan2 = math.radians, math.sin, math.cos, math.sqrt, math.atan2
+    cos_lat = cos(radians(lat))
+    result = []
+    for i in range(len(lats)):
+        dlat = radians(lat - lats[i])
+        dlon = radians(lon - lons[i])
+        a = sin(dlat/2)**2 + cos(radians(lats[i]))*cos_lat*sin(dlon/2)**2
+        result.append(EARTH_RADIUS_KM * (2 * atan2(sqrt(a), sqrt(1-a))))
+    return result
+
+
+def pairwise(lats1, lons1, lats2, lons2, use_numpy=None):
+    """
+    Retorna las distancias haversine(lats1[i], lons1[i], lats2[i], lons2[i])
+    para cada i. Los cuatro arreglos deben tener el mismo largo.
+
+    :param use_numpy: Forzar (True) o evitar (False) NumPy; por defecto se usa si esta instalado
+
+    :returns: Distancias en kilometros (ndarray con NumPy, lista sin NumPy)
+    """
+    if len(lats1) != len(lats2):
+        raise ValueError("Los arreglos deben tener el mismo largo")
+
+    if _numpy(use_numpy):
+        return _kernel_numpy(np.asarray(lats1, dtype=np.float64),
+                             np.asarray(lons1, dtype=np.float64),
+                             np.asarray(lats2, dtype=np.float64),
+                             np.asarray(lons2, dtype=np.float64))
+
+    return [haversine(lats1[i], lons1[i], lats2[i], lons2[i]) for i in range(len(lats1))]
+
+
+def _numpy(use_numpy):
+    if use_numpy is None:
+        return HAS_NUMPY
+    if use_numpy and not HAS_NUMPY:
+        raise ImportError("NumPy no está instalado")
+    return use_numpy
+
+
+def _kernel_numpy(lat1, lon1, lat2, lon2):
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+    a = np.sin(dlat/2)**2 + np.cos(np.radians(lat1))*np.cos(np.radians(lat2))*np.sin(dlon/2)**2
+    # a puede pasar de 1 por redondeo en puntos antipodas
+    a = np.clip(a, 0.0, 1.0)
+    return EARTH_RADIUS_KM * (2 * np.arctan2(np.sqrt(a), np.sqrt(1-a)))
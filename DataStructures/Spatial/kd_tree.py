@@ -0,0 +1,199 @@
+import math
+
+# Numero maximo de puntos en una hoja del arbol
+LEAF_SIZE = 8
+
+# Margen relativo y absoluto (en unidades de cuerda de la esfera unitaria)
+# con el que se descartan ramas: una rama solo se descarta si esta
+# claramente mas lejos que el mejor candidato, asi los errores de redondeo
+# nunca ocultan un empate.
+PRUNE_REL = 1e-9
+PRUNE_ABS = 1e-12
+
+
+def to_unit_vector(lat, lon):
+    """
+    Convierte una latitud/longitud en grados a un punto (x, y, z) sobre la
+    esfera unitaria.
+    """
+    phi = math.radians(lat)
+    lam = math.radians(lon)
+    c = math.cos(phi)
+    return (c * math.cos(lam), c * math.sin(lam), math.sin(phi))
+
+
+def new_kd_tree(lats, lons):
+    """
+    Crea un arbol k-d sobre los puntos (lats[i], lons[i]) convertidos a
+    vectores unitarios en 3D.
+
+    Sobre la esfera, la distancia de cuerda entre dos vectores unitarios crece
+    con la distancia de gran circulo, asi que el vecino mas cercano en 3D es
+    el mismo que el de la formula de Haversine. Cada punto se identifica por
+    su posicion i en las listas recibidas.
+
+    Se crea un arbol con los siguientes atributos:
+
+    - **lat**, **lon**: Coordenadas originales de cada punto.
+    - **coords**: Tres listas (x, y, z) con el vector unitario de cada punto.
+    - **order**: Permutacion de las posiciones; cada nodo del arbol cubre un rango contiguo.
+    - **nodes**: Lista de nodos ``[lo, hi, axis, split, left, right]``. Las hojas tienen ``axis = -1``.
+    - **size**: Numero de puntos.
+
+    :param lats: Latitudes en grados
+    :type lats: list
+    :param lons: Longitudes en grados
+    :type lons: list
+
+    :returns: Arbol k-d
+    :rtype: kd_tree
+    """
+    n = len(lats)
+    xs, ys, zs = [], [], []
+    for i in range(n):
+        x, y, z = to_unit_vector(lats[i], lons[i])
+        xs.append(x)
+        ys.append(y)
+        zs.append(z)
+    coords = (xs, ys, zs)
+
+    tree = {
+        "lat": list(lats),
+        "lon": list(lons),
+        "coords": coords,
+        "order": list(range(n)),
+        "nodes": [],
+        "size": n
+    }
+    if n > 0:
+        _build(tree)
+    return tree
+
+
+def _build(tree):
+    """
+    Construye los nodos del arbol sin recursion: cada rango se parte por la
+    mediana del eje con mayor extension.
+    """
+    coords = tree["coords"]
+    order = tree["order"]
+    nodes = tree["nodes"]
+
+    nodes.append([0, tree["size"], -1, 0.0, -1, -1])
+    pending = [0]
+    while pending:
+        k = pending.pop()
+        lo, hi = nodes[k][0], nodes[k][1]
+        if hi - lo <= LEAF_SIZE:
+            continue
+
+        # eje con mayor extension
+        axis = 0
+        spread = -1.0
+        for a in range(3):
+            values = [coords[a][i] for i in order[lo:hi]]
+            s = max(values) - min(values)
+            if s > spread:
+                axis, spread = a, s
+        if spread <= 0:
+            continue
+
+        column = coords[axis]
+        order[lo:hi] = sorted(order[lo:hi], key=column.__getitem__)
+        mid = (lo + hi) // 2
+
+        left = len(nodes)
+        nodes.append([lo, mid, -1, 0.0, -1, -1])
+        right = len(nodes)
+        nodes.append([mid, hi, -1, 0.0, -1, -1])
+
+        # todos los puntos de la izquierda tienen column <= split y los de
+        # la derecha column >= split
+        nodes[k][2] = axis
+        nodes[k][3] = column[order[mid]]
+        nodes[k][4] = left
+        nodes[k][5] = right
+        pending.append(left)
+        pending.append(right)
+
+
+def size(tree):
+    """
+    Retorna el numero de puntos del arbol.
+    """
+    return tree["size"]
+
+
+def nearest(tree, lat, lon, distance_function):
+    """
+    Retorna la posicion del punto mas cercano a (lat, lon), o -1 si el arbol
+    esta vacio.
+
+    La distancia de cada candidato se calcula con
+    ``distance_function(lat_i, lon_i, lat, lon)`` (por ejemplo Haversine en km)
+    y el resultado es el mismo de un recorrido lineal que se queda con el
+    primer minimo estricto: entre puntos a la misma distancia gana la menor
+    posicion.
+
+    Las ramas se descartan con la distancia de cuerda 3D y un margen
+    conservador (PRUNE_REL, PRUNE_ABS).
+
+    :param tree: Arbol k-d
+    :type tree: kd_tree
+    :param lat: Latitud de la consulta en grados
+    :type lat: float
+    :param lon: Longitud de la consulta en grados
+    :type lon: float
+    :param distance_function: Distancia entre dos puntos (lat1, lon1, lat2, lon2)
+    :type distance_function: function
+
+    :returns: Posicion del punto mas cercano
+    :rtype: int
+    """
+    if tree["size"] == 0:
+        return -1
+
+    q = to_unit_vector(lat, lon)
+    coords = tree["coords"]
+    order = tree["order"]
+    nodes = tree["nodes"]
+    lats = tree["lat"]
+    lons = tree["lon"]
+
+    best = -1
+    best_dist = math.inf
+    # cuerda equivalente a best_dist (radio de busqueda en 3D)
+    best_chord = math.inf
+
+    pending = [(0, 0.0)]
+    while pending:
+        k, bound = pending.pop()
+        if bound > best_chord * (1 + PRUNE_REL) + PRUNE_ABS:
+            continue
+
+        lo, hi, axis, split, left, right = nodes[k]
+        if axis == -1:
+            for i in order[lo:hi]:
+                d = distance_function(lats[i], lons[i], lat, lon)
+                if d < best_dist or (d == best_dist and i < best):
+                    best, best_dist = i, d
+                    best_chord = _chord(coords, i, q)
+            continue
+
+        diff = q[axis] - split
+        if diff <= 0:
+            near, far = left, right
+        else:
+            near, far = right, left
+        # la rama lejana se revisa despues (queda debajo en la pila)
+        pending.append((far, max(bound, abs(diff))))
+        pending.append((near, bound))
+
+    return best
+
+
+def _chord(coords, i, q):
+    dx = coords[0][i] - q[0]
+    dy = coords[1][i] - q[1]
+    dz = coords[2][i] - q[2]
+    return math.sqrt(dx * dx + dy * dy + dz * dz)
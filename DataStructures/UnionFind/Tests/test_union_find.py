@@ -0,0 +1,66 @@
+import random
+
+import pytest
+from DataStructures.UnionFind import union_find as uf
+from DataStructures.Utils.utils import handle_not_implemented
+
+
+@handle_not_implemented
+def test_new_union_find():
+    sets = uf.new_union_find(5)
+    assert uf.size(sets) == 5
+    assert uf.count(sets) == 5
+    for i in range(5):
+        assert uf.find(sets, i) == i
+        assert uf.set_size(sets, i) == 1
+    assert not uf.connected(sets, 0, 1)
+
+
+@handle_not_implemented
+def test_union_and_connected():
+    sets = uf.new_union_find(6)
+    assert uf.union(sets, 0, 1)
+    assert uf.union(sets, 2, 3)
+    assert uf.union(sets, 1, 3)
+    assert not uf.union(sets, 0, 2)
+    assert uf.count(sets) == 3
+    assert uf.connected(sets, 0, 3)
+    assert not uf.connected(sets, 0, 4)
+    assert uf.set_size(sets, 2) == 4
+    assert uf.set_size(sets, 5) == 1
+
+
+@handle_not_implemented
+def test_same_sets_as_naive_labels():
+    rng = random.Random(3)
+    n = 300
+    sets = uf.new_union_find(n)
+    labels = list(range(n))
+    for _ in range(250):
+        i, j = rng.randrange(n), rng.randrange(n)
+        uf.union(sets, i, j)
+        old, new = labels[j], labels[i]
+        labels = [new if x == old else x for x in labels]
+    for _ in range(2000):
+        i, j = rng.randrange(n), rng.randrange(n)
+        assert uf.connected(sets, i, j) == (labels[i] == labels[j])
+    assert uf.count(sets) == len(set(labels))
+
+
+@handle_not_implemented
+def test_path_compression_and_components():
+    n = 100000
+    sets = uf.new_union_find(n)
+    for i in range(1, n):
+        uf.union(sets, i - 1, i)
+    assert uf.count(sets) == 1
+    root = uf.find(sets, n - 1)
+    assert sets["parent"][n - 1] == root
+
+    sets = uf.new_union_find(6)
+    uf.union(sets, 4, 1)
+    uf.union(sets, 2, 0)
+    result = uf.components(sets)
+    assert list(result["component"]) == [0, 1, 0, 2, 1, 3]
+    assert list(result["sizes"]) == [2, 2, 1, 1]
+    assert result["count"] == 4
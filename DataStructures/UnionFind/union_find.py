@@ -0,0 +1,122 @@
+"""
+Conjuntos disjuntos (union-find) sobre los elementos 0..n-1.
+
+Cada conjunto es un arbol guardado en un arreglo plano de padres; la raiz
+es el representante del conjunto. find comprime el camino (cada elemento
+recorrido queda apuntando a la raiz) y union cuelga el arbol de menor
+rango del de mayor rango, asi cada operacion cuesta tiempo casi constante
+(inversa de Ackermann).
+"""
+from array import array
+
+
+def new_union_find(n):
+    """
+    Crea una estructura union-find con n elementos, cada uno en su propio
+    conjunto.
+
+    Se crea una estructura con los siguientes atributos:
+
+    - **parent**: Arreglo con el padre de cada elemento (la raiz es su propio padre).
+    - **rank**: Cota de la altura del arbol de cada raiz.
+    - **size**: Numero de elementos del conjunto de cada raiz.
+    - **count**: Numero de conjuntos.
+
+    :param n: Numero de elementos
+    :type n: int
+
+    :returns: Estructura union-find
+    :rtype: union_find
+    """
+    uf = {
+        "parent": array("q", range(n)),
+        "rank": bytearray(n),
+        "size": array("q", [1]) * n,
+        "count": n
+    }
+    return uf
+
+
+def size(uf):
+    """
+    Retorna el numero de elementos.
+    """
+    return len(uf["parent"])
+
+
+def count(uf):
+    """
+    Retorna el numero de conjuntos.
+    """
+    return uf["count"]
+
+
+def find(uf, i):
+    """
+    Retorna el representante del conjunto de i.
+    """
+    parent = uf["parent"]
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    # compresion de caminos
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def union(uf, i, j):
+    """
+    Une los conjuntos de i y j. Retorna True si estaban separados.
+    """
+    a = find(uf, i)
+    b = find(uf, j)
+    if a == b:
+        return False
+
+    rank = uf["rank"]
+    if rank[a] < rank[b]:
+        a, b = b, a
+    uf["parent"][b] = a
+    uf["size"][a] += uf["size"][b]
+    if rank[a] == rank[b]:
+        rank[a] += 1
+    uf["count"] -= 1
+    return True
+
+
+def connected(uf, i, j):
+    """
+    Retorna True si i y j estan en el mismo conjunto.
+    """
+    return find(uf, i) == find(uf, j)
+
+
+def set_size(uf, i):
+    """
+    Retorna el numero de elementos del conjunto de i.
+    """
+    return uf["size"][find(uf, i)]
+
+
+def components(uf):
+    """
+    Retorna los conjuntos como componentes numerados 0..k-1 en el orden en
+    que aparece su primer elemento, con la misma forma que
+    components.connected_components del paquete Graph:
+
+    - **component**: Arreglo con el componente de cada elemento.
+    - **count**: Numero de componentes.
+    - **sizes**: Arreglo con el numero de elementos de cada componente.
+    """
+    n = size(uf)
+    label = array("q", [-1]) * n
+    component = array("q", bytes(8 * n))
+    sizes = array("q")
+    for i in range(n):
+        root = find(uf, i)
+        if label[root] == -1:
+            label[root] = len(sizes)
+            sizes.append(uf["size"][root])
+        component[i] = label[root]
+    return {"component": component, "count": len(sizes), "sizes": sizes}